@@ -0,0 +1,180 @@
+"""Request-scoped batching loaders for PostgREST row lookups.
+
+Services ask ``current_loaders().rows(table, column, ...)`` for a loader and
+``await loader.load(key)``. Keys requested by coroutines that run in the same
+event-loop tick are coalesced into one ``in_()`` query per
+(table, column, filters), read in ``.range()`` pages so PostgREST's
+``max_rows`` cap never truncates a chunk, and repeated keys are answered from
+the request's cache. The registry lives in a context variable that
+``loader_scope()`` sets for one HTTP request (see ``app.main``) or one service
+call.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from app.core import supabase
+
+# Keeps the encoded ``in.(...)`` filter well below common URL length limits.
+IN_QUERY_CHUNK_SIZE = 150
+# PostgREST caps each response at ``max_rows`` (1000 on Supabase) without signalling truncation.
+PAGE_SIZE = 1000
+# Offset pages need a total order; tables without an ``id`` column are ordered by their primary key.
+_PRIMARY_KEYS = {
+    "component_ability_concepts": ("rule_set_id", "ability_id", "concept_id"),
+    "component_ability_rule_nodes": ("rule_set_id", "ability_id", "rule_id"),
+    "component_concepts": ("rule_set_id", "component_id", "concept_id", "reference_kind"),
+    "component_rule_nodes": ("rule_set_id", "component_id", "rule_id", "reference_kind"),
+    "game_concepts": ("game_id", "concept_id", "usage_role"),
+    "rule_node_concepts": ("rule_set_id", "rule_id", "concept_id", "reference_kind"),
+}
+
+
+class RowLoader:
+    """Loads every row whose ``column`` equals a key, batching keys per tick."""
+
+    def __init__(
+        self,
+        table: str,
+        column: str,
+        *,
+        select: str = "*",
+        filters: tuple[tuple[str, Any], ...] = (),
+        order: str | None = None,
+    ):
+        self.table = table
+        self.column = column
+        self.select = select
+        self.filters = filters
+        self.order = order
+        self.round_trips = 0
+        self._results: dict[str, asyncio.Future] = {}
+        self._pending: list[str] = []
+        self._dispatch: asyncio.Task | None = None
+
+    async def load(self, key: Hashable) -> list[dict[str, Any]]:
+        return await self._future(str(key))
+
+    async def load_one(self, key: Hashable) -> dict[str, Any] | None:
+        rows = await self.load(key)
+        return rows[0] if rows else None
+
+    async def load_many(self, keys: Iterable[Hashable]) -> list[list[dict[str, Any]]]:
+        return list(await asyncio.gather(*(self._future(str(key)) for key in keys)))
+
+    def _future(self, key: str) -> asyncio.Future:
+        future = self._results.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._results[key] = future
+        self._pending.append(key)
+        if self._dispatch is None:
+            self._dispatch = loop.create_task(self._run_batch())
+        return future
+
+    async def _run_batch(self) -> None:
+        # One yield lets sibling coroutines scheduled in this tick enqueue their keys.
+        await asyncio.sleep(0)
+        keys, self._pending = self._pending, []
+        self._dispatch = None
+        try:
+            grouped = await self._fetch(keys)
+        except Exception as exc:
+            for key in keys:
+                future = self._results.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key in keys:
+            future = self._results[key]
+            if not future.done():
+                future.set_result(grouped.get(key, []))
+
+    async def _fetch(self, keys: list[str]) -> dict[str, list[dict[str, Any]]]:
+        client = supabase._get_async_client()
+        chunks = [keys[start : start + IN_QUERY_CHUNK_SIZE] for start in range(0, len(keys), IN_QUERY_CHUNK_SIZE)]
+        responses = await asyncio.gather(*(self._query(client, chunk) for chunk in chunks))
+        # The key column is added to narrow projections for grouping; hand callers back what they selected.
+        strip_key = self._select_with_key() != self.select
+        grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for rows in responses:
+            for row in rows:
+                key = str(row[self.column])
+                grouped[key].append({k: v for k, v in row.items() if k != self.column} if strip_key else row)
+        return grouped
+
+    async def _query(self, client, keys: list[str]) -> list[dict[str, Any]]:
+        order = [self.column, *([self.order] if self.order else []), *_PRIMARY_KEYS.get(self.table, ("id",))]
+        rows: list[dict[str, Any]] = []
+        while True:
+            query = client.table(self.table).select(self._select_with_key()).in_(self.column, keys)
+            for column, value in self.filters:
+                query = query.eq(column, value)
+            for column in order:
+                query = query.order(column)
+            self.round_trips += 1
+            page = (await query.range(len(rows), len(rows) + PAGE_SIZE - 1).execute()).data
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+
+    def _select_with_key(self) -> str:
+        columns = [column.strip() for column in self.select.split(",")]
+        if "*" in columns or self.column in columns:
+            return self.select
+        return ",".join([self.column, *columns])
+
+
+class LoaderRegistry:
+    """Per-request set of loaders keyed by table, column, filters, and projection."""
+
+    def __init__(self):
+        self._loaders: dict[tuple, RowLoader] = {}
+
+    def rows(
+        self,
+        table: str,
+        column: str,
+        *,
+        select: str = "*",
+        filters: dict[str, Any] | None = None,
+        order: str | None = None,
+    ) -> RowLoader:
+        frozen_filters = tuple(sorted((filters or {}).items()))
+        key = (table, column, select, frozen_filters, order)
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = RowLoader(table, column, select=select, filters=frozen_filters, order=order)
+            self._loaders[key] = loader
+        return loader
+
+    def round_trips(self) -> int:
+        return sum(loader.round_trips for loader in self._loaders.values())
+
+
+_current_registry: ContextVar[LoaderRegistry | None] = ContextVar("request_loaders", default=None)
+
+
+@contextmanager
+def loader_scope() -> Iterator[LoaderRegistry]:
+    """Bind a registry for the enclosed work; nested scopes share the outer one."""
+    registry = _current_registry.get()
+    if registry is not None:
+        yield registry
+        return
+    token = _current_registry.set(LoaderRegistry())
+    try:
+        yield _current_registry.get()
+    finally:
+        _current_registry.reset(token)
+
+
+def current_loaders() -> LoaderRegistry:
+    """Return the bound registry, or an unshared one when called outside any scope."""
+    return _current_registry.get() or LoaderRegistry()
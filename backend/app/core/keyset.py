@@ -0,0 +1,95 @@
+"""Opaque keyset cursors and the seek predicates that resume an ordered listing.
+
+A listing is ordered by ``SeekKey`` columns, the last of which must be unique
+and non-null (normally ``id``). The cursor stores the last row's values for those
+keys; the next page is every row strictly after that tuple, so the database seeks
+through an index instead of walking ``OFFSET`` rows.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+_RESERVED_FILTER_CHARS = set(',()."\\: ')
+
+
+class CursorError(ValueError):
+    """Raised for cursors that are malformed or were issued for a different listing."""
+
+
+class SeekKey(NamedTuple):
+    column: str
+    desc: bool = False
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    payload = json.dumps({"s": scope, "v": list(values)}, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, scope: str, width: int) -> list[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise CursorError("invalid cursor") from exc
+    if not isinstance(payload, dict) or payload.get("s") != scope:
+        raise CursorError("cursor does not belong to this listing")
+    values = payload.get("v")
+    if not isinstance(values, list) or len(values) != width or values[-1] is None:
+        raise CursorError("invalid cursor")
+    return values
+
+
+def _filter_value(value: Any) -> str:
+    text = "true" if value is True else "false" if value is False else str(value)
+    if any(char in _RESERVED_FILTER_CHARS for char in text):
+        escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return text
+
+
+def postgrest_seek_filter(keys: Sequence[SeekKey], values: Sequence[Any]) -> str:
+    """Return the ``or=(...)`` body selecting rows after ``values`` for ``nullslast`` ordering."""
+    branches: list[str] = []
+    equal: list[str] = []
+    for position, (key, value) in enumerate(zip(keys, values, strict=True)):
+        if value is not None:
+            after = f"{key.column}.{'lt' if key.desc else 'gt'}.{_filter_value(value)}"
+            branches.append(f"and({','.join([*equal, after])})" if equal else after)
+            if position == len(keys) - 1:
+                break
+            # With nulls last, every null sorts after a non-null value in either direction.
+            null_after = f"{key.column}.is.null"
+            branches.append(f"and({','.join([*equal, null_after])})" if equal else null_after)
+            equal.append(f"{key.column}.eq.{_filter_value(value)}")
+        else:
+            equal.append(f"{key.column}.is.null")
+    return ",".join(branches)
+
+
+def sqlite_seek_condition(keys: Sequence[SeekKey], values: Sequence[Any]) -> tuple[str, list[Any]]:
+    """Return a WHERE fragment selecting rows after ``values`` under SQLite ordering (NULL sorts lowest)."""
+    branches: list[str] = []
+    params: list[Any] = []
+    equal: list[str] = []
+    equal_params: list[Any] = []
+    for key, value in zip(keys, values, strict=True):
+        expression = key.column
+        if value is None:
+            after, after_params = ("FALSE", []) if key.desc else (f"{expression} IS NOT NULL", [])
+        elif key.desc:
+            after, after_params = f"({expression} < ? OR {expression} IS NULL)", [value]
+        else:
+            after, after_params = f"{expression} > ?", [value]
+        if after != "FALSE":
+            branches.append(" AND ".join([*equal, after]))
+            params.extend([*equal_params, *after_params])
+        if value is None:
+            equal.append(f"{expression} IS NULL")
+        else:
+            equal.append(f"{expression} = ?")
+            equal_params.append(value)
+    return "(" + " OR ".join(f"({branch})" for branch in branches) + ")", params
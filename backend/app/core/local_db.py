@@ -1,21 +1,93 @@
 import json
-import os
 import sqlite3
+import threading
+import unicodedata
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any
+
+from app.core.keyset import SeekKey, sqlite_seek_condition
+from app.core.search_text import BODY_KEY_FIELDS, TITLE_KEY_FIELDS, normalize_lookup, search_keys
 
 DB_PATH = Path("/home/kafka/projects/rule-scribe-games/data/games.db")
 
+# WAL lets readers proceed while a writer commits; NORMAL sync is durable across app crashes in WAL mode.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+_GAME_COLUMNS = frozenset(
+    {
+        "id", "slug", "title", "title_ja", "summary", "description", "rules_content",
+        "min_players", "max_players", "play_time", "min_age", "published_year", "image_url",
+        "strategy_tier", "structured_data", "infographics", "bga_url", "view_count", "created_at", "updated_at",
+    }
+)
+_INDEXES = (
+    ("idx_games_play_time", "play_time"),
+    ("idx_games_players", "min_players, max_players"),
+    ("idx_games_max_players", "max_players"),
+    ("idx_games_strategy_tier", "strategy_tier"),
+    ("idx_games_published_year", "published_year"),
+    ("idx_games_created_at", "created_at"),
+)
+# FTS5's trigram tokenizer (SQLite 3.34+) answers substring MATCH for queries of three or more characters.
+_TRIGRAM = sqlite3.sqlite_version_info >= (3, 34, 0)
+_TRIGRAM_MIN_QUERY = 3
+_connections = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready: set[Path] = set()
+
 
-def get_db():
-    os.makedirs(DB_PATH.parent, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+def _connection() -> sqlite3.Connection:
+    """Return this thread's connection to DB_PATH, opening and tuning it on first use."""
+    by_path = getattr(_connections, "by_path", None)
+    if by_path is None:
+        by_path = _connections.by_path = {}
+    conn = by_path.get(DB_PATH)
+    if conn is None:
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        conn.create_function("nfkc_casefold", 1, _nfkc_casefold, deterministic=True)
+        by_path[DB_PATH] = conn
     return conn
 
 
+def _nfkc_casefold(value: str | None) -> str:
+    return unicodedata.normalize("NFKC", value or "").casefold().strip()
+
+
+def get_db() -> sqlite3.Connection:
+    """Return the cached connection for the calling thread. Callers must not close it."""
+    init_db()
+    return _connection()
+
+
+def close_db():
+    """Close the calling thread's cached connections (shutdown and tests)."""
+    by_path = getattr(_connections, "by_path", None) or {}
+    for conn in by_path.values():
+        conn.close()
+    by_path.clear()
+
+
 def init_db():
-    conn = get_db()
+    """Create or migrate the schema once per process; later calls return immediately."""
+    if DB_PATH in _schema_ready:
+        return
+    with _schema_lock:
+        if DB_PATH in _schema_ready:
+            return
+        _create_schema(_connection())
+        _schema_ready.add(DB_PATH)
+
+
+def _create_schema(conn: sqlite3.Connection):
     cursor = conn.cursor()
 
     # Mirroring Supabase games schema
@@ -48,33 +120,43 @@ def init_db():
     if "bga_url" not in columns:
         cursor.execute("ALTER TABLE games ADD COLUMN bga_url TEXT")
 
-    conn.commit()
-    conn.close()
+    # Directory filters and sorts (see services.directory_query) are answered from these indexes.
+    for name, columns in _INDEXES:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON games({columns})")
 
+    # Search keys are normalized once on write; rowid matches games.rowid.
+    if _TRIGRAM:
+        cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS game_search USING fts5(
+            title_keys, body, sort_title UNINDEXED, tokenize='trigram'
+        )
+        """)
+    else:
+        cursor.execute("CREATE TABLE IF NOT EXISTS game_search (title_keys TEXT, body TEXT, sort_title TEXT)")
+    indexed = cursor.execute("SELECT COUNT(*) FROM game_search").fetchone()[0]
+    if indexed != cursor.execute("SELECT COUNT(*) FROM games").fetchone()[0]:
+        cursor.execute("DELETE FROM game_search")
+        for row in cursor.execute("SELECT rowid, * FROM games").fetchall():
+            _index_search_row(conn, row)
 
-def upsert_game(game_data: Dict[str, Any]):
-    conn = get_db()
-    cursor = conn.cursor()
+    conn.commit()
 
-    # Extract structured_data and infographics as JSON strings
-    sd = game_data.get("structured_data", {})
-    if isinstance(sd, dict):
-        sd = json.dumps(sd, ensure_ascii=False)
 
-    info = game_data.get("infographics")
-    if isinstance(info, dict):
-        info = json.dumps(info, ensure_ascii=False)
+def _index_search_row(conn: sqlite3.Connection, row: sqlite3.Row):
+    game = dict(row)
+    conn.execute("DELETE FROM game_search WHERE rowid = ?", (game["rowid"],))
+    conn.execute(
+        "INSERT INTO game_search (rowid, title_keys, body, sort_title) VALUES (?, ?, ?, ?)",
+        (
+            game["rowid"],
+            "\n".join(search_keys(game, TITLE_KEY_FIELDS)),
+            "\n".join(search_keys(game, BODY_KEY_FIELDS)),
+            str(game.get("title_ja") or game.get("title") or ""),
+        ),
+    )
 
-    fields = [
-        game_data.get("id"), game_data.get("slug"), game_data.get("title"),
-        game_data.get("title_ja"), game_data.get("summary"), game_data.get("description"),
-        game_data.get("rules_content"), game_data.get("min_players"), game_data.get("max_players"),
-        game_data.get("play_time"), game_data.get("min_age"), game_data.get("published_year"),
-        game_data.get("image_url"), game_data.get("strategy_tier"), sd, info,
-        game_data.get("bga_url"), game_data.get("created_at"), game_data.get("updated_at")
-    ]
 
-    cursor.execute("""
+_UPSERT_SQL = """
     INSERT INTO games (
         id, slug, title, title_ja, summary, description, rules_content,
         min_players, max_players, play_time, min_age, published_year,
@@ -97,13 +179,47 @@ def upsert_game(game_data: Dict[str, Any]):
         infographics=excluded.infographics,
         bga_url=excluded.bga_url,
         updated_at=excluded.updated_at
-    """, fields)
+"""
 
-    conn.commit()
-    conn.close()
 
+def upsert_game(game_data: dict[str, Any]):
+    conn = get_db()
+
+    # Extract structured_data and infographics as JSON strings
+    sd = game_data.get("structured_data", {})
+    if isinstance(sd, dict):
+        sd = json.dumps(sd, ensure_ascii=False)
+
+    info = game_data.get("infographics")
+    if isinstance(info, dict):
+        info = json.dumps(info, ensure_ascii=False)
+
+    fields = [
+        game_data.get("id"), game_data.get("slug"), game_data.get("title"),
+        game_data.get("title_ja"), game_data.get("summary"), game_data.get("description"),
+        game_data.get("rules_content"), game_data.get("min_players"), game_data.get("max_players"),
+        game_data.get("play_time"), game_data.get("min_age"), game_data.get("published_year"),
+        game_data.get("image_url"), game_data.get("strategy_tier"), sd, info,
+        game_data.get("bga_url"), game_data.get("created_at"), game_data.get("updated_at")
+    ]
+
+    # The connection is shared by later calls on this thread, so a failed write must not leave a transaction open.
+    with conn:
+        conn.execute(_UPSERT_SQL, fields)
+        stored = conn.execute("SELECT rowid, * FROM games WHERE slug = ?", (game_data.get("slug"),)).fetchone()
+        _index_search_row(conn, stored)
 
-def list_recent(limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+
+def _decode(row: sqlite3.Row) -> dict[str, Any]:
+    g = dict(row)
+    if g.get("structured_data"):
+        g["structured_data"] = json.loads(g["structured_data"])
+    if g.get("infographics"):
+        g["infographics"] = json.loads(g["infographics"])
+    return g
+
+
+def list_recent(limit: int = 100, offset: int = 0) -> dict[str, Any]:
     conn = get_db()
     cursor = conn.cursor()
 
@@ -113,33 +229,128 @@ def list_recent(limit: int = 100, offset: int = 0) -> Dict[str, Any]:
     cursor.execute("SELECT COUNT(*) FROM games")
     total = cursor.fetchone()[0]
 
+    return {"data": [_decode(row) for row in rows], "total": total}
+
+
+def list_games_page(  # noqa: PLR0913 - filters, keyset and paging feed one SELECT
+    conditions: list[str],
+    params: list[Any],
+    keys: Sequence[SeekKey],
+    limit: int,
+    offset: int = 0,
+    *,
+    after: Sequence[Any] | None = None,
+    count: bool = True,
+) -> dict[str, Any]:
+    """Return one filtered page ordered by ``keys``; only the page's rows are JSON-decoded.
+
+    ``conditions`` and key columns are SQL fragments owned by the caller; values go in ``params``.
+    ``after`` resumes behind a previous page's ``last_key`` instead of skipping ``offset`` rows.
+    ``total`` is the filtered ``COUNT(*)``, or None when ``count`` is false.
+    """
+    conn = get_db()
+    filtered = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    where, where_params = filtered, list(params)
+    if after is not None:
+        seek, seek_params = sqlite_seek_condition(keys, after)
+        where = f" WHERE {' AND '.join([*conditions, seek])}"
+        where_params.extend(seek_params)
+        offset = 0
+    order_by = ", ".join(f"{key.column} {'DESC' if key.desc else 'ASC'}" for key in keys)
+    key_columns = "".join(f", {key.column} AS _seek_{index}" for index, key in enumerate(keys))
+    rows = conn.execute(
+        f"SELECT *{key_columns} FROM games{where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+        [*where_params, limit, offset],
+    ).fetchall()
+    total = conn.execute(f"SELECT COUNT(*) FROM games{filtered}", params).fetchone()[0] if count else None
     games = []
+    last_key = None
     for row in rows:
-        g = dict(row)
-        if g.get("structured_data"):
-            g["structured_data"] = json.loads(g["structured_data"])
-        if g.get("infographics"):
-            g["infographics"] = json.loads(g["infographics"])
-        games.append(g)
+        game = _decode(row)
+        last_key = [game.pop(f"_seek_{index}") for index in range(len(keys))]
+        games.append(game)
+    return {"data": games, "total": total, "last_key": last_key}
+
+
+# Rank tiers mirror supabase._search_rank: exact title key, title key prefix, title key substring, body only.
+_SEARCH_RANK_SQL = """
+CASE
+    WHEN instr(char(10) || s.title_keys || char(10), char(10) || :q || char(10)) > 0 THEN 0
+    WHEN instr(char(10) || s.title_keys, char(10) || :q) > 0 THEN 1
+    WHEN instr(s.title_keys, :q) > 0 THEN 2
+    ELSE 3
+END
+"""
+
+
+def _search_rows(query: str, select: str) -> list[sqlite3.Row]:
+    q = normalize_lookup(query)
+    if _TRIGRAM and len(q) >= _TRIGRAM_MIN_QUERY:
+        match = "game_search MATCH :phrase"
+    else:
+        match = "(instr(s.title_keys, :q) > 0 OR instr(s.body, :q) > 0)"
+    return get_db().execute(
+        f"""
+        SELECT {select}, {_SEARCH_RANK_SQL} AS search_rank
+        FROM game_search AS s JOIN games AS g ON g.rowid = s.rowid
+        WHERE {match}
+        ORDER BY search_rank, s.sort_title, g.updated_at DESC
+        """,
+        {"q": q, "phrase": '"' + q.replace('"', '""') + '"'},
+    ).fetchall()
+
+
+def search_games(query: str) -> list[dict[str, Any]]:
+    """Return games whose normalized slug/title/summary/description contain the query, best rank first."""
+    games = []
+    for row in _search_rows(query, "g.*"):
+        game = _decode(row)
+        game.pop("search_rank")
+        games.append(game)
+    return games
+
 
-    conn.close()
-    return {"data": games, "total": total}
+def search_candidates(query: str, columns: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Like ``search_games`` but reads only ``columns`` and skips JSON decoding (missing columns are None)."""
+    rows = []
+    for row in _search_rows(query, _projection_select(columns)):
+        candidate = dict(row)
+        candidate.pop("search_rank")
+        rows.append(candidate)
+    return rows
+
+
+def _projection_select(columns: tuple[str, ...]) -> str:
+    return ", ".join(f"g.{column}" if column in _GAME_COLUMNS else f"NULL AS {column}" for column in columns)
+
+
+def list_projection(columns: tuple[str, ...]) -> list[dict[str, Any]]:
+    return [dict(row) for row in get_db().execute(f"SELECT {_projection_select(columns)} FROM games AS g")]
+
+
+def get_by_ids(ids: list[str]) -> list[dict[str, Any]]:
+    placeholders = ", ".join("?" for _ in ids)
+    return [_decode(row) for row in get_db().execute(f"SELECT * FROM games WHERE id IN ({placeholders})", ids)]
+
+
+def increment_view_counts(deltas: dict[str, int]):
+    """Add each game's accumulated views in one transaction; unknown ids are ignored."""
+    conn = get_db()
+    with conn:
+        conn.executemany(
+            "UPDATE games SET view_count = COALESCE(view_count, 0) + ? WHERE id = ?",
+            [(delta, game_id) for game_id, delta in deltas.items()],
+        )
 
 
-def get_by_slug(slug: str) -> Optional[Dict[str, Any]]:
+def get_by_slug(slug: str) -> dict[str, Any] | None:
     conn = get_db()
     cursor = conn.cursor()
     cursor.execute("SELECT * FROM games WHERE slug = ?", (slug,))
     row = cursor.fetchone()
-    conn.close()
 
     if row:
-        g = dict(row)
-        if g.get("structured_data"):
-            g["structured_data"] = json.loads(g["structured_data"])
-        if g.get("infographics"):
-            g["infographics"] = json.loads(g["infographics"])
-        return g
+        return _decode(row)
     return None
 
 
@@ -0,0 +1,224 @@
+"""Native-async PostgREST client mirroring the supabase-py query-builder chains.
+
+Services await ``.execute()`` on a shared keep-alive ``httpx.AsyncClient``
+instead of hopping through ``anyio.to_thread.run_sync`` and its 40-thread limiter.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+_RESERVED_IN_CHARS = frozenset(',()":')
+
+
+class PostgrestError(RuntimeError):
+    """Raised for non-2xx PostgREST responses; the message keeps the Postgres error code."""
+
+    def __init__(self, status_code: int, payload: dict[str, Any]):
+        self.status_code = status_code
+        self.code = str(payload.get("code") or "")
+        self.payload = payload
+        message = payload.get("message") or payload.get("msg") or "PostgREST request failed"
+        super().__init__(f"{self.code or status_code}: {message}")
+
+
+@dataclass
+class PostgrestResponse:
+    data: Any
+    count: int | None = None
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _format_in_value(value: Any) -> str:
+    text = _format_value(value)
+    if any(char in _RESERVED_IN_CHARS for char in text) or text != text.strip():
+        escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return text
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code < 400:  # noqa: PLR2004
+        return
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = {"message": response.text}
+    raise PostgrestError(response.status_code, payload if isinstance(payload, dict) else {"message": str(payload)})
+
+
+def _parse_count(content_range: str | None) -> int | None:
+    # Content-Range: 0-24/3573 or */0
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+class AsyncQueryBuilder:
+    def __init__(self, http: httpx.AsyncClient, path: str):
+        self._http = http
+        self._path = path
+        self._method = "GET"
+        self._params: list[tuple[str, str]] = []
+        self._order: list[str] = []
+        self._prefer: list[str] = []
+        self._json: Any = None
+
+    def select(self, columns: str = "*", *, count: str | None = None, head: bool = False) -> "AsyncQueryBuilder":
+        # ``head`` asks only for the Content-Range count; no rows are transferred.
+        self._method = "HEAD" if head else "GET"
+        self._params.append(("select", "".join(columns.split())))
+        if count:
+            self._prefer.append(f"count={count}")
+        return self
+
+    def insert(self, payload: dict[str, Any] | list[dict[str, Any]]) -> "AsyncQueryBuilder":
+        self._method = "POST"
+        self._json = payload
+        self._prefer.append("return=representation")
+        return self
+
+    def upsert(
+        self, payload: dict[str, Any] | list[dict[str, Any]], *, on_conflict: str | None = None
+    ) -> "AsyncQueryBuilder":
+        self._method = "POST"
+        self._json = payload
+        self._prefer.extend(["return=representation", "resolution=merge-duplicates"])
+        if on_conflict:
+            self._params.append(("on_conflict", on_conflict))
+        return self
+
+    def update(self, payload: dict[str, Any]) -> "AsyncQueryBuilder":
+        self._method = "PATCH"
+        self._json = payload
+        self._prefer.append("return=representation")
+        return self
+
+    def delete(self) -> "AsyncQueryBuilder":
+        self._method = "DELETE"
+        self._prefer.append("return=representation")
+        return self
+
+    def _filter(self, column: str, operator: str, value: Any) -> "AsyncQueryBuilder":
+        self._params.append((column, f"{operator}.{_format_value(value)}"))
+        return self
+
+    def eq(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "eq", value)
+
+    def neq(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "neq", value)
+
+    def gt(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "gt", value)
+
+    def gte(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "gte", value)
+
+    def lt(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "lt", value)
+
+    def lte(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "lte", value)
+
+    def is_(self, column: str, value: Any) -> "AsyncQueryBuilder":
+        return self._filter(column, "is", value)
+
+    def ilike(self, column: str, pattern: str) -> "AsyncQueryBuilder":
+        return self._filter(column, "ilike", pattern)
+
+    def in_(self, column: str, values: list[Any] | tuple[Any, ...] | set[Any]) -> "AsyncQueryBuilder":
+        joined = ",".join(_format_in_value(value) for value in values)
+        self._params.append((column, f"in.({joined})"))
+        return self
+
+    def or_(self, filters: str) -> "AsyncQueryBuilder":
+        self._params.append(("or", f"({filters})"))
+        return self
+
+    def order(self, column: str, *, desc: bool = False, nullsfirst: bool | None = None) -> "AsyncQueryBuilder":
+        term = f"{column}.{'desc' if desc else 'asc'}"
+        if nullsfirst is not None:
+            term += ".nullsfirst" if nullsfirst else ".nullslast"
+        self._order.append(term)
+        return self
+
+    def limit(self, count: int) -> "AsyncQueryBuilder":
+        self._params.append(("limit", str(count)))
+        return self
+
+    def range(self, start: int, end: int) -> "AsyncQueryBuilder":
+        self._params.extend([("offset", str(start)), ("limit", str(end - start + 1))])
+        return self
+
+    def request_params(self) -> list[tuple[str, str]]:
+        params = list(self._params)
+        if self._order:
+            params.append(("order", ",".join(self._order)))
+        return params
+
+    async def execute(self) -> PostgrestResponse:
+        headers = {"Prefer": ",".join(self._prefer)} if self._prefer else {}
+        response = await self._http.request(
+            self._method,
+            self._path,
+            params=self.request_params(),
+            json=self._json,
+            headers=headers,
+        )
+        _raise_for_status(response)
+        data = response.json() if response.content else []
+        return PostgrestResponse(data=data, count=_parse_count(response.headers.get("content-range")))
+
+
+class AsyncRpcBuilder:
+    def __init__(self, http: httpx.AsyncClient, function: str, params: dict[str, Any]):
+        self._http = http
+        self._function = function
+        self._params = params
+
+    async def execute(self) -> PostgrestResponse:
+        response = await self._http.post(f"/rpc/{self._function}", json=self._params)
+        _raise_for_status(response)
+        return PostgrestResponse(data=response.json() if response.content else None)
+
+
+class AsyncPostgrestClient:
+    def __init__(
+        self,
+        supabase_url: str,
+        key: str,
+        *,
+        limits: httpx.Limits | None = None,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._http = httpx.AsyncClient(
+            base_url=f"{supabase_url.rstrip('/')}/rest/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            limits=limits or httpx.Limits(),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    def table(self, name: str) -> AsyncQueryBuilder:
+        return AsyncQueryBuilder(self._http, f"/{name}")
+
+    def rpc(self, function: str, params: dict[str, Any] | None = None) -> AsyncRpcBuilder:
+        return AsyncRpcBuilder(self._http, function, params or {})
+
+    @property
+    def is_closed(self) -> bool:
+        return self._http.is_closed
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
@@ -0,0 +1,186 @@
+"""Process-resident character n-gram index over rule node statements of every active rule set.
+
+Statements are mostly Japanese, so each normalized statement (see ``search_text``)
+is indexed by character bigrams. A query is split on whitespace into terms; each
+term's bigrams are intersected to get candidates, which are verified by substring
+checks and ranked exact / prefix / substring, then by statement length so the
+most specific rule comes first. Rule sets are the unit of update: replacing one
+re-indexes only its nodes.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.search_text import normalize_lookup
+
+_GRAM = 2
+
+# Question intents shared with the frontend rule helper (``frontend/src/lib/ruleAsk.js``).
+# A node matches an intent by its type or by one of the intent's terms in its statement.
+INTENT_NODE_TYPES: dict[str, frozenset[str]] = {
+    "setup": frozenset({"setup"}),
+    "tie": frozenset(),
+    "end": frozenset({"round_end", "game_end", "victory"}),
+    "score": frozenset({"scoring"}),
+    "limit": frozenset(),
+    "action": frozenset({"turn", "action"}),
+}
+INTENT_TERMS: dict[str, tuple[str, ...]] = {
+    "setup": ("準備", "セットアップ", "配る", "最初に", "setup"),
+    "tie": ("同点", "引き分け", "タイブレーク", "tie"),
+    "end": ("終了", "終わる", "終わり", "ゲームエンド", "勝利条件"),
+    "score": ("得点", "点数", "スコア", "score", "point"),
+    "limit": ("上限", "最大", "まで", "制限", "超え", "以下", "limit", "maximum"),
+    "action": ("手番", "ターン", "アクション", "行動", "turn", "action"),
+}
+_INTENT_KEYS = {intent: tuple(normalize_lookup(term) for term in terms) for intent, terms in INTENT_TERMS.items()}
+
+
+def _grams(key: str) -> set[str]:
+    if len(key) < _GRAM:
+        return {key}
+    return {key[start : start + _GRAM] for start in range(len(key) - _GRAM + 1)}
+
+
+@dataclass(frozen=True)
+class RuleDocument:
+    rule_set_id: str
+    game_id: str
+    rule_id: str
+    node_type: str
+    verification_status: str
+    normalized_statement: str
+    evidence_ref: str | None
+    source_claim_ref: str | None
+    sequence: int | None
+    key: str
+    intents: frozenset[str]
+
+
+def _intents(node_type: str, key: str) -> frozenset[str]:
+    return frozenset(
+        intent
+        for intent in INTENT_TERMS
+        if node_type in INTENT_NODE_TYPES[intent] or any(term in key for term in _INTENT_KEYS[intent])
+    )
+
+
+def _facets(document: RuleDocument) -> list[tuple[str, str]]:
+    facets = [
+        ("node_type", document.node_type),
+        ("game", document.game_id),
+        ("status", document.verification_status),
+    ]
+    return facets + [("intent", intent) for intent in document.intents]
+
+
+class RuleSearchIndex:
+    """Maps statement bigrams to rule documents; not thread-safe, event-loop use only."""
+
+    def __init__(self):
+        self._documents: dict[int, RuleDocument] = {}
+        self._by_rule_set: dict[str, list[int]] = {}
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        # Filter postings keyed by (field, value), so filter-only searches never scan every document.
+        self._facets: dict[tuple[str, str], set[int]] = defaultdict(set)
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def rule_set_ids(self) -> set[str]:
+        return set(self._by_rule_set)
+
+    def replace_rule_set(self, rule_set: dict[str, Any], nodes: Iterable[dict[str, Any]]) -> None:
+        rule_set_id = str(rule_set["id"])
+        self.remove_rule_set(rule_set_id)
+        ids = []
+        for row in nodes:
+            key = normalize_lookup(row.get("normalized_statement"))
+            if not key:
+                continue
+            node_type = str(row["node_type"])
+            document = RuleDocument(
+                rule_set_id=rule_set_id,
+                game_id=str(rule_set["game_id"]),
+                rule_id=str(row["rule_id"]),
+                node_type=node_type,
+                verification_status=str(row.get("verification_status") or "unknown"),
+                normalized_statement=str(row["normalized_statement"]),
+                evidence_ref=row.get("evidence_ref"),
+                source_claim_ref=row.get("source_claim_ref"),
+                sequence=row.get("sequence"),
+                key=key,
+                intents=_intents(node_type, key),
+            )
+            document_id = self._next_id
+            self._next_id += 1
+            self._documents[document_id] = document
+            for gram in _grams(key):
+                self._postings[gram].add(document_id)
+            for facet in _facets(document):
+                self._facets[facet].add(document_id)
+            ids.append(document_id)
+        self._by_rule_set[rule_set_id] = ids
+
+    def remove_rule_set(self, rule_set_id: str) -> None:
+        for document_id in self._by_rule_set.pop(rule_set_id, ()):
+            document = self._documents.pop(document_id)
+            for table, keys in ((self._postings, _grams(document.key)), (self._facets, _facets(document))):
+                for key in keys:
+                    postings = table.get(key)
+                    if postings is not None:
+                        postings.discard(document_id)
+                        if not postings:
+                            del table[key]
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        node_types: Iterable[str] | None = None,
+        game_ids: Iterable[str] | None = None,
+        verification_statuses: Iterable[str] | None = None,
+        intent: str | None = None,
+    ) -> list[RuleDocument]:
+        """Return matching documents, best rank first; an empty query lists every filtered rule."""
+        terms = [key for key in (normalize_lookup(term) for term in query.split()) if key]
+        postings = [self._postings.get(gram, set()) for term in terms if len(term) >= _GRAM for gram in _grams(term)]
+        filters = {
+            "node_type": node_types,
+            "game": game_ids,
+            "status": verification_statuses,
+            "intent": [intent] if intent else None,
+        }
+        for field, values in filters.items():
+            if values:
+                postings.append(set().union(*(self._facets.get((field, value), set()) for value in values)))
+
+        candidates: Iterable[int]
+        if postings:
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:]) if postings[0] else set()
+        else:
+            candidates = self._documents.keys()
+
+        ranked = []
+        for document_id in candidates:
+            document = self._documents[document_id]
+            if not all(term in document.key for term in terms):
+                continue
+            ranked.append((self._rank(document.key, terms), len(document.key), document.sequence or 0, document_id))
+        ranked.sort()
+        return [self._documents[document_id] for *_order, document_id in ranked]
+
+    @staticmethod
+    def _rank(key: str, terms: list[str]) -> int:
+        if not terms:
+            return 0
+        joined = "".join(terms)
+        if key == joined:
+            return 0
+        if key.startswith(terms[0]):
+            return 1
+        return 2
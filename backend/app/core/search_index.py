@@ -0,0 +1,144 @@
+"""Process-resident character n-gram index over game titles, aliases and body text.
+
+Japanese titles have no word boundaries, so keys are indexed by character
+bigrams of their normalized form (see ``search_text``). A query's bigrams are
+intersected to get candidates, which are then verified by substring checks and
+ranked exact / prefix / substring / body-only (summary or description), matching
+``_search_rank`` and the local FTS tiers.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.search_text import BODY_KEY_FIELDS, TITLE_KEY_FIELDS, normalize_lookup, search_keys
+
+_GRAM = 2
+# Compact projection each entry keeps: search keys plus the fields directory filters and sorts read.
+PROJECTION_COLUMNS = (
+    "id",
+    "slug",
+    "title",
+    "title_ja",
+    "title_en",
+    "summary",
+    "min_players",
+    "max_players",
+    "play_time",
+    "strategy_tier",
+    "published_year",
+    "created_at",
+    "updated_at",
+)
+# Columns the index reads: the projection plus body text that is matched but never kept in the projection.
+INDEX_COLUMNS = (*PROJECTION_COLUMNS, "description")
+
+
+def _grams(key: str) -> set[str]:
+    if len(key) < _GRAM:
+        return {key}
+    return {key[start : start + _GRAM] for start in range(len(key) - _GRAM + 1)}
+
+
+@dataclass
+class _Entry:
+    title_keys: set[str] = field(default_factory=set)
+    alias_keys: set[str] = field(default_factory=set)
+    body_keys: set[str] = field(default_factory=set)
+    sort_title: str = ""
+    projection: dict[str, Any] | None = None
+
+    def keys(self) -> set[str]:
+        return self.title_keys | self.alias_keys | self.body_keys
+
+    def rank(self, query: str) -> int | None:
+        titles = self.title_keys | self.alias_keys
+        if query in titles:
+            return 0
+        if any(key.startswith(query) for key in titles):
+            return 1
+        if any(query in key for key in titles):
+            return 2
+        if any(query in key for key in self.body_keys):
+            return 3
+        return None
+
+
+class TitleSearchIndex:
+    """Maps normalized title, alias, summary and description keys to game ids; not thread-safe, event-loop use only."""
+
+    def __init__(self):
+        self._entries: dict[str, _Entry] = {}
+        self._postings: dict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def upsert_game(self, row: dict[str, Any]) -> None:
+        game_id = str(row["id"])
+        entry = self._entries.get(game_id)
+        aliases = entry.alias_keys if entry else set()
+        self._unlink(game_id)
+        self._link(
+            game_id,
+            _Entry(
+                title_keys=set(search_keys(row, TITLE_KEY_FIELDS)),
+                alias_keys=aliases,
+                body_keys=set(search_keys(row, BODY_KEY_FIELDS)),
+                sort_title=str(row.get("title_ja") or row.get("title") or ""),
+                projection={column: row.get(column) for column in PROJECTION_COLUMNS},
+            ),
+        )
+
+    def add_alias(self, game_id: str, *titles: str | None) -> None:
+        # An alias may arrive before its game row; the entry is filled in by the next upsert_game.
+        entry = self._entries.get(str(game_id)) or _Entry()
+        keys = {key for key in (normalize_lookup(title) for title in titles) if key}
+        self._unlink(str(game_id))
+        entry.alias_keys |= keys
+        self._link(str(game_id), entry)
+
+    def projections(self) -> list[dict[str, Any]]:
+        return [entry.projection for entry in self._entries.values() if entry.projection is not None]
+
+    def search_rows(self, query: str) -> list[dict[str, Any]]:
+        """Return the projection rows of matching games in rank order (aliases without a game are skipped)."""
+        rows = (self._entries[game_id].projection for game_id in self.search(query))
+        return [row for row in rows if row is not None]
+
+    def search(self, query: str) -> list[str]:
+        """Return matching game ids, best rank first, then by display title."""
+        q = normalize_lookup(query)
+        if not q:
+            return []
+        if len(q) < _GRAM:
+            candidates = self._entries.keys()
+        else:
+            postings = sorted((self._postings.get(gram, set()) for gram in _grams(q)), key=len)
+            candidates = set.intersection(*postings) if postings[0] else set()
+        ranked = []
+        for game_id in candidates:
+            entry = self._entries[game_id]
+            rank = entry.rank(q)
+            if rank is not None:
+                ranked.append((rank, entry.sort_title, game_id))
+        ranked.sort()
+        return [game_id for _rank, _title, game_id in ranked]
+
+    def _link(self, game_id: str, entry: _Entry) -> None:
+        self._entries[game_id] = entry
+        for key in entry.keys():
+            for gram in _grams(key):
+                self._postings[gram].add(game_id)
+
+    def _unlink(self, game_id: str) -> None:
+        entry = self._entries.pop(game_id, None)
+        if entry is None:
+            return
+        for key in entry.keys():
+            for gram in _grams(key):
+                ids = self._postings.get(gram)
+                if ids is not None:
+                    ids.discard(game_id)
+                    if not ids:
+                        del self._postings[gram]
@@ -0,0 +1,24 @@
+"""Normalization shared by every game search backend.
+
+Search keys are NFKC-normalized, casefolded and stripped of everything that is
+not a word character, so "6 Nimmt!", "６ニムト" style variants and spacing
+differences compare equal.
+"""
+
+import re
+import unicodedata
+from typing import Any
+
+_NON_WORD = re.compile(r"[^\w]+", flags=re.UNICODE)
+# Fields whose normalized form decides exact / prefix / substring rank tiers.
+TITLE_KEY_FIELDS = ("slug", "title", "title_ja", "title_en")
+BODY_KEY_FIELDS = ("summary", "description")
+
+
+def normalize_lookup(value: str | None) -> str:
+    normalized = unicodedata.normalize("NFKC", value or "").casefold().strip()
+    return _NON_WORD.sub("", normalized)
+
+
+def search_keys(game: dict[str, Any], fields: tuple[str, ...]) -> list[str]:
+    return [key for key in (normalize_lookup(str(game[field])) for field in fields if game.get(field)) if key]
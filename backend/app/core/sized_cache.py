@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class SizedLRUCache:
+    """LRU cache bounded by the total byte size its callers report for each entry.
+
+    Entries never expire on their own; callers key them by an immutable version
+    (for example a rule set revision), so a stale entry is simply never looked
+    up again and ages out under LRU pressure. An entry may grow after insertion
+    (``resize``), which evicts older entries as needed. A single entry larger than
+    the whole budget is not retained.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[int, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        self.discard(key)
+        self._entries[key] = (size, value)
+        self._bytes += size
+        self._evict()
+
+    def resize(self, key: Hashable, size: int) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        self._bytes += size - entry[0]
+        self._entries[key] = (size, entry[1])
+        self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            _key, (size, _value) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
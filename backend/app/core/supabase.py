@@ -1,15 +1,77 @@
-import anyio
+import asyncio
 import logging
-import re
-import unicodedata
-from typing import Any, Dict, List, Optional
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
 
 from app.core import local_db
+from app.core.keyset import SeekKey, decode_cursor, encode_cursor, postgrest_seek_filter
+from app.core.postgrest import AsyncPostgrestClient
+from app.core.search_index import INDEX_COLUMNS, PROJECTION_COLUMNS, TitleSearchIndex
+from app.core.search_text import normalize_lookup as _normalize_lookup
 from app.core.settings import settings
+from app.core.ttl_cache import TTLCache
+from app.core.view_counter import ViewCounter
 
 logger = logging.getLogger("core.db_provider")
 _TABLE = "games"
 
+# Every game sub-resource route resolves its slug first; one page view fans out
+# into several resolutions of the same slug within a second. Entries are short
+# lived because other workers may write the same rows; writes through this module
+# invalidate eagerly.
+_GAME_CACHE_TTL_SECONDS = 30.0
+_GAME_CACHE_MAX_ENTRIES = 1024
+_game_cache = TTLCache(max_entries=_GAME_CACHE_MAX_ENTRIES, ttl_seconds=_GAME_CACHE_TTL_SECONDS)
+# Revision columns of rule sets, read by HTTP validators on every rule-set-scoped request.
+_rule_set_version_cache = TTLCache(max_entries=_GAME_CACHE_MAX_ENTRIES, ttl_seconds=_GAME_CACHE_TTL_SECONDS)
+
+# Cloud search ranks ids from a process-resident n-gram index over a compact projection of
+# games and game_title_aliases, refreshed by updated_at/created_at watermark. A periodic
+# full rebuild drops deleted games and aliases; writes through this module update it eagerly.
+_TITLE_INDEX_REFRESH_SECONDS = 30.0
+_TITLE_INDEX_REBUILD_SECONDS = 600.0
+_TITLE_INDEX_PAGE_SIZE = 1000
+# One in_() hydration query stays well below URL length limits; longer id lists are hydrated in chunks.
+_HYDRATE_CHUNK_SIZE = 150
+
+
+def _empty_title_watermarks() -> dict[str, str | None]:
+    return {"games": None, "aliases": None}
+
+
+@dataclass
+class _TitleIndexState:
+    """The process-resident title index with its refresh times and watermarks."""
+
+    index: TitleSearchIndex | None = None
+    built: float = 0.0
+    refreshed: float = 0.0
+    watermarks: dict[str, str | None] = field(default_factory=_empty_title_watermarks)
+    lock: asyncio.Lock | None = None
+    lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def mutex(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self.lock is None or self.lock_loop is not loop:
+            self.lock = asyncio.Lock()
+            self.lock_loop = loop
+        return self.lock
+
+
+_title_index = _TitleIndexState()
+
+# Keyset order for list_recent; totals are counted once per TTL instead of on every page.
+_RECENT_KEYS = (SeekKey("updated_at", desc=True), SeekKey("id"))
+_LIST_TOTAL_TTL_SECONDS = 60.0
+_list_total_cache = TTLCache(max_entries=1, ttl_seconds=_LIST_TOTAL_TTL_SECONDS)
+
+# Sitemaps walk the catalog by slug (unique, indexed) one page at a time.
+_SITEMAP_KEYS = (SeekKey("slug"),)
+_SITEMAP_COLUMNS = ("slug", "updated_at", "image_url")
+
 _client = None
 try:
     from supabase import create_client
@@ -33,12 +95,40 @@ def _get_client():
     return _client
 
 
-def _normalize_lookup(value: str | None) -> str:
-    normalized = unicodedata.normalize("NFKC", value or "").casefold().strip()
-    return re.sub(r"[^\w]+", "", normalized, flags=re.UNICODE)
+# One keep-alive pool per process for request-path reads. The sync supabase-py
+# client above remains for scripts and ingestion that run outside the event loop.
+_ASYNC_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0)
+
 
+@dataclass
+class _AsyncPool:
+    client: AsyncPostgrestClient | None = None
+    loop: asyncio.AbstractEventLoop | None = None
 
-def _search_rank(game: Dict[str, Any], query: str) -> tuple[int, str]:
+
+_async_pool = _AsyncPool()
+
+
+def _get_async_client() -> AsyncPostgrestClient:
+    if is_local() or not settings.supabase_url or not settings.supabase_key:
+        raise RuntimeError("Supabase not configured. Using Local-First.")
+    # Pooled connections are bound to the loop that opened them (scripts may call asyncio.run repeatedly).
+    loop = asyncio.get_running_loop()
+    pool = _async_pool
+    if pool.client is None or pool.client.is_closed or pool.loop is not loop:
+        pool.client = AsyncPostgrestClient(settings.supabase_url, settings.supabase_key, limits=_ASYNC_POOL_LIMITS)
+        pool.loop = loop
+    return pool.client
+
+
+async def close_async_client() -> None:
+    pool = _async_pool
+    if pool.client is not None and not pool.client.is_closed:
+        await pool.client.aclose()
+    pool.client, pool.loop = None, None
+
+
+def _search_rank(game: dict[str, Any], query: str) -> tuple[int, str]:
     q = _normalize_lookup(query)
     candidates = [
         game.get("slug"),
@@ -58,218 +148,358 @@ def _search_rank(game: Dict[str, Any], query: str) -> tuple[int, str]:
     return rank, str(game.get("title_ja") or game.get("title") or "")
 
 
-async def search(query: str) -> List[Dict[str, Any]]:
+async def search(query: str) -> list[dict[str, Any]]:
+    if is_local():
+        return local_db.search_games(query.strip()) if query.strip() else []
+
+    candidates = await search_candidates(query)
+    if candidates is None:
+        return await _search_ilike(_get_async_client(), query.strip())
+    return await get_by_ids([str(row["id"]) for row in candidates])
+
+
+async def search_candidates(query: str) -> list[dict[str, Any]] | None:
+    """Return every matching game's compact projection (``PROJECTION_COLUMNS``), best rank first.
+
+    Returns None when the cloud title index cannot be loaded.
+    """
     query = query.strip()
     if not query:
         return []
 
     if is_local():
-        res = local_db.list_recent(limit=10000)
-        q = _normalize_lookup(query)
-        rows = []
-        for game in res["data"]:
-            haystacks = [
-                game.get("slug"),
-                game.get("title"),
-                game.get("title_ja"),
-                game.get("title_en"),
-                game.get("summary"),
-                game.get("description"),
-            ]
-            if any(q in _normalize_lookup(str(value)) for value in haystacks if value):
-                rows.append(game)
-        return sorted(rows, key=lambda game: _search_rank(game, query))
-
-    def _q():
-        client = _get_client()
-        safe_query = query.replace('"', '\\"')
-        term = f"*{safe_query}*"
-        direct_rows = (
-            client.table(_TABLE)
-            .select("*")
-            .or_(
-                ",".join(
-                    [
-                        f'title.ilike."{term}"',
-                        f'title_ja.ilike."{term}"',
-                        f'title_en.ilike."{term}"',
-                        f'summary.ilike."{term}"',
-                        f'description.ilike."{term}"',
-                    ]
-                )
-            )
-            .limit(100)
-            .execute()
-            .data
-        )
-
-        normalized_query = _normalize_lookup(query)
-        alias_filters = [f'title.ilike."{term}"']
-        if normalized_query:
-            alias_filters.append(f'normalized_title.ilike."*{normalized_query}*"')
-        alias_rows = (
-            client.table("game_title_aliases")
-            .select("game_id")
-            .or_(",".join(alias_filters))
-            .limit(100)
-            .execute()
-            .data
-        )
-        alias_game_ids = list(dict.fromkeys(row["game_id"] for row in alias_rows if row.get("game_id")))
-        alias_games = []
-        if alias_game_ids:
-            alias_games = client.table(_TABLE).select("*").in_("id", alias_game_ids).execute().data
+        return local_db.search_candidates(query, PROJECTION_COLUMNS)
 
-        deduped: dict[str, Dict[str, Any]] = {}
-        for row in [*direct_rows, *alias_games]:
-            row_id = str(row.get("id") or "")
-            if row_id:
-                deduped[row_id] = row
+    try:
+        return (await _fresh_title_index(_get_async_client())).search_rows(query)
+    except Exception as exc:
+        logger.warning("Title search index unavailable; falling back to ilike search: %s", exc)
+        return None
 
-        return sorted(deduped.values(), key=lambda game: _search_rank(game, query))
 
-    return await anyio.to_thread.run_sync(_q)
+async def catalog_projection() -> list[dict[str, Any]]:
+    """Return the compact projection (``PROJECTION_COLUMNS``) of every game."""
+    if is_local():
+        return local_db.list_projection(PROJECTION_COLUMNS)
+    return (await _fresh_title_index(_get_async_client())).projections()
 
 
-async def list_recent(limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+async def get_by_ids(ids: list[str]) -> list[dict[str, Any]]:
+    """Hydrate full rows for ``ids`` in one query, keeping the given order and skipping missing ids."""
+    if not ids:
+        return []
     if is_local():
-        return local_db.list_recent(limit=limit, offset=offset)
-
-    def _q():
-        res = (
-            _get_client()
-            .table(_TABLE)
-            .select("*", count="exact")
-            .order("updated_at", desc=True)
-            .range(offset, offset + limit - 1)
-            .execute()
+        rows = local_db.get_by_ids(ids)
+    else:
+        client = _get_async_client()
+        chunks = [ids[start : start + _HYDRATE_CHUNK_SIZE] for start in range(0, len(ids), _HYDRATE_CHUNK_SIZE)]
+        responses = await asyncio.gather(
+            *(client.table(_TABLE).select("*").in_("id", chunk).execute() for chunk in chunks)
         )
-        return {
-            "data": res.data,
-            "total": res.count,
-        }
+        rows = [row for response in responses for row in response.data]
+    position = {game_id: index for index, game_id in enumerate(ids)}
+    return sorted(
+        (row for row in rows if str(row.get("id")) in position),
+        key=lambda row: position[str(row["id"])],
+    )
+
+
+async def _fresh_title_index(client) -> TitleSearchIndex:
+    state = _title_index
+    if state.index is not None and time.monotonic() - state.refreshed < _TITLE_INDEX_REFRESH_SECONDS:
+        return state.index
+    async with state.mutex():
+        now = time.monotonic()
+        if state.index is not None and now - state.refreshed < _TITLE_INDEX_REFRESH_SECONDS:
+            return state.index
+        rebuild = state.index is None or now - state.built >= _TITLE_INDEX_REBUILD_SECONDS
+        index = TitleSearchIndex() if rebuild else state.index
+        watermarks = _empty_title_watermarks() if rebuild else dict(state.watermarks)
+
+        def games_query():
+            query = client.table(_TABLE).select(",".join(INDEX_COLUMNS))
+            if watermarks["games"]:
+                query = query.gte("updated_at", watermarks["games"])
+            return query.order("updated_at").order("id")
+
+        def aliases_query():
+            query = client.table("game_title_aliases").select("game_id,title,normalized_title,created_at")
+            if watermarks["aliases"]:
+                query = query.gte("created_at", watermarks["aliases"])
+            return query.order("created_at").order("id")
+
+        games, aliases = await asyncio.gather(_read_pages(games_query), _read_pages(aliases_query))
+        for row in games:
+            index.upsert_game(row)
+        for row in aliases:
+            index.add_alias(row["game_id"], row.get("title"), row.get("normalized_title"))
+        # gte re-reads rows stamped exactly at the watermark, so concurrent writes in that instant are not lost.
+        watermarks["games"] = max(
+            (row["updated_at"] for row in games if row.get("updated_at")), default=watermarks["games"]
+        )
+        watermarks["aliases"] = max(
+            (row["created_at"] for row in aliases if row.get("created_at")), default=watermarks["aliases"]
+        )
+        state.index, state.refreshed = index, now
+        state.watermarks.update(watermarks)
+        if rebuild:
+            state.built = now
+        return index
+
+
+async def _read_pages(make_query) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    while True:
+        page = (await make_query().range(len(rows), len(rows) + _TITLE_INDEX_PAGE_SIZE - 1).execute()).data
+        rows.extend(page)
+        if len(page) < _TITLE_INDEX_PAGE_SIZE:
+            return rows
+
+
+def _index_written_game(row: dict[str, Any]) -> None:
+    if _title_index.index is not None and row.get("id"):
+        _title_index.index.upsert_game(row)
+
+
+def reset_title_index() -> None:
+    _title_index.index, _title_index.built, _title_index.refreshed = None, 0.0, 0.0
+    _title_index.watermarks.update(_empty_title_watermarks())
+
+
+async def _search_ilike(client, query: str) -> list[dict[str, Any]]:
+    """Legacy PostgREST ilike search, used only while the title index cannot be loaded."""
+    safe_query = query.replace('"', '\\"')
+    term = f"*{safe_query}*"
+    normalized_query = _normalize_lookup(query)
+    alias_filters = [f'title.ilike."{term}"']
+    if normalized_query:
+        alias_filters.append(f'normalized_title.ilike."*{normalized_query}*"')
+
+    direct_response, alias_response = await asyncio.gather(
+        client.table(_TABLE)
+        .select("*")
+        .or_(
+            ",".join(
+                [
+                    f'title.ilike."{term}"',
+                    f'title_ja.ilike."{term}"',
+                    f'title_en.ilike."{term}"',
+                    f'summary.ilike."{term}"',
+                    f'description.ilike."{term}"',
+                ]
+            )
+        )
+        .limit(100)
+        .execute(),
+        client.table("game_title_aliases").select("game_id").or_(",".join(alias_filters)).limit(100).execute(),
+    )
+    alias_game_ids = list(dict.fromkeys(row["game_id"] for row in alias_response.data if row.get("game_id")))
+    alias_games = []
+    if alias_game_ids:
+        alias_games = (await client.table(_TABLE).select("*").in_("id", alias_game_ids).execute()).data
+
+    deduped: dict[str, dict[str, Any]] = {}
+    for row in [*direct_response.data, *alias_games]:
+        row_id = str(row.get("id") or "")
+        if row_id:
+            deduped[row_id] = row
+
+    return sorted(deduped.values(), key=lambda game: _search_rank(game, query))
+
+
+async def list_recent(limit: int = 100, offset: int = 0, cursor: str | None = None) -> dict[str, Any]:
+    """Return games by ``updated_at`` desc; ``cursor`` (a previous ``next_cursor``) seeks instead of offsetting."""
+    after = decode_cursor(cursor, "recent", len(_RECENT_KEYS)) if cursor else None
+    # The first page always counts exactly; later pages reuse that total while it is fresh.
+    hit, total = _list_total_cache.lookup("recent") if after is not None or offset else (False, None)
+    if is_local():
+        page = local_db.list_games_page([], [], _RECENT_KEYS, limit, offset, after=after, count=not hit)
+        rows, counted, last_key = page["data"], page["total"], page["last_key"]
+    else:
+        client = _get_async_client()
+        # A seek page's own count would only cover the rows after the cursor, so it is counted separately.
+        query = client.table(_TABLE).select("*", count=None if hit or after is not None else "exact")
+        for key in _RECENT_KEYS:
+            query = query.order(key.column, desc=key.desc, nullsfirst=False)
+        if after is None:
+            request = query.range(offset, offset + limit - 1)
+        else:
+            request = query.or_(postgrest_seek_filter(_RECENT_KEYS, after)).limit(limit)
+        if after is None or hit:
+            res = await request.execute()
+            rows, counted = res.data, res.count
+        else:
+            res, head = await asyncio.gather(
+                request.execute(), client.table(_TABLE).select("id", count="exact", head=True).execute()
+            )
+            rows, counted = res.data, head.count
+        last_key = [rows[-1].get(key.column) for key in _RECENT_KEYS] if rows else None
+    if not hit:
+        total = counted
+        _list_total_cache.set("recent", total)
+    return {
+        "data": rows,
+        "total": total,
+        "next_cursor": encode_cursor("recent", last_key) if last_key and len(rows) == limit else None,
+    }
+
+
+async def get_rule_set_version(rule_set_id: str) -> dict[str, Any] | None:
+    """Return a rule set's ``game_id`` / ``source_revision`` / ``updated_at``; None when local or unknown."""
+    if is_local():
+        return None
+    hit, row = _rule_set_version_cache.lookup(rule_set_id)
+    if hit:
+        return row
+    rows = (
+        await _get_async_client()
+        .table("rule_sets")
+        .select("id, game_id, source_revision, updated_at")
+        .eq("id", rule_set_id)
+        .limit(1)
+        .execute()
+    ).data
+    row = rows[0] if rows else None
+    _rule_set_version_cache.set(rule_set_id, row)
+    return row
+
+
+def invalidate_cached_game(slug: str | None = None, game_id: str | None = None) -> None:
+    """Drop cached resolutions for a slug (including negative entries) and any alias of the game id."""
+    slug = str(slug or "")
+    game_id = str(game_id or "")
+
+    def _matches(key, row) -> bool:
+        if slug and key == slug:
+            return True
+        return bool(row) and (
+            (game_id and str(row.get("id") or "") == game_id) or (slug and str(row.get("slug") or "") == slug)
+        )
+
+    _game_cache.discard_where(_matches)
+
 
-    return await anyio.to_thread.run_sync(_q)
+def game_cache_stats() -> dict[str, int]:
+    return _game_cache.stats()
 
 
-async def get_by_slug(slug: str) -> Optional[Dict[str, Any]]:
+async def get_by_slug(slug: str) -> dict[str, Any] | None:
+    hit, cached = _game_cache.lookup(slug)
+    if not hit:
+        cached = await _resolve_slug(slug)
+        _game_cache.set(slug, cached)
+        if cached and cached.get("slug") and cached["slug"] != slug:
+            _game_cache.set(cached["slug"], cached)
+    # Callers build merged payloads from the row; never hand out the cached dict itself.
+    return dict(cached) if cached else None
+
+
+async def _resolve_slug(slug: str) -> dict[str, Any] | None:
     if is_local():
         return local_db.get_by_slug(slug)
 
-    def _q():
-        rows = _get_client().table(_TABLE).select("*").eq("slug", slug).execute().data
-        if rows:
-            return rows[0]
-
-        aliases = (
-            _get_client()
-            .table("game_slug_aliases")
-            .select("game_id")
-            .eq("alias_slug", slug)
-            .limit(1)
-            .execute()
-            .data
-        )
-        if not aliases:
-            return None
+    client = _get_async_client()
+    rows = (await client.table(_TABLE).select("*").eq("slug", slug).execute()).data
+    if rows:
+        return rows[0]
 
-        rows = _get_client().table(_TABLE).select("*").eq("id", aliases[0]["game_id"]).execute().data
-        return rows[0] if rows else None
+    aliases = (await client.table("game_slug_aliases").select("game_id").eq("alias_slug", slug).limit(1).execute()).data
+    if not aliases:
+        return None
 
-    return await anyio.to_thread.run_sync(_q)
+    rows = (await client.table(_TABLE).select("*").eq("id", aliases[0]["game_id"]).execute()).data
+    return rows[0] if rows else None
 
 
-async def upsert_game(game_data: Dict[str, Any]) -> Dict[str, Any]:
+async def upsert_game(game_data: dict[str, Any]) -> dict[str, Any]:
     if is_local():
         local_db.upsert_game(game_data)
+        invalidate_cached_game(game_data.get("slug"), game_data.get("id"))
         return game_data
 
-    def _q():
-        return _get_client().table(_TABLE).upsert(game_data).execute().data[0]
+    row = (await _get_async_client().table(_TABLE).upsert(game_data).execute()).data[0]
+    invalidate_cached_game(row.get("slug"), row.get("id"))
+    _index_written_game(row)
+    return row
 
-    return await anyio.to_thread.run_sync(_q)
 
-
-async def create_unverified_game(game_data: Dict[str, Any]) -> Dict[str, Any]:
+async def create_unverified_game(game_data: dict[str, Any]) -> dict[str, Any]:
     """Create a new unverified work+edition pair for an authenticated generation request."""
     if is_local():
         local_db.upsert_game(game_data)
+        # The new slug may be cached as a negative (404) resolution.
+        invalidate_cached_game(game_data.get("slug"), game_data.get("id"))
         return game_data
 
-    def _q():
-        client = _get_client()
-        canonical_title = str(game_data.get("title_ja") or game_data.get("title") or "").strip()
-        if not canonical_title:
-            raise ValueError("Generated game is missing a title")
-
-        work_rows = (
-            client.table("game_works")
-            .insert({"canonical_title": canonical_title, "identity_status": "unverified"})
-            .execute()
-            .data
-        )
-        if not work_rows:
-            raise RuntimeError("Failed to create canonical game work")
-
-        work_id = work_rows[0]["id"]
-        payload = dict(game_data)
-        payload["work_id"] = work_id
-        payload["identity_status"] = "unverified"
-        payload["source_trust"] = "unknown"
-        payload["content_review_status"] = "ai_draft"
-        try:
-            rows = client.table(_TABLE).insert(payload).execute().data
-            if not rows:
-                raise RuntimeError("Failed to create game edition")
-            return rows[0]
-        except Exception:
-            # Avoid leaving an orphan work when the edition insert fails.
-            client.table("game_works").delete().eq("id", work_id).execute()
-            raise
-
-    return await anyio.to_thread.run_sync(_q)
-
-
-async def increment_view_count(game_id: str) -> None:
+    client = _get_async_client()
+    canonical_title = str(game_data.get("title_ja") or game_data.get("title") or "").strip()
+    if not canonical_title:
+        raise ValueError("Generated game is missing a title")
+
+    work_rows = (
+        await client.table("game_works")
+        .insert({"canonical_title": canonical_title, "identity_status": "unverified"})
+        .execute()
+    ).data
+    if not work_rows:
+        raise RuntimeError("Failed to create canonical game work")
+
+    work_id = work_rows[0]["id"]
+    payload = dict(game_data)
+    payload["work_id"] = work_id
+    payload["identity_status"] = "unverified"
+    payload["source_trust"] = "unknown"
+    payload["content_review_status"] = "ai_draft"
+    try:
+        rows = (await client.table(_TABLE).insert(payload).execute()).data
+        if not rows:
+            raise RuntimeError("Failed to create game edition")
+    except Exception:
+        # Avoid leaving an orphan work when the edition insert fails.
+        await client.table("game_works").delete().eq("id", work_id).execute()
+        raise
+
+    row = rows[0]
+    invalidate_cached_game(row.get("slug"), row.get("id"))
+    _index_written_game(row)
+    return row
+
+
+async def apply_view_counts(deltas: dict[str, int]) -> None:
+    """Add accumulated per-game views atomically in one round trip."""
     if is_local():
+        local_db.increment_view_counts(deltas)
         return
+    await _get_async_client().rpc("increment_view_counts", {"p_deltas": deltas}).execute()
+
 
-    def _q():
-        rows = _get_client().table(_TABLE).select("view_count").eq("id", game_id).execute().data
-        if rows:
-            count = rows[0].get("view_count") or 0
-            _get_client().table(_TABLE).update({"view_count": count + 1}).eq("id", game_id).execute()
+# Views are aggregated in process and written in batches; see view_counter.
+view_counter = ViewCounter(apply_view_counts)
 
-    await anyio.to_thread.run_sync(_q)
+
+def increment_view_count(game_id: str) -> None:
+    view_counter.record(game_id)
 
 
 # Legacy alias
-async def upsert(data: dict[str, Any]) -> List[dict[str, Any]]:
+async def upsert(data: dict[str, Any]) -> list[dict[str, Any]]:
     return [await upsert_game(data)]
 
 
-async def list_for_sitemap() -> list[dict[str, Any]]:
+async def list_for_sitemap(
+    after_slug: str = "",
+    *,
+    through_slug: str | None = None,
+    limit: int = 1000,
+    columns: tuple[str, ...] = _SITEMAP_COLUMNS,
+) -> list[dict[str, Any]]:
+    """Return one keyset page of games by slug, after ``after_slug`` and up to ``through_slug`` inclusive."""
     if is_local():
-        res = local_db.list_recent(limit=50000)
-        return [
-            {
-                "slug": g["slug"],
-                "title": g["title"],
-                "updated_at": g["updated_at"],
-                "image_url": g.get("image_url"),
-            }
-            for g in res["data"]
-            if str(g.get("slug") or "").strip()
-        ]
-
-    def _q():
-        rows = (
-            _get_client()
-            .table(_TABLE)
-            .select("slug, title, updated_at, image_url")
-            .execute()
-            .data
-        )
-        return [row for row in rows if str(row.get("slug") or "").strip()]
-
-    return await anyio.to_thread.run_sync(_q)
+        conditions, params = (["slug <= ?"], [through_slug]) if through_slug is not None else ([], [])
+        page = local_db.list_games_page(conditions, params, _SITEMAP_KEYS, limit, after=[after_slug], count=False)
+        return [{column: game.get(column) for column in columns} for game in page["data"]]
+
+    query = _get_async_client().table(_TABLE).select(", ".join(columns)).gt("slug", after_slug)
+    if through_slug is not None:
+        query = query.lte("slug", through_slug)
+    return (await query.order("slug").limit(limit).execute()).data
@@ -0,0 +1,114 @@
+"""In-process aggregation of game page views.
+
+Recording a view only bumps a per-game delta in memory, so the read path never
+waits on the database. A background task writes the accumulated deltas in one
+atomic batch every few seconds, and once more on shutdown. The buffer is bounded
+by distinct games: views of new games arriving while it is full are dropped and
+counted, and a flush is requested early.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger("core.view_counter")
+
+FlushFn = Callable[[dict[str, int]], Awaitable[None]]
+
+
+class ViewCounter:
+    """Per-game view deltas plus the periodic task that flushes them; event-loop use only."""
+
+    def __init__(self, flush: FlushFn, *, interval_seconds: float = 10.0, max_pending_games: int = 10_000):
+        self.interval_seconds = interval_seconds
+        self.max_pending_games = max_pending_games
+        self._flush = flush
+        self._pending: dict[str, int] = {}
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self.recorded = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.flushed_views = 0
+        self.failures = 0
+        self.last_flush_seconds = 0.0
+
+    def record(self, game_id: str) -> None:
+        game_id = str(game_id)
+        if game_id not in self._pending and len(self._pending) >= self.max_pending_games:
+            self.dropped += 1
+            if self._wake is not None:
+                self._wake.set()
+            return
+        self._pending[game_id] = self._pending.get(game_id, 0) + 1
+        self.recorded += 1
+
+    async def flush(self) -> int:
+        """Write every pending delta in one batch and return the number of views written."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        started = time.perf_counter()
+        try:
+            await self._flush(batch)
+        except asyncio.CancelledError:
+            self._restore(batch)
+            raise
+        except Exception:
+            self._restore(batch)
+            self.failures += 1
+            logger.warning("View count flush of %d games failed; deltas kept for retry", len(batch), exc_info=True)
+            return 0
+        views = sum(batch.values())
+        self.flushes += 1
+        self.flushed_views += views
+        self.last_flush_seconds = time.perf_counter() - started
+        logger.debug("Flushed %d views across %d games in %.3fs", views, len(batch), self.last_flush_seconds)
+        return views
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="view-counter-flush")
+
+    async def stop(self) -> None:
+        """Stop the periodic task and write whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+        await self.flush()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "pending_games": len(self._pending),
+            "pending_views": sum(self._pending.values()),
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "flushed_views": self.flushed_views,
+            "failures": self.failures,
+            "last_flush_seconds": self.last_flush_seconds,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval_seconds)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def _restore(self, batch: dict[str, int]) -> None:
+        # Views recorded while the batch was in flight are already pending; merge without growing past the bound.
+        for game_id, delta in batch.items():
+            if game_id in self._pending or len(self._pending) < self.max_pending_games:
+                self._pending[game_id] = self._pending.get(game_id, 0) + delta
+            else:
+                self.dropped += delta
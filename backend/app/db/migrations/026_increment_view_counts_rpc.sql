@@ -0,0 +1,40 @@
+BEGIN;
+
+-- Batched, atomic view counting. The API aggregates views in process and sends
+-- {game_id: delta} here, so concurrent views never race a read-modify-write.
+CREATE OR REPLACE FUNCTION public.increment_view_counts(p_deltas jsonb)
+RETURNS integer
+LANGUAGE sql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  WITH deltas AS (
+    SELECT key AS game_id, value::bigint AS delta
+    FROM jsonb_each_text(COALESCE(p_deltas, '{}'::jsonb))
+    WHERE value::bigint > 0
+  ),
+  updated AS (
+    UPDATE public.games g
+    SET view_count = COALESCE(g.view_count, 0) + d.delta
+    FROM deltas d
+    WHERE g.id::text = d.game_id
+    RETURNING g.id
+  )
+  SELECT count(*)::integer FROM updated;
+$$;
+
+REVOKE ALL ON FUNCTION public.increment_view_counts(jsonb) FROM PUBLIC;
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+    REVOKE ALL ON FUNCTION public.increment_view_counts(jsonb) FROM anon;
+  END IF;
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+    REVOKE ALL ON FUNCTION public.increment_view_counts(jsonb) FROM authenticated;
+  END IF;
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+    GRANT EXECUTE ON FUNCTION public.increment_view_counts(jsonb) TO service_role;
+  END IF;
+END $$;
+
+COMMIT;
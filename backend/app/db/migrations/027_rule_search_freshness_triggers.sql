@@ -0,0 +1,66 @@
+BEGIN;
+
+-- Cross-game rule search refreshes only rule sets whose rule_sets.updated_at or
+-- rule_nodes.updated_at moved past its watermark. Stamp both on every update,
+-- and touch the rule set when a node leaves it, since a deleted node has no row
+-- left to carry a newer updated_at.
+CREATE OR REPLACE FUNCTION public.stamp_updated_at()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  NEW.updated_at := now();
+  RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS stamp_rule_sets_updated_at ON public.rule_sets;
+CREATE TRIGGER stamp_rule_sets_updated_at
+BEFORE UPDATE ON public.rule_sets
+FOR EACH ROW
+EXECUTE FUNCTION public.stamp_updated_at();
+
+DROP TRIGGER IF EXISTS stamp_rule_nodes_updated_at ON public.rule_nodes;
+CREATE TRIGGER stamp_rule_nodes_updated_at
+BEFORE UPDATE ON public.rule_nodes
+FOR EACH ROW
+EXECUTE FUNCTION public.stamp_updated_at();
+
+-- Statement-level, so replacing a rule set's nodes touches the rule set once.
+CREATE OR REPLACE FUNCTION public.touch_rule_sets_of_deleted_nodes()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE public.rule_sets
+  SET updated_at = now()
+  WHERE id IN (SELECT DISTINCT rule_set_id FROM deleted_nodes);
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS touch_rule_set_on_node_delete ON public.rule_nodes;
+CREATE TRIGGER touch_rule_set_on_node_delete
+AFTER DELETE ON public.rule_nodes
+REFERENCING OLD TABLE AS deleted_nodes
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.touch_rule_sets_of_deleted_nodes();
+
+CREATE OR REPLACE FUNCTION public.touch_rule_set_of_moved_node()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE public.rule_sets SET updated_at = now() WHERE id = OLD.rule_set_id;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS touch_rule_set_on_node_move ON public.rule_nodes;
+CREATE TRIGGER touch_rule_set_on_node_move
+AFTER UPDATE OF rule_set_id ON public.rule_nodes
+FOR EACH ROW
+WHEN (OLD.rule_set_id IS DISTINCT FROM NEW.rule_set_id)
+EXECUTE FUNCTION public.touch_rule_set_of_moved_node();
+
+COMMIT;
@@ -1,16 +1,37 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 
+from app.core import local_db, supabase
+from app.core.dataloader import loader_scope
 from app.core.logger import setup_logging
+from app.middleware.conditional import ConditionalGetMiddleware
 from app.middleware.validation import ValidationMiddleware
 from app.routers import auth, games, lists, mechanical_dna, presentation, vrchat
+from app.services import sitemap
 from app.services.search_visibility import should_return_gone
-from app.services.seo_renderer import generate_seo_html
-from app.services.sitemap import get_sitemap_xml
+from app.services.seo_renderer import compiled_template, generate_seo_html
 
 setup_logging()
-app = FastAPI(title="RuleScribe Minimal", version="1.0.0")
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    if supabase.is_local():
+        local_db.init_db()
+    supabase.view_counter.start()
+    # Parse index.html into the SEO page template before the first crawler request.
+    compiled_template()
+    yield
+    # Pending views are written before the pooled client they are sent through is closed.
+    await supabase.view_counter.stop()
+    await supabase.close_async_client()
+    local_db.close_db()
+
+
+app = FastAPI(title="RuleScribe Minimal", version="1.0.0", lifespan=lifespan)
 
 PUBLIC_GAME_READ_CACHE = "public, max-age=0, s-maxage=60, must-revalidate"
 
@@ -25,6 +46,12 @@ def is_public_game_read_path(path: str) -> bool:
     )
 
 
+@app.middleware("http")
+async def request_scoped_loaders(request: Request, call_next):
+    with loader_scope():
+        return await call_next(request)
+
+
 @app.middleware("http")
 async def cache_public_game_reads(request: Request, call_next):
     response = await call_next(request)
@@ -36,6 +63,9 @@ async def cache_public_game_reads(request: Request, call_next):
 # Browser API access is same-origin in production. Explicit localhost origins are
 # retained for Vite development; arbitrary third-party origins are denied.
 app.add_middleware(ValidationMiddleware)
+app.add_middleware(
+    ConditionalGetMiddleware, cache_control=PUBLIC_GAME_READ_CACHE, is_cached_path=is_public_game_read_path
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -62,10 +92,39 @@ async def health_check():
     return {"status": "ok"}
 
 
+SITEMAP_CACHE = "public, max-age=0, s-maxage=3600, stale-while-revalidate=86400"
+
+
+def _sitemap_headers(etag: str, last_modified: str | None = None) -> dict[str, str]:
+    headers = {"Cache-Control": SITEMAP_CACHE, "ETag": etag}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
 @app.get("/sitemap.xml")
-async def sitemap_xml():
-    content = await get_sitemap_xml()
-    return Response(content=content, media_type="application/xml")
+async def sitemap_xml(request: Request):
+    chunks = await sitemap.sitemap_chunks()
+    headers = _sitemap_headers(sitemap.sitemap_index_etag(chunks))
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=sitemap.sitemap_index_xml(chunks, sitemap.base_url()), media_type="application/xml", headers=headers
+    )
+
+
+@app.get("/sitemaps/games-{number}.xml")
+async def sitemap_chunk_xml(number: int, request: Request):
+    chunks = await sitemap.sitemap_chunks()
+    if not 1 <= number <= len(chunks):
+        return Response(status_code=404)
+    chunk = chunks[number - 1]
+    headers = _sitemap_headers(chunk.etag, chunk.last_modified)
+    if request.headers.get("if-none-match") == chunk.etag:
+        return Response(status_code=304, headers=headers)
+    return StreamingResponse(
+        sitemap.iter_sitemap_chunk(chunk, sitemap.base_url()), media_type="application/xml", headers=headers
+    )
 
 
 def game_not_found_html() -> str:
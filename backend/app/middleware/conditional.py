@@ -0,0 +1,175 @@
+"""Conditional GET (ETag / 304) and response compression for public game reads.
+
+Game detail and the rule graph reads, whose payload is fully determined by the
+game row and, for the rule graph, the rule set's ``source_revision`` /
+``updated_at`` (the same inputs as its snapshot cache key), get a validator
+computed from those inputs before the route runs, so a matching
+``If-None-Match`` is answered with 304 without loading or serializing the body.
+Every other public game read, including components and presentation whose
+bodies also depend on component, claim and evidence rows, is hashed after
+rendering, which still saves the transfer. Large bodies are brotli- or
+gzip-encoded when the client accepts it. A 304 carries the Cache-Control the
+matching 200 would have carried, so revalidation never makes an uncached
+sub-resource cacheable.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+
+from fastapi import Request, status
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from app.core import supabase
+from app.services.search_visibility import should_return_gone
+
+try:
+    import brotli
+except ImportError:  # optional; gzip covers every client that lacks it
+    brotli = None
+
+logger = logging.getLogger("middleware.conditional")
+
+COMPRESS_MIN_BYTES = 1024
+# Sub-resources whose body depends only on the game row and the rule_set_id query parameter's rule set.
+# Component and presentation reads also depend on rows that change without touching ``rule_sets``.
+_REVISION_SCOPED = frozenset({"rule-graph"})
+# Streaming responses are passed through untouched.
+_STREAMING_SUFFIXES = ("/components/export",)
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+def is_public_game_api_read(request: Request) -> bool:
+    segments = _segments(request.url.path)
+    return (
+        request.method == "GET"
+        and segments[:2] == ["api", "games"]
+        and not request.url.path.endswith(_STREAMING_SUFFIXES)
+    )
+
+
+def weak_etag(*parts: object) -> str:
+    digest = hashlib.sha256(json.dumps(parts, default=str, separators=(",", ":")).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:40]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison per RFC 9110: ``W/`` prefixes are ignored and ``*`` matches anything."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for token in if_none_match.split(","):
+        candidate = token.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _revision_target(request: Request) -> tuple[str, str | None] | None:
+    """Return ``(slug, rule_set_id)`` for reads validated from stable inputs; rule_set_id is None for the game row."""
+    # Segments after the "api", "games" prefix that is_public_game_api_read already checked.
+    segments = _segments(request.url.path)[2:]
+    if not segments or should_return_gone(segments[0]):
+        return None
+    slug, resource = segments[0], segments[1] if len(segments) > 1 else None
+    if resource is None:
+        return slug, None
+    rule_set_id = request.query_params.get("rule_set_id")
+    if resource not in _REVISION_SCOPED or not rule_set_id:
+        return None
+    return slug, rule_set_id
+
+
+async def revision_etag(request: Request) -> str | None:
+    """Return a validator built from stable inputs, or None when the route needs a body hash."""
+    target = _revision_target(request)
+    if target is None:
+        return None
+    slug, rule_set_id = target
+
+    game = await supabase.get_by_slug(slug)
+    if not game:
+        return None
+    inputs: list[object] = [request.url.path, sorted(request.query_params.multi_items())]
+    inputs += [game.get("id"), game.get("updated_at")]
+    if rule_set_id is not None:
+        rule_set = await supabase.get_rule_set_version(rule_set_id)
+        if not rule_set or str(rule_set.get("game_id")) != str(game.get("id")):
+            return None
+        inputs += [rule_set.get("source_revision"), rule_set.get("updated_at")]
+    return weak_etag(*inputs)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    accepted = {
+        token.split(";")[0].strip().lower()
+        for token in accept_encoding.split(",")
+        if not token.strip().endswith(("q=0", "q=0.0"))
+    }
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _encode(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    def __init__(self, app, *, cache_control: str, is_cached_path: Callable[[str], bool]):
+        super().__init__(app)
+        # Validator-only 304s skip the route, so they take the shared cache policy from the same path rule.
+        self.cache_control = cache_control
+        self.is_cached_path = is_cached_path
+
+    async def dispatch(self, request: Request, call_next):
+        if not is_public_game_api_read(request):
+            return await call_next(request)
+
+        try:
+            etag = await revision_etag(request)
+        except Exception:
+            # Validators are an optimization; the route itself decides 404s and failures.
+            logger.warning("Revision validator unavailable for %s", request.url.path, exc_info=True)
+            etag = None
+        if etag and etag_matches(request.headers.get("if-none-match"), etag):
+            cached = self.is_cached_path(request.url.path)
+            return self._not_modified(etag, self.cache_control if cached else None)
+
+        response = await call_next(request)
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = etag or weak_etag(hashlib.sha256(body).hexdigest())
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return self._not_modified(etag, response.headers.get("cache-control"))
+
+        # Raw header copy keeps repeated headers (Set-Cookie) and any Vary the route set.
+        headers = MutableHeaders(raw=[item for item in response.raw_headers if item[0] != b"content-length"])
+        headers["ETag"] = etag
+        headers.add_vary_header("Accept-Encoding")
+        encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+        if encoding and len(body) >= COMPRESS_MIN_BYTES and "content-encoding" not in headers:
+            body = _encode(body, encoding)
+            headers["Content-Encoding"] = encoding
+        rendered = Response(content=body, status_code=status.HTTP_200_OK)  # only sets Content-Length
+        rendered.raw_headers.extend(headers.raw)
+        return rendered
+
+    @staticmethod
+    def _not_modified(etag: str, cache_control: str | None) -> Response:
+        headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if cache_control:
+            headers["Cache-Control"] = cache_control
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
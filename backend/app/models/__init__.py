@@ -1,7 +1,7 @@
 from typing import Any, Literal
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 IdentityStatus = Literal["unverified", "verified", "needs_review"]
 SourceTrust = Literal["unknown", "official_publisher", "authorized_partner", "third_party"]
@@ -114,8 +114,18 @@ class StrategyTier(BaseSchema):
     updated_at: str | None = None
 
 
+class DirectoryFacets(BaseSchema):
+    """Matching-game counts per facet value; each facet ignores its own filter, so siblings stay selectable."""
+
+    players: dict[str, int] = Field(default_factory=dict)
+    time: dict[str, int] = Field(default_factory=dict)
+    tier: dict[str, int] = Field(default_factory=dict)
+
+
 class GameListResponse(BaseSchema):
     games: list[GameDetail]
     total: int
     limit: int
     offset: int
+    facets: DirectoryFacets = Field(default_factory=DirectoryFacets)
+    next_cursor: str | None = None
@@ -246,6 +246,38 @@ class EvidenceTraceResponse(EvidenceModel):
     claims: list[ClaimTrace] = Field(default_factory=list)
 
 
+MAX_EVIDENCE_BATCH_TARGETS = 200
+MAX_EVIDENCE_BATCH_CLAIMS = 500
+
+
+class EvidenceBatchRequest(EvidenceModel):
+    rule_set_id: str = Field(min_length=1)
+    targets: list[ClaimTarget] = Field(default_factory=list, max_length=MAX_EVIDENCE_BATCH_TARGETS)
+    target_type: EvidenceTargetType | None = None
+
+    @model_validator(mode="after")
+    def require_one_selector(self):
+        if bool(self.targets) == (self.target_type is not None):
+            raise ValueError("evidence batch requires either targets or target_type")
+        return self
+
+
+class TargetClaimTraces(EvidenceModel):
+    target: ClaimTarget
+    claims: list[ClaimTrace] = Field(default_factory=list)
+
+
+class EvidenceBatchResponse(EvidenceModel):
+    schema_version: Literal["1.0"] = EVIDENCE_SCHEMA_VERSION
+    status: Literal["available", "not_available"]
+    game_id: str
+    slug: str
+    ruleset_id: str
+    traces: list[TargetClaimTraces] = Field(default_factory=list)
+    truncated: bool = False
+    claim_limit: int = MAX_EVIDENCE_BATCH_CLAIMS
+
+
 class ClaimDetailResponse(EvidenceModel):
     schema_version: Literal["1.0"] = EVIDENCE_SCHEMA_VERSION
     status: Literal["available"] = "available"
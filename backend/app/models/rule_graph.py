@@ -42,6 +42,15 @@ class RuleVerificationStatus(StrEnum):
     REJECTED = "rejected"
 
 
+class RuleSearchIntent(StrEnum):
+    SETUP = "setup"
+    TIE = "tie"
+    END = "end"
+    SCORE = "score"
+    LIMIT = "limit"
+    ACTION = "action"
+
+
 class RuleGraphSchema(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -119,3 +128,65 @@ class RuleGraphReadResponse(RuleGraphSchema):
             if edge.from_rule_id in selected_ids and edge.to_rule_id in selected_ids
         ]
         return self.model_copy(update={"nodes": selected, "edges": selected_edges})
+
+
+class RuleGraphPathResponse(RuleGraphSchema):
+    schema_version: Literal["1.0"] = RULE_GRAPH_SCHEMA_VERSION
+    status: Literal["available", "not_available"]
+    game_id: str
+    slug: str
+    rule_set_id: str | None = None
+    source_revision: str | None = None
+    from_rule_id: str
+    to_rule_id: str
+    found: bool = False
+    nodes: list[RuleNode] = Field(default_factory=list)
+    edges: list[RuleEdge] = Field(default_factory=list)
+
+
+class RuleNodeChange(RuleGraphSchema):
+    rule_id: str
+    changed_fields: list[str]
+    before: RuleNode
+    after: RuleNode
+
+
+class RuleEdgeChange(RuleGraphSchema):
+    before: RuleEdge
+    after: RuleEdge
+
+
+class RuleGraphDiffResponse(RuleGraphSchema):
+    schema_version: Literal["1.0"] = RULE_GRAPH_SCHEMA_VERSION
+    status: Literal["available", "not_available"]
+    game_id: str
+    slug: str
+    from_rule_set_id: str
+    to_rule_set_id: str
+    from_source_revision: str | None = None
+    to_source_revision: str | None = None
+    added_nodes: list[RuleNode] = Field(default_factory=list)
+    removed_nodes: list[RuleNode] = Field(default_factory=list)
+    modified_nodes: list[RuleNodeChange] = Field(default_factory=list)
+    added_edges: list[RuleEdge] = Field(default_factory=list)
+    removed_edges: list[RuleEdge] = Field(default_factory=list)
+    modified_edges: list[RuleEdgeChange] = Field(default_factory=list)
+
+
+class RuleSearchHit(RuleGraphSchema):
+    rule_id: str
+    rule_set_id: str
+    game_id: str
+    node_type: RuleNodeType
+    verification_status: RuleVerificationStatus
+    normalized_statement: str
+    evidence_ref: str | None = None
+    source_claim_ref: str | None = None
+
+
+class RuleSearchResponse(RuleGraphSchema):
+    schema_version: Literal["1.0"] = RULE_GRAPH_SCHEMA_VERSION
+    status: Literal["available", "not_available"]
+    query: str = ""
+    total: int = 0
+    results: list[RuleSearchHit] = Field(default_factory=list)
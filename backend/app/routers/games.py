@@ -1,6 +1,10 @@
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
 from pydantic import ValidationError
 
+from app.core.keyset import CursorError
 from app.core.rate_limiter import RateLimiter
 from app.models import GameDetail, GameListResponse, GameUpdate
 from app.models.component_catalog import (
@@ -13,24 +17,40 @@ from app.models.concept_taxonomy import ConceptDetailResponse, GameConceptsReadR
 from app.models.evidence import (
     ClaimDetailResponse,
     ClaimTarget,
+    EvidenceBatchRequest,
+    EvidenceBatchResponse,
     EvidenceTargetType,
     EvidenceTraceResponse,
 )
-from app.models.rule_graph import RuleGraphReadResponse, RuleNodeType
+from app.models.rule_graph import (
+    RuleGraphDiffResponse,
+    RuleGraphPathResponse,
+    RuleGraphReadResponse,
+    RuleNodeType,
+    RuleRelationType,
+    RuleSearchIntent,
+    RuleSearchResponse,
+    RuleVerificationStatus,
+)
 from app.models.ruleset import RuleSetListResponse
 from app.routers.auth import require_catalog_editor
 from app.services import catalog_access
 from app.services.component_catalog import ComponentCatalogService
+from app.services.component_query import ComponentQueryError
 from app.services.concept_taxonomy import ConceptTaxonomyService
 from app.services.directory_query import DirectorySort, DirectoryTime, list_directory_games
 from app.services.evidence import EvidenceService
 from app.services.game_service import GameIdentityConflictError, GameService
 from app.services.rule_graph import RuleGraphService
+from app.services.rule_graph_engine import RuleGraphQueryError
+from app.services.rule_search import RuleSearchService
 from app.services.rulesets import RuleSetService
 from app.services.search_visibility import has_known_identity_conflict, should_return_gone
 
 router = APIRouter()
 search_limiter = RateLimiter.get_limiter("search", max_requests=100, window_seconds=60)
+rule_search_limiter = RateLimiter.get_limiter("rule_search", max_requests=100, window_seconds=60)
+view_limiter = RateLimiter.get_limiter("views", max_requests=600, window_seconds=60)
 
 
 def get_game_service():
@@ -41,6 +61,10 @@ def get_rule_graph_service():
     return RuleGraphService()
 
 
+def get_rule_search_service():
+    return RuleSearchService()
+
+
 def get_ruleset_service():
     return RuleSetService()
 
@@ -64,8 +88,35 @@ async def search_games(q: str = Query(..., min_length=1), service: GameService =
     return await service.search_games(q.strip())
 
 
+@router.get("/rules/search", response_model=RuleSearchResponse)
+async def search_rules(
+    q: str = Query(default="", max_length=200),
+    node_types: list[RuleNodeType] | None = Query(default=None),
+    game: str | None = Query(default=None, min_length=1),
+    verification_status: list[RuleVerificationStatus] | None = Query(default=None),
+    intent: RuleSearchIntent | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=100),
+    service: RuleSearchService = Depends(get_rule_search_service),
+):
+    if not (q.strip() or node_types or game or verification_status or intent):
+        raise HTTPException(status_code=422, detail="Pass q or at least one filter")
+    if not rule_search_limiter.acquire():
+        raise HTTPException(status_code=429, detail="Search rate limit exceeded")
+    result = await service.search(
+        q.strip(),
+        node_types=node_types,
+        game_slug=game,
+        verification_statuses=verification_status,
+        intent=intent,
+        limit=limit,
+    )
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return result
+
+
 @router.get("/games", response_model=GameListResponse)
-async def list_games(
+async def list_games(  # noqa: PLR0913, PLR0917 - FastAPI query parameters
     q: str | None = Query(default=None, max_length=200),
     players: str | None = Query(default=None, pattern=r"^(1|2|3|4|5\+)$"),
     time_filter: DirectoryTime | None = Query(default=None, alias="time"),
@@ -73,21 +124,28 @@ async def list_games(
     sort: DirectorySort = Query(default="recent"),
     limit: int = Query(default=48, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None, max_length=512),
 ):
-    result = await list_directory_games(
-        q=q,
-        players=players,
-        time_filter=time_filter,
-        tier=tier,
-        sort=sort,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = await list_directory_games(
+            q=q,
+            players=players,
+            time_filter=time_filter,
+            tier=tier,
+            sort=sort,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except CursorError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     return {
         "games": result["data"],
         "total": result["total"] or 0,
         "limit": limit,
         "offset": offset,
+        "facets": result.get("facets") or {},
+        "next_cursor": result.get("next_cursor"),
     }
 
 
@@ -149,28 +207,53 @@ async def get_game_component_sets(
 
 
 @router.get("/games/{slug}/components", response_model=ComponentListResponse)
-async def list_game_components(
+async def list_game_components(  # noqa: PLR0913, PLR0917
     slug: str,
     rule_set_id: str = Query(..., min_length=1),
     component_set_id: str | None = Query(default=None),
     kind: ComponentKind | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    where: list[str] | None = Query(default=None),
+    sort: str | None = Query(default=None, max_length=129),
     service: ComponentCatalogService = Depends(get_component_catalog_service),
 ):
-    result = await service.list_components(
-        slug,
-        rule_set_id,
-        component_set_id=component_set_id,
-        kind=kind.value if kind else None,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = await service.list_components(
+            slug,
+            rule_set_id,
+            component_set_id=component_set_id,
+            kind=kind.value if kind else None,
+            limit=limit,
+            offset=offset,
+            where=where,
+            sort=sort,
+        )
+    except ComponentQueryError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     if result is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
     return result
 
 
+# Declared before /components/{component_id} so "export" is not read as a component id.
+@router.get("/games/{slug}/components/export")
+async def export_game_components(
+    slug: str,
+    rule_set_id: str = Query(..., min_length=1),
+    service: ComponentCatalogService = Depends(get_component_catalog_service),
+):
+    components = await service.export_components(slug, rule_set_id)
+    if components is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Component catalog not found")
+
+    async def ndjson():
+        async for component in components:
+            yield component.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/games/{slug}/components/{component_id}", response_model=ComponentDetailResponse)
 async def get_game_component(
     slug: str,
@@ -218,6 +301,18 @@ async def get_game_evidence_trace(
     return result
 
 
+@router.post("/games/{slug}/evidence", response_model=EvidenceBatchResponse)
+async def get_game_evidence_traces(
+    slug: str,
+    request: EvidenceBatchRequest,
+    service: EvidenceService = Depends(get_evidence_service),
+):
+    result = await service.get_traces(slug, request)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return result
+
+
 @router.get("/games/{slug}/claims/{claim_id}", response_model=ClaimDetailResponse)
 async def get_game_claim_detail(
     slug: str,
@@ -238,12 +333,68 @@ async def get_game_rule_graph(
     rule_set_id: str | None = Query(default=None),
     service: RuleGraphService = Depends(get_rule_graph_service),
 ):
-    graph = await service.get_by_slug(slug, rule_types=types, rule_set_id=rule_set_id)
+    # The service returns pre-serialized bytes from its revision-keyed snapshot cache.
+    body = await service.get_json_by_slug(slug, rule_types=types, rule_set_id=rule_set_id)
+    if body is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/games/{slug}/rule-graph/subgraph", response_model=RuleGraphReadResponse)
+async def get_game_rule_subgraph(
+    slug: str,
+    root: str = Query(..., min_length=1),
+    depth: int = Query(default=1, ge=0, le=16),
+    relations: list[RuleRelationType] | None = Query(default=None),
+    direction: Literal["out", "in"] = Query(default="out"),
+    rule_set_id: str | None = Query(default=None),
+    service: RuleGraphService = Depends(get_rule_graph_service),
+):
+    try:
+        graph = await service.get_subgraph(
+            slug, root, depth, relations=relations, rule_set_id=rule_set_id, reverse=direction == "in"
+        )
+    except RuleGraphQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     if graph is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
     return graph
 
 
+@router.get("/games/{slug}/rule-graph/path", response_model=RuleGraphPathResponse)
+async def get_game_rule_path(  # noqa: PLR0913, PLR0917
+    slug: str,
+    from_rule_id: str = Query(..., alias="from", min_length=1),
+    to_rule_id: str = Query(..., alias="to", min_length=1),
+    relations: list[RuleRelationType] | None = Query(default=None),
+    rule_set_id: str | None = Query(default=None),
+    service: RuleGraphService = Depends(get_rule_graph_service),
+):
+    try:
+        path = await service.get_path(slug, from_rule_id, to_rule_id, relations=relations, rule_set_id=rule_set_id)
+    except RuleGraphQueryError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return path
+
+
+@router.get("/games/{slug}/rule-graph/diff", response_model=RuleGraphDiffResponse)
+async def get_game_rule_graph_diff(
+    slug: str,
+    to_rule_set_id: str = Query(..., alias="to", min_length=1),
+    from_rule_set_id: str | None = Query(default=None, alias="from", min_length=1),
+    service: RuleGraphService = Depends(get_rule_graph_service),
+):
+    try:
+        diff = await service.get_diff(slug, to_rule_set_id, from_rule_set_id=from_rule_set_id)
+    except RuleGraphQueryError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if diff is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return diff
+
+
 @router.get("/games/{slug}", response_model=GameDetail)
 async def get_game_details(slug: str, service: GameService = Depends(get_game_service)):
     if should_return_gone(slug):
@@ -254,6 +405,20 @@ async def get_game_details(slug: str, service: GameService = Depends(get_game_se
     return game
 
 
+# Views are reported by the page instead of counted on the CDN-cached detail read, which mostly never reaches here.
+@router.post("/games/{slug}/views", status_code=status.HTTP_204_NO_CONTENT)
+async def record_game_view(slug: str, service: GameService = Depends(get_game_service)) -> Response:
+    if should_return_gone(slug):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Game record retired after identity repair")
+    if not view_limiter.acquire():
+        raise HTTPException(status_code=429, detail="View rate limit exceeded")
+    game = await service.get_game_by_slug(slug)
+    if not game:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    service.record_view(game["id"])
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.patch("/games/{slug}")
 async def update_game(
     slug: str,
@@ -0,0 +1,42 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from app.core import supabase
+from app.services.component_catalog import ComponentCatalogService
+
+load_dotenv()
+
+
+async def export(slug: str, rule_set_id: str, output: Path | None) -> int:
+    components = await ComponentCatalogService().export_components(slug, rule_set_id)
+    if components is None:
+        raise SystemExit(f"component catalog not found: {slug}/{rule_set_id}")
+    count = 0
+    handle = output.open("w", encoding="utf-8") if output else sys.stdout
+    try:
+        async for component in components:
+            handle.write(component.model_dump_json() + "\n")
+            count += 1
+    finally:
+        if output:
+            handle.close()
+        await supabase.close_async_client()
+    return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream one rule set's components as NDJSON (read-only).")
+    parser.add_argument("slug")
+    parser.add_argument("--rule-set-id", required=True)
+    parser.add_argument("--output", type=Path, default=None, help="File to write; stdout when omitted")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    written = asyncio.run(export(args.slug, args.rule_set_id, args.output))
+    print(f"exported {written} components", file=sys.stderr)
@@ -0,0 +1,43 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from app.core import supabase
+from app.services.game_prerender import PrerenderReport, prerender_games
+
+load_dotenv()
+
+DEFAULT_DIST = Path(__file__).resolve().parents[3] / "frontend" / "dist"
+
+
+async def prerender(dist: Path, incremental: bool, concurrency: int) -> PrerenderReport:
+    try:
+        return await prerender_games(dist, incremental=incremental, concurrency=concurrency)
+    finally:
+        await supabase.close_async_client()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pre-render /games/{slug} pages into the frontend build output.")
+    parser.add_argument("--dist", type=Path, default=DEFAULT_DIST, help="Built frontend directory (with index.html)")
+    parser.add_argument("--incremental", action="store_true", help="Only re-render games whose updated_at changed")
+    parser.add_argument("--concurrency", type=int, default=8)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if not (args.dist / "index.html").exists():
+        raise SystemExit(f"build the frontend first: {args.dist / 'index.html'} not found")
+    report = asyncio.run(prerender(args.dist, args.incremental, args.concurrency))
+    print(
+        f"rendered {len(report.rendered)}, unchanged {report.unchanged}, "
+        f"removed {len(report.removed)}, failed {len(report.failed)}",
+        file=sys.stderr,
+    )
+    if report.failed:
+        print("failed: " + ", ".join(report.failed), file=sys.stderr)
+        raise SystemExit(1)
@@ -1,8 +1,6 @@
 import logging
 from typing import Any
 
-import anyio
-
 from app.core import supabase
 from app.core.settings import settings
 
@@ -15,27 +13,23 @@ async def get_catalog_editor_role(user_id: str | None) -> str | None:
     if not user_id or not settings.supabase_key or supabase.is_local():
         return None
 
-    def _q() -> str | None:
+    try:
         rows = (
-            supabase._get_client()
+            await supabase._get_async_client()
             .table("catalog_editors")
             .select("role")
             .eq("user_id", user_id)
             .eq("active", True)
             .limit(1)
             .execute()
-            .data
-        )
-        if not rows:
-            return None
-        role = str(rows[0].get("role") or "").strip()
-        return role if role in {"owner", "editor"} else None
-
-    try:
-        return await anyio.to_thread.run_sync(_q)
+        ).data
     except Exception:
         logger.exception("catalog_editor_lookup_failed")
         return None
+    if not rows:
+        return None
+    role = str(rows[0].get("role") or "").strip()
+    return role if role in {"owner", "editor"} else None
 
 
 async def record_catalog_mutation(
@@ -58,10 +52,7 @@ async def record_catalog_mutation(
         "outcome": "succeeded",
     }
 
-    def _q() -> None:
-        supabase._get_client().table("catalog_mutation_audit").insert(payload).execute()
-
     try:
-        await anyio.to_thread.run_sync(_q)
+        await supabase._get_async_client().table("catalog_mutation_audit").insert(payload).execute()
     except Exception:
         logger.exception("catalog_mutation_audit_failed", extra={"slug": slug, "action": action})
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from collections import defaultdict
-
-import anyio
+from collections.abc import AsyncIterator
 
 from app.core import supabase
+from app.core.dataloader import LoaderRegistry, current_loaders, loader_scope
+from app.core.ttl_cache import TTLCache
 from app.models.component_catalog import (
     Ability,
     BooleanPropertyValue,
@@ -22,9 +24,33 @@ from app.models.component_catalog import (
     PropertyDefinition,
     TextPropertyValue,
 )
+from app.services.component_query import (
+    VALUE_COLUMNS,
+    ComponentPropertyIndex,
+    ComponentQueryError,
+    parse_predicates,
+    parse_sort,
+)
 
 logger = logging.getLogger("services.component_catalog")
 
+# Definitions and property indexes are keyed by (rule_set_id, component_catalogs.updated_at). Every
+# ingestion bumps that row, so an ingest run by another process or the RPC is seen on the next read;
+# the TTL only bounds memory.
+_CATALOG_CACHE_TTL_SECONDS = 300.0
+_definitions_cache = TTLCache(max_entries=256, ttl_seconds=_CATALOG_CACHE_TTL_SECONDS)
+_property_index_cache = TTLCache(max_entries=32, ttl_seconds=_CATALOG_CACHE_TTL_SECONDS)
+_INDEX_PAGE_SIZE = 1000
+_EXPORT_CHUNK_SIZE = 200
+
+
+def invalidate_catalog_caches(rule_set_id: str | None = None) -> None:
+    for cache in (_definitions_cache, _property_index_cache):
+        if rule_set_id is None:
+            cache.clear()
+        else:
+            cache.discard_where(lambda key, _value: key[0] == rule_set_id)
+
 
 class ComponentCatalogService:
     async def get_sets(self, slug: str, rule_set_id: str) -> ComponentSetListResponse | None:
@@ -35,12 +61,12 @@ class ComponentCatalogService:
         if supabase.is_local():
             return ComponentSetListResponse(status="not_available", **base)
         try:
-            return await anyio.to_thread.run_sync(self._load_sets, game, rule_set_id, base)
+            return await self._load_sets(game, rule_set_id, base)
         except Exception as exc:
             logger.warning("Component catalog sets unavailable for %s/%s: %s", slug, rule_set_id, exc)
             return ComponentSetListResponse(status="not_available", **base)
 
-    async def list_components(
+    async def list_components(  # noqa: PLR0913, PLR0917 - mirrors the component list route's query parameters
         self,
         slug: str,
         rule_set_id: str,
@@ -48,6 +74,8 @@ class ComponentCatalogService:
         kind: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        where: list[str] | None = None,
+        sort: str | None = None,
     ) -> ComponentListResponse | None:
         game = await supabase.get_by_slug(slug)
         if not game:
@@ -56,8 +84,7 @@ class ComponentCatalogService:
         if supabase.is_local():
             return ComponentListResponse(status="not_available", limit=limit, offset=offset, **base)
         try:
-            return await anyio.to_thread.run_sync(
-                self._load_component_list,
+            return await self._load_component_list(
                 game,
                 rule_set_id,
                 component_set_id,
@@ -65,7 +92,11 @@ class ComponentCatalogService:
                 limit,
                 offset,
                 base,
+                where=where or [],
+                sort=sort,
             )
+        except ComponentQueryError:
+            raise
         except Exception as exc:
             logger.warning("Component list unavailable for %s/%s: %s", slug, rule_set_id, exc)
             return ComponentListResponse(status="not_available", limit=limit, offset=offset, **base)
@@ -77,60 +108,70 @@ class ComponentCatalogService:
         if supabase.is_local():
             return None
         try:
-            return await anyio.to_thread.run_sync(self._load_component_detail, game, rule_set_id, component_id)
+            with loader_scope():
+                return await self._load_component_detail(game, rule_set_id, component_id)
         except Exception as exc:
             logger.warning("Component detail unavailable for %s/%s/%s: %s", slug, rule_set_id, component_id, exc)
             return None
 
+    async def export_components(self, slug: str, rule_set_id: str) -> AsyncIterator[Component] | None:
+        """Return an iterator over every fully materialized component, or None when there is no catalog.
+
+        Availability is checked before the first component is produced so callers can still
+        answer 404; read failures after that propagate and abort the stream.
+        """
+        game = await supabase.get_by_slug(slug)
+        if not game or supabase.is_local():
+            return None
+        client = supabase._get_async_client()
+        try:
+            context = await self._context(client, game, rule_set_id)
+        except Exception as exc:
+            logger.warning("Component export unavailable for %s/%s: %s", slug, rule_set_id, exc)
+            return None
+        if context is None:
+            return None
+        return self._iter_components(client, rule_set_id, context["revision"])
+
     @staticmethod
-    def _context(client, game: dict, rule_set_id: str) -> dict | None:
-        rule_sets = (
+    async def _context(client, game: dict, rule_set_id: str) -> dict | None:
+        rule_sets, catalogs = await asyncio.gather(
             client.table("rule_sets")
             .select("id,game_id")
             .eq("id", rule_set_id)
             .eq("game_id", game["id"])
             .limit(1)
-            .execute()
-            .data
+            .execute(),
+            client.table("component_catalogs")
+            .select("id,updated_at")
+            .eq("rule_set_id", rule_set_id)
+            .limit(1)
+            .execute(),
         )
-        if not rule_sets:
-            return None
-        catalogs = client.table("component_catalogs").select("id").eq("rule_set_id", rule_set_id).limit(1).execute().data
-        if not catalogs:
+        if not rule_sets.data or not catalogs.data:
             return None
-        return {"catalog_id": catalogs[0]["id"], "rule_set_id": rule_set_id}
+        catalog = catalogs.data[0]
+        return {"catalog_id": catalog["id"], "rule_set_id": rule_set_id, "revision": catalog.get("updated_at")}
 
     @classmethod
-    def _load_sets(cls, game: dict, rule_set_id: str, base: dict) -> ComponentSetListResponse:
-        client = supabase._get_client()
-        context = cls._context(client, game, rule_set_id)
+    async def _load_sets(cls, game: dict, rule_set_id: str, base: dict) -> ComponentSetListResponse:
+        client = supabase._get_async_client()
+        context = await cls._context(client, game, rule_set_id)
         if context is None:
             return ComponentSetListResponse(status="not_available", **base)
-        set_rows = (
-            client.table("component_sets")
-            .select("*")
-            .eq("rule_set_id", rule_set_id)
-            .order("canonical_name")
-            .execute()
-            .data
-        )
-        definition_rows = (
-            client.table("component_property_definitions")
-            .select("*")
-            .eq("rule_set_id", rule_set_id)
-            .order("property_key")
-            .execute()
-            .data
+        set_rows, definitions = await asyncio.gather(
+            client.table("component_sets").select("*").eq("rule_set_id", rule_set_id).order("canonical_name").execute(),
+            cls._property_definitions(client, rule_set_id, context["revision"]),
         )
         return ComponentSetListResponse(
             status="available",
-            component_sets=[cls._set_model(row) for row in set_rows],
-            property_definitions=[cls._definition_model(row) for row in definition_rows],
+            component_sets=[cls._set_model(row) for row in set_rows.data],
+            property_definitions=list(definitions.values()),
             **base,
         )
 
     @classmethod
-    def _load_component_list(
+    async def _load_component_list(  # noqa: PLR0913, PLR0917
         cls,
         game: dict,
         rule_set_id: str,
@@ -139,17 +180,33 @@ class ComponentCatalogService:
         limit: int,
         offset: int,
         base: dict,
+        where: list[str] | None = None,
+        sort: str | None = None,
     ) -> ComponentListResponse:
-        client = supabase._get_client()
-        context = cls._context(client, game, rule_set_id)
+        client = supabase._get_async_client()
+        context = await cls._context(client, game, rule_set_id)
         if context is None:
             return ComponentListResponse(status="not_available", limit=limit, offset=offset, **base)
+        if where or sort:
+            definitions = await cls._property_definitions(client, rule_set_id, context["revision"])
+            predicates = parse_predicates(where or [], definitions)
+            property_sort = parse_sort(sort, definitions)
+            index = await cls._property_index(client, rule_set_id, context["revision"], definitions)
+            matches = index.query(predicates, property_sort, component_set_id=component_set_id, kind=kind)
+            return ComponentListResponse(
+                status="available",
+                components=matches[offset : offset + limit],
+                total=len(matches),
+                limit=limit,
+                offset=offset,
+                **base,
+            )
         query = client.table("components").select("*", count="exact").eq("rule_set_id", rule_set_id)
         if component_set_id:
             query = query.eq("component_set_id", component_set_id)
         if kind:
             query = query.eq("kind", kind)
-        response = query.order("canonical_name").range(offset, offset + limit - 1).execute()
+        response = await query.order("canonical_name").range(offset, offset + limit - 1).execute()
         items = [
             ComponentListItem(
                 component_id=row["component_id"],
@@ -171,37 +228,225 @@ class ComponentCatalogService:
         )
 
     @classmethod
-    def _load_component_detail(cls, game: dict, rule_set_id: str, component_id: str) -> ComponentDetailResponse | None:
-        client = supabase._get_client()
-        context = cls._context(client, game, rule_set_id)
+    async def _load_component_detail(cls, game: dict, rule_set_id: str, component_id: str) -> ComponentDetailResponse | None:
+        client = supabase._get_async_client()
+        context = await cls._context(client, game, rule_set_id)
         if context is None:
             return None
-        rows = (
+        # Everything below depends only on (rule_set_id, component_id), so it is read concurrently.
+        rows, definitions, property_rows, abilities, concept_rows, rule_rows = await asyncio.gather(
             client.table("components")
             .select("*")
             .eq("rule_set_id", rule_set_id)
             .eq("component_id", component_id)
             .limit(1)
-            .execute()
-            .data
-        )
-        if not rows:
-            return None
-        row = rows[0]
-        definitions = {
-            item["property_key"]: cls._definition_model(item)
-            for item in client.table("component_property_definitions").select("*").eq("rule_set_id", rule_set_id).execute().data
-        }
-        property_rows = (
+            .execute(),
+            cls._property_definitions(client, rule_set_id, context["revision"]),
             client.table("component_properties")
             .select("*")
             .eq("rule_set_id", rule_set_id)
             .eq("component_id", component_id)
             .order("property_key")
             .order("ordinal")
+            .execute(),
+            cls._load_abilities(client, rule_set_id, component_id),
+            client.table("component_concepts")
+            .select("concept_id")
+            .eq("rule_set_id", rule_set_id)
+            .eq("component_id", component_id)
+            .execute(),
+            client.table("component_rule_nodes")
+            .select("rule_id")
+            .eq("rule_set_id", rule_set_id)
+            .eq("component_id", component_id)
+            .execute(),
+        )
+        if not rows.data:
+            return None
+        component = cls._component_model(
+            rows.data[0],
+            rule_set_id,
+            definitions,
+            property_rows.data,
+            abilities,
+            concept_rows.data,
+            rule_rows.data,
+        )
+        return ComponentDetailResponse(
+            game_id=str(game["id"]),
+            slug=str(game["slug"]),
+            ruleset_id=rule_set_id,
+            component=component,
+        )
+
+    @classmethod
+    async def _iter_components(cls, client, rule_set_id: str, revision: str | None) -> AsyncIterator[Component]:
+        definitions = await cls._property_definitions(client, rule_set_id, revision)
+        after: str | None = None
+        while True:
+            # Keyset pagination on component_id: each page costs the same no matter how deep the deck is.
+            query = client.table("components").select("*").eq("rule_set_id", rule_set_id)
+            if after is not None:
+                query = query.gt("component_id", after)
+            rows = (await query.order("component_id").limit(_EXPORT_CHUNK_SIZE).execute()).data
+            if not rows:
+                return
+            for component in await cls._export_chunk(client, rule_set_id, definitions, rows):
+                yield component
+            if len(rows) < _EXPORT_CHUNK_SIZE:
+                return
+            after = rows[-1]["component_id"]
+
+    @classmethod
+    async def _export_chunk(
+        cls,
+        client,
+        rule_set_id: str,
+        definitions: dict[str, PropertyDefinition],
+        rows: list[dict],
+    ) -> list[Component]:
+        first, last = rows[0]["component_id"], rows[-1]["component_id"]
+
+        def window(table: str, columns: str, *order: str):
+            def make_query():
+                query = (
+                    client.table(table)
+                    .select(columns)
+                    .eq("rule_set_id", rule_set_id)
+                    .gte("component_id", first)
+                    .lte("component_id", last)
+                )
+                for column in ("component_id", *order):
+                    query = query.order(column)
+                return query
+
+            return cls._read_all(make_query)
+
+        property_rows, ability_rows, concept_rows, rule_rows = await asyncio.gather(
+            window("component_properties", "*", "property_key", "ordinal"),
+            window("component_abilities", "*", "ability_id"),
+            # Link rows are paged, so ties must break on the whole primary key or pages skip and repeat rows.
+            window("component_concepts", "component_id,concept_id", "concept_id", "reference_kind"),
+            window("component_rule_nodes", "component_id,rule_id", "rule_id", "reference_kind"),
+        )
+        # A registry per chunk keeps the loader caches from growing with the deck.
+        abilities = await cls._ability_models(LoaderRegistry(), rule_set_id, ability_rows)
+        grouped: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        for name, items in (("properties", property_rows), ("concepts", concept_rows), ("rules", rule_rows)):
+            for item in items:
+                grouped[item["component_id"]][name].append(item)
+        for ability_row, ability in zip(ability_rows, abilities, strict=True):
+            grouped[ability_row["component_id"]]["abilities"].append(ability)
+        components = []
+        for row in rows:
+            parts = grouped[row["component_id"]]
+            components.append(
+                cls._component_model(
+                    row,
+                    rule_set_id,
+                    definitions,
+                    parts["properties"],
+                    parts["abilities"],
+                    parts["concepts"],
+                    parts["rules"],
+                )
+            )
+        return components
+
+    @classmethod
+    def _component_model(
+        cls,
+        row: dict,
+        rule_set_id: str,
+        definitions: dict[str, PropertyDefinition],
+        property_rows: list[dict],
+        abilities: list[Ability],
+        concept_rows: list[dict],
+        rule_rows: list[dict],
+    ) -> Component:
+        return Component(
+            component_id=row["component_id"],
+            ruleset_id=rule_set_id,
+            component_set_id=row.get("component_set_id"),
+            canonical_name=row["canonical_name"],
+            kind=row["kind"],
+            quantity=row.get("quantity"),
+            properties=cls._build_properties(definitions, property_rows),
+            abilities=abilities,
+            concept_ids=sorted({item["concept_id"] for item in concept_rows}),
+            rule_ids=sorted({item["rule_id"] for item in rule_rows}),
+            verification_status=row.get("verification_status", "unknown"),
+            source_ids=row.get("source_ids") or [],
+        )
+
+    @classmethod
+    async def _property_definitions(
+        cls, client, rule_set_id: str, revision: str | None
+    ) -> dict[str, PropertyDefinition]:
+        hit, cached = _definitions_cache.lookup((rule_set_id, revision))
+        if hit:
+            return cached
+        definition_rows = (
+            await client.table("component_property_definitions")
+            .select("*")
+            .eq("rule_set_id", rule_set_id)
+            .order("property_key")
             .execute()
-            .data
+        ).data
+        definitions = {item["property_key"]: cls._definition_model(item) for item in definition_rows}
+        _definitions_cache.set((rule_set_id, revision), definitions)
+        return definitions
+
+    @classmethod
+    async def _property_index(
+        cls,
+        client,
+        rule_set_id: str,
+        revision: str | None,
+        definitions: dict[str, PropertyDefinition],
+    ) -> ComponentPropertyIndex:
+        hit, cached = _property_index_cache.lookup((rule_set_id, revision))
+        if hit:
+            return cached
+        component_rows, property_rows, concept_rows = await asyncio.gather(
+            cls._read_all(
+                lambda: client.table("components")
+                .select("component_id,component_set_id,canonical_name,kind,quantity,verification_status")
+                .eq("rule_set_id", rule_set_id)
+                .order("component_id")
+            ),
+            cls._read_all(
+                lambda: client.table("component_properties")
+                .select(f"component_id,property_key,ordinal,{','.join(VALUE_COLUMNS.values())}")
+                .eq("rule_set_id", rule_set_id)
+                .order("component_id")
+                .order("property_key")
+                .order("ordinal")
+            ),
+            cls._read_all(
+                lambda: client.table("component_concepts")
+                .select("component_id,concept_id")
+                .eq("rule_set_id", rule_set_id)
+                .order("component_id")
+                .order("concept_id")
+                .order("reference_kind")
+            ),
         )
+        index = ComponentPropertyIndex(component_rows, property_rows, concept_rows, definitions)
+        _property_index_cache.set((rule_set_id, revision), index)
+        return index
+
+    @staticmethod
+    async def _read_all(make_query) -> list[dict]:
+        rows: list[dict] = []
+        while True:
+            page = (await make_query().range(len(rows), len(rows) + _INDEX_PAGE_SIZE - 1).execute()).data
+            rows.extend(page)
+            if len(page) < _INDEX_PAGE_SIZE:
+                return rows
+
+    @classmethod
+    def _build_properties(cls, definitions: dict[str, PropertyDefinition], property_rows: list[dict]) -> list[ComponentProperty]:
         grouped: dict[str, list[dict]] = defaultdict(list)
         for prop_row in property_rows:
             grouped[prop_row["property_key"]].append(prop_row)
@@ -226,58 +471,34 @@ class ComponentCatalogService:
                     source_ids=source_ids,
                 )
             )
-
-        abilities = cls._load_abilities(client, rule_set_id, component_id)
-        concept_ids = [
-            item["concept_id"]
-            for item in client.table("component_concepts").select("concept_id").eq("rule_set_id", rule_set_id).eq("component_id", component_id).execute().data
-        ]
-        rule_ids = [
-            item["rule_id"]
-            for item in client.table("component_rule_nodes").select("rule_id").eq("rule_set_id", rule_set_id).eq("component_id", component_id).execute().data
-        ]
-        component = Component(
-            component_id=row["component_id"],
-            ruleset_id=rule_set_id,
-            component_set_id=row.get("component_set_id"),
-            canonical_name=row["canonical_name"],
-            kind=row["kind"],
-            quantity=row.get("quantity"),
-            properties=properties,
-            abilities=abilities,
-            concept_ids=sorted(set(concept_ids)),
-            rule_ids=sorted(set(rule_ids)),
-            verification_status=row.get("verification_status", "unknown"),
-            source_ids=row.get("source_ids") or [],
-        )
-        return ComponentDetailResponse(
-            game_id=str(game["id"]),
-            slug=str(game["slug"]),
-            ruleset_id=rule_set_id,
-            component=component,
-        )
+        return properties
 
     @classmethod
-    def _load_abilities(cls, client, rule_set_id: str, component_id: str) -> list[Ability]:
+    async def _load_abilities(cls, client, rule_set_id: str, component_id: str) -> list[Ability]:
         rows = (
-            client.table("component_abilities")
+            await client.table("component_abilities")
             .select("*")
             .eq("rule_set_id", rule_set_id)
             .eq("component_id", component_id)
             .order("ability_id")
             .execute()
-            .data
+        ).data
+        return await cls._ability_models(current_loaders(), rule_set_id, rows)
+
+    @staticmethod
+    async def _ability_models(loaders: LoaderRegistry, rule_set_id: str, rows: list[dict]) -> list[Ability]:
+        scoped = {"rule_set_id": rule_set_id}
+        concept_loader = loaders.rows("component_ability_concepts", "ability_id", select="concept_id", filters=scoped)
+        rule_loader = loaders.rows("component_ability_rule_nodes", "ability_id", select="rule_id", filters=scoped)
+        ability_ids = [row["ability_id"] for row in rows]
+        concept_rows_by_ability, rule_rows_by_ability = await asyncio.gather(
+            concept_loader.load_many(ability_ids),
+            rule_loader.load_many(ability_ids),
         )
         abilities: list[Ability] = []
-        for row in rows:
-            concept_ids = [
-                item["concept_id"]
-                for item in client.table("component_ability_concepts").select("concept_id").eq("rule_set_id", rule_set_id).eq("ability_id", row["ability_id"]).execute().data
-            ]
-            rule_ids = [
-                item["rule_id"]
-                for item in client.table("component_ability_rule_nodes").select("rule_id").eq("rule_set_id", rule_set_id).eq("ability_id", row["ability_id"]).execute().data
-            ]
+        for row, concept_rows, rule_rows in zip(rows, concept_rows_by_ability, rule_rows_by_ability, strict=True):
+            concept_ids = [item["concept_id"] for item in concept_rows]
+            rule_ids = [item["rule_id"] for item in rule_rows]
             abilities.append(
                 Ability(
                     ability_id=row["ability_id"],
@@ -10,6 +10,7 @@ from app.core import supabase
 from app.models.component_catalog import ComponentVerificationStatus
 from app.models.component_ingestion import ComponentSourceManifest
 from app.models.evidence import ClaimTarget, EvidenceTargetType
+from app.services.component_catalog import invalidate_catalog_caches
 from app.services.component_ingestion import ComponentIngestionDryRun
 
 
@@ -382,6 +383,7 @@ class ComponentIngestionRepository:
         if not isinstance(response, dict):
             raise ComponentIngestionReadbackError("component ingestion RPC returned an invalid response")
         result = ComponentIngestionApplyResult.model_validate(response)
+        invalidate_catalog_caches(resolved.ruleset_id)
         self.verify_readback(manifest, resolved, payload)
         return result
 
@@ -0,0 +1,193 @@
+import operator
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.models.component_catalog import ComponentListItem, PropertyDefinition, PropertyValueType
+
+HAS_CONCEPT = "has_concept"
+MAX_PREDICATES = 8
+
+_PREDICATE_PATTERN = re.compile(r"^(?P<key>[a-z][a-z0-9_.:-]{1,127})(?P<op><=|>=|!=|<|>|=)(?P<value>.{1,200})$")
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_ORDERED_TYPES = {PropertyValueType.INTEGER, PropertyValueType.NUMBER}
+# component_properties keeps one typed column per value_type.
+VALUE_COLUMNS = {
+    PropertyValueType.TEXT: "text_value",
+    PropertyValueType.INTEGER: "integer_value",
+    PropertyValueType.NUMBER: "number_value",
+    PropertyValueType.BOOLEAN: "boolean_value",
+    PropertyValueType.ENUM: "enum_value",
+    PropertyValueType.CONCEPT_REF: "concept_ref_id",
+    PropertyValueType.COMPONENT_REF: "component_ref_id",
+}
+
+
+class ComponentQueryError(ValueError):
+    """Raised when a property predicate or sort does not match the rule set's definitions."""
+
+
+@dataclass(frozen=True)
+class PropertyPredicate:
+    property_key: str
+    op: str
+    value: Any
+
+    def matches(self, values: tuple) -> bool:
+        compare = _OPERATORS[self.op]
+        if self.op == "!=":
+            return all(compare(item, self.value) for item in values)
+        return any(item is not None and compare(item, self.value) for item in values)
+
+
+@dataclass(frozen=True)
+class PropertySort:
+    property_key: str
+    descending: bool = False
+
+
+def _coerce(definition: PropertyDefinition, raw: str) -> Any:
+    value_type = definition.value_type
+    try:
+        if value_type == PropertyValueType.INTEGER:
+            return int(raw)
+        if value_type == PropertyValueType.NUMBER:
+            return float(raw)
+    except ValueError as exc:
+        raise ComponentQueryError(f"{definition.property_key} expects a {value_type.value} value") from exc
+    if value_type == PropertyValueType.BOOLEAN:
+        if raw not in {"true", "false"}:
+            raise ComponentQueryError(f"{definition.property_key} expects true or false")
+        return raw == "true"
+    if value_type == PropertyValueType.ENUM and raw not in definition.enum_values:
+        raise ComponentQueryError(f"{raw} is not a value of {definition.property_key}")
+    return raw
+
+
+def parse_predicates(expressions: list[str], definitions: dict[str, PropertyDefinition]) -> list[PropertyPredicate]:
+    if len(expressions) > MAX_PREDICATES:
+        raise ComponentQueryError(f"at most {MAX_PREDICATES} property predicates are supported")
+    predicates: list[PropertyPredicate] = []
+    for expression in expressions:
+        match = _PREDICATE_PATTERN.match(expression.strip())
+        if match is None:
+            raise ComponentQueryError(f"invalid property predicate: {expression}")
+        key, op, raw = match["key"], match["op"], match["value"]
+        if key == HAS_CONCEPT:
+            if op != "=":
+                raise ComponentQueryError("has_concept only supports =")
+            predicates.append(PropertyPredicate(HAS_CONCEPT, op, raw))
+            continue
+        definition = definitions.get(key)
+        if definition is None or not definition.filterable:
+            raise ComponentQueryError(f"{key} is not a filterable property")
+        if op not in {"=", "!="} and definition.value_type not in _ORDERED_TYPES:
+            raise ComponentQueryError(f"{key} only supports = and !=")
+        predicates.append(PropertyPredicate(key, op, _coerce(definition, raw)))
+    return predicates
+
+
+def parse_sort(expression: str | None, definitions: dict[str, PropertyDefinition]) -> PropertySort | None:
+    if not expression:
+        return None
+    descending = expression.startswith("-")
+    key = expression.removeprefix("-")
+    if key == "canonical_name":
+        return PropertySort(key, descending)
+    definition = definitions.get(key)
+    if definition is None or not definition.sortable:
+        raise ComponentQueryError(f"{key} is not a sortable property")
+    return PropertySort(key, descending)
+
+
+class ComponentPropertyIndex:
+    """Columnar, read-only view of one rule set's components and typed property values.
+
+    Row ``i`` of every column describes ``items[i]``; each property column holds a
+    tuple of values per component (empty when the component lacks the property).
+    NULL typed values are dropped, so they sort last and never satisfy a comparison.
+    """
+
+    def __init__(
+        self,
+        component_rows: list[dict],
+        property_rows: list[dict],
+        concept_rows: list[dict],
+        definitions: dict[str, PropertyDefinition],
+    ):
+        self.items = [
+            ComponentListItem(
+                component_id=row["component_id"],
+                component_set_id=row.get("component_set_id"),
+                canonical_name=row["canonical_name"],
+                kind=row["kind"],
+                quantity=row.get("quantity"),
+                verification_status=row.get("verification_status", "unknown"),
+            )
+            for row in component_rows
+        ]
+        position = {item.component_id: index for index, item in enumerate(self.items)}
+        self.names = [item.canonical_name for item in self.items]
+        self.component_set_ids = [item.component_set_id for item in self.items]
+        self.kinds = [item.kind.value for item in self.items]
+
+        collected: dict[str, list[list]] = {}
+        for row in sorted(property_rows, key=lambda item: item.get("ordinal") or 0):
+            index = position.get(row["component_id"])
+            definition = definitions.get(row["property_key"])
+            if index is None or definition is None:
+                continue
+            value = row.get(VALUE_COLUMNS[definition.value_type])
+            column = collected.setdefault(row["property_key"], [[] for _ in self.items])
+            if value is not None:
+                column[index].append(value)
+        self.columns: dict[str, list[tuple]] = {
+            key: [tuple(values) for values in column] for key, column in collected.items()
+        }
+
+        concepts: list[set[str]] = [set() for _ in self.items]
+        for row in concept_rows:
+            index = position.get(row["component_id"])
+            if index is not None:
+                concepts[index].add(row["concept_id"])
+        self.concepts = [frozenset(values) for values in concepts]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def query(
+        self,
+        predicates: list[PropertyPredicate],
+        sort: PropertySort | None,
+        component_set_id: str | None = None,
+        kind: str | None = None,
+    ) -> list[ComponentListItem]:
+        positions = range(len(self.items))
+        if component_set_id:
+            positions = [index for index in positions if self.component_set_ids[index] == component_set_id]
+        if kind:
+            positions = [index for index in positions if self.kinds[index] == kind]
+        for predicate in predicates:
+            if predicate.property_key == HAS_CONCEPT:
+                positions = [index for index in positions if predicate.value in self.concepts[index]]
+                continue
+            column = self.columns.get(predicate.property_key)
+            positions = [index for index in positions if predicate.matches(column[index] if column else ())]
+        positions = sorted(positions, key=lambda index: (self.names[index], self.items[index].component_id))
+        if sort is not None and sort.property_key != "canonical_name":
+            column = self.columns.get(sort.property_key) or [() for _ in self.items]
+            present = [index for index in positions if column[index]]
+            missing = [index for index in positions if not column[index]]
+            # Stable sort keeps canonical_name order among ties; components without the property go last.
+            positions = sorted(present, key=lambda index: column[index][0], reverse=sort.descending) + missing
+        elif sort is not None and sort.descending:
+            positions = positions[::-1]
+        return [self.items[index] for index in positions]
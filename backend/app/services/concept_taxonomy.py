@@ -1,8 +1,8 @@
+import asyncio
 import logging
 
-import anyio
-
 from app.core import supabase
+from app.core.dataloader import current_loaders, loader_scope
 from app.models.concept_taxonomy import (
     Concept,
     ConceptDetailResponse,
@@ -24,7 +24,7 @@ class ConceptTaxonomyService:
         if supabase.is_local():
             return None
         try:
-            return await anyio.to_thread.run_sync(self._load_concept, concept_id)
+            return await self._load_concept(concept_id)
         except Exception as exc:
             logger.warning("Concept taxonomy unavailable for %s: %s", concept_id, exc)
             return None
@@ -37,7 +37,7 @@ class ConceptTaxonomyService:
         if supabase.is_local():
             return GameConceptsReadResponse(status="not_available", **base)
         try:
-            return await anyio.to_thread.run_sync(self._load_game_concepts, game, base)
+            return await self._load_game_concepts(game, base)
         except Exception as exc:
             logger.warning("Concept projection unavailable for %s: %s", slug, exc)
             return GameConceptsReadResponse(status="not_available", **base)
@@ -54,11 +54,7 @@ class ConceptTaxonomyService:
         if supabase.is_local():
             return GameGlossaryReadResponse(status="not_available", **base)
         try:
-            concepts = await anyio.to_thread.run_sync(
-                self._load_game_concepts,
-                game,
-                {"game_id": base["game_id"], "slug": base["slug"]},
-            )
+            concepts = await self._load_game_concepts(game, {"game_id": base["game_id"], "slug": base["slug"]})
         except Exception as exc:
             logger.warning("Glossary projection unavailable for %s: %s", slug, exc)
             return GameGlossaryReadResponse(status="not_available", **base)
@@ -90,40 +86,26 @@ class ConceptTaxonomyService:
         return GameGlossaryReadResponse(status="available", entries=entries, **base)
 
     @classmethod
-    def _load_concept(cls, concept_id: str) -> ConceptDetailResponse | None:
-        client = supabase._get_client()
-        detail = cls._load_concept_core(client, concept_id)
-        if detail is None:
-            return None
-        backlinks = cls._load_game_backlinks(client, concept_id)
+    async def _load_concept(cls, concept_id: str) -> ConceptDetailResponse | None:
+        with loader_scope():
+            detail = await cls._load_concept_core(concept_id)
+            if detail is None:
+                return None
+            backlinks = await cls._load_game_backlinks(concept_id)
         return detail.model_copy(update={"game_backlinks": backlinks})
 
     @classmethod
-    def _load_concept_core(cls, client, concept_id: str) -> ConceptDetailResponse | None:
-        rows = client.table("concepts").select("*").eq("concept_id", concept_id).limit(1).execute().data
-        if not rows:
+    async def _load_concept_core(cls, concept_id: str) -> ConceptDetailResponse | None:
+        loaders = current_loaders()
+        row = await loaders.rows("concepts", "concept_id").load_one(concept_id)
+        if row is None:
             return None
-        row = rows[0]
-        label_rows = (
-            client.table("concept_labels")
-            .select("language_code,label_type,label,normalized_label")
-            .eq("concept_id", concept_id)
-            .execute()
-            .data
-        )
-        outgoing = (
-            client.table("concept_relations")
-            .select("*")
-            .eq("from_concept_id", concept_id)
-            .execute()
-            .data
-        )
-        incoming = (
-            client.table("concept_relations")
-            .select("*")
-            .eq("to_concept_id", concept_id)
-            .execute()
-            .data
+        label_rows, outgoing, incoming = await asyncio.gather(
+            loaders.rows("concept_labels", "concept_id", select="language_code,label_type,label,normalized_label").load(
+                concept_id
+            ),
+            loaders.rows("concept_relations", "from_concept_id").load(concept_id),
+            loaders.rows("concept_relations", "to_concept_id").load(concept_id),
         )
         relation_rows = {str(item["id"]): item for item in [*outgoing, *incoming]}.values()
         concept = Concept(
@@ -151,21 +133,24 @@ class ConceptTaxonomyService:
         return ConceptDetailResponse(concept=concept, relations=relations)
 
     @classmethod
-    def _load_game_concepts(cls, game: dict, base: dict) -> GameConceptsReadResponse:
-        client = supabase._get_client()
+    async def _load_game_concepts(cls, game: dict, base: dict) -> GameConceptsReadResponse:
+        client = supabase._get_async_client()
         links = (
-            client.table("game_concepts")
+            await client.table("game_concepts")
             .select("concept_id,usage_role,verification_status")
             .eq("game_id", game["id"])
             .execute()
-            .data
-        )
+        ).data
         if not links:
             return GameConceptsReadResponse(status="not_available", **base)
 
+        with loader_scope():
+            details, rule_reference_lists = await asyncio.gather(
+                asyncio.gather(*(cls._load_concept_core(link["concept_id"]) for link in links)),
+                asyncio.gather(*(cls._load_rule_references(str(game["id"]), link["concept_id"]) for link in links)),
+            )
         references: list[GameConceptReference] = []
-        for link in links:
-            detail = cls._load_concept_core(client, link["concept_id"])
+        for link, detail, rule_references in zip(links, details, rule_reference_lists, strict=True):
             if detail is None:
                 continue
             preferred_labels = {
@@ -184,7 +169,6 @@ class ConceptTaxonomyService:
                     if relation.relation_type.value == "related"
                 }
             )
-            rule_references = cls._load_rule_references(client, str(game["id"]), link["concept_id"])
             references.append(
                 GameConceptReference(
                     concept_id=detail.concept.concept_id,
@@ -203,38 +187,27 @@ class ConceptTaxonomyService:
         return GameConceptsReadResponse(status="available", concepts=references, **base)
 
     @classmethod
-    def _load_rule_references(cls, client, game_id: str, concept_id: str) -> list[RuleConceptReference]:
-        rule_sets = (
-            client.table("rule_sets")
-            .select("id")
-            .eq("game_id", game_id)
-            .eq("is_active", True)
-            .limit(1)
-            .execute()
-            .data
-        )
+    async def _load_rule_references(cls, game_id: str, concept_id: str) -> list[RuleConceptReference]:
+        loaders = current_loaders()
+        rule_sets = await loaders.rows("rule_sets", "game_id", select="id", filters={"is_active": True}).load(game_id)
         if not rule_sets:
             return []
         rule_set_id = rule_sets[0]["id"]
-        links = (
-            client.table("rule_node_concepts")
-            .select("rule_id,reference_kind,verification_status")
-            .eq("rule_set_id", rule_set_id)
-            .eq("concept_id", concept_id)
-            .execute()
-            .data
-        )
+        scoped = {"rule_set_id": rule_set_id}
+        links = await loaders.rows(
+            "rule_node_concepts",
+            "concept_id",
+            select="rule_id,reference_kind,verification_status",
+            filters=scoped,
+        ).load(concept_id)
+        node_lists = await loaders.rows(
+            "rule_nodes",
+            "rule_id",
+            select="rule_id,node_type,normalized_statement",
+            filters=scoped,
+        ).load_many(link["rule_id"] for link in links)
         references: list[RuleConceptReference] = []
-        for link in links:
-            nodes = (
-                client.table("rule_nodes")
-                .select("rule_id,node_type,normalized_statement")
-                .eq("rule_set_id", rule_set_id)
-                .eq("rule_id", link["rule_id"])
-                .limit(1)
-                .execute()
-                .data
-            )
+        for link, nodes in zip(links, node_lists, strict=True):
             if not nodes:
                 continue
             node = nodes[0]
@@ -250,21 +223,20 @@ class ConceptTaxonomyService:
         return references
 
     @classmethod
-    def _load_game_backlinks(cls, client, concept_id: str) -> list[ConceptGameBacklink]:
-        links = (
-            client.table("game_concepts")
-            .select("game_id,usage_role")
-            .eq("concept_id", concept_id)
-            .execute()
-            .data
-        )
+    async def _load_game_backlinks(cls, concept_id: str) -> list[ConceptGameBacklink]:
+        loaders = current_loaders()
+        links = await loaders.rows("game_concepts", "concept_id", select="game_id,usage_role").load(concept_id)
         by_game: dict[str, list[str]] = {}
         for link in links:
             by_game.setdefault(str(link["game_id"]), []).append(link["usage_role"])
 
+        game_ids = list(by_game)
+        game_lists, rule_reference_lists = await asyncio.gather(
+            loaders.rows("games", "id", select="id,slug,title").load_many(game_ids),
+            asyncio.gather(*(cls._load_rule_references(game_id, concept_id) for game_id in game_ids)),
+        )
         backlinks: list[ConceptGameBacklink] = []
-        for game_id, usage_roles in by_game.items():
-            games = client.table("games").select("id,slug,title").eq("id", game_id).limit(1).execute().data
+        for game_id, games, rule_references in zip(game_ids, game_lists, rule_reference_lists, strict=True):
             if not games:
                 continue
             game = games[0]
@@ -273,8 +245,8 @@ class ConceptTaxonomyService:
                     game_id=str(game["id"]),
                     slug=str(game["slug"]),
                     title=game.get("title"),
-                    usage_roles=sorted(set(usage_roles)),
-                    rule_references=cls._load_rule_references(client, game_id, concept_id),
+                    usage_roles=sorted(set(by_game[game_id])),
+                    rule_references=rule_references,
                 )
             )
         return sorted(backlinks, key=lambda item: item.slug)
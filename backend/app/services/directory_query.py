@@ -1,26 +1,37 @@
+import asyncio
+import hashlib
+import json
+import logging
 import unicodedata
 from typing import Any, Literal
 
-import anyio
-
 from app.core import local_db, supabase
+from app.core.keyset import CursorError, SeekKey, decode_cursor, encode_cursor, postgrest_seek_filter
+from app.core.search_text import normalize_lookup
+from app.core.ttl_cache import TTLCache
 
 DirectorySort = Literal["recent", "title", "year", "play_time"]
 DirectoryTime = Literal["30-", "30-60", "60-120", "120+"]
 
+logger = logging.getLogger("services.directory_query")
 
-def _normalize(value: str | None) -> str:
-    return unicodedata.normalize("NFKC", value or "").casefold().strip()
+# Paging through one search re-reads the cached candidates / filtered ranked id list instead of re-running it.
+_RANKED_IDS_TTL_SECONDS = 30.0
+_ranked_ids_cache = TTLCache(max_entries=256, ttl_seconds=_RANKED_IDS_TTL_SECONDS)
+_TOTALS_TTL_SECONDS = 60.0
+_totals_cache = TTLCache(max_entries=256, ttl_seconds=_TOTALS_TTL_SECONDS)
+_FACET_INDEX_TTL_SECONDS = 60.0
+_facet_index_cache = TTLCache(max_entries=1, ttl_seconds=_FACET_INDEX_TTL_SECONDS)
+_PLAYER_FACETS = ("1", "2", "3", "4", "5+")
+_TIME_FACETS: tuple[DirectoryTime, ...] = ("30-", "30-60", "60-120", "120+")
+# Games whose max_players reaches this count fall in the "5+" player facet.
+_MANY_PLAYERS = 5
+# Inclusive upper bound in minutes of each bounded play time facet, shortest first; longer games are "120+".
+_TIME_BUCKET_LIMITS: tuple[tuple[int, DirectoryTime], ...] = ((30, "30-"), (60, "30-60"), (120, "60-120"))
 
 
-def _matches_query(game: dict[str, Any], query: str) -> bool:
-    needle = _normalize(query)
-    if not needle:
-        return True
-    return any(
-        needle in _normalize(str(game.get(field) or ""))
-        for field in ("title", "title_ja", "title_en", "summary", "description")
-    )
+def _normalize(value: str | None) -> str:
+    return unicodedata.normalize("NFKC", value or "").casefold().strip()
 
 
 def _matches_players(game: dict[str, Any], players: str | None) -> bool:
@@ -78,49 +89,227 @@ def _filter_rows(
     ]
 
 
-def _query_ranked_search_results(
+def _time_bucket(play_time: int) -> DirectoryTime:
+    for limit, bucket in _TIME_BUCKET_LIMITS:
+        if play_time <= limit:
+            return bucket
+    return "120+"
+
+
+def _bitset(positions: list[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+class DirectoryFacetIndex:
+    """One bitset per facet value over the whole catalog; bit ``i`` stands for ``ids[i]``.
+
+    Filters and counts are big-int AND + ``bit_count``, so a 50k-game catalog costs a few
+    microseconds per facet value instead of a count query each.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.ids = [str(row["id"]) for row in rows]
+        self.positions = {game_id: index for index, game_id in enumerate(self.ids)}
+        self.everything = (1 << len(rows)) - 1
+        positions: dict[str, dict[str, list[int]]] = {
+            "players": {value: [] for value in _PLAYER_FACETS},
+            "time": {value: [] for value in _TIME_FACETS},
+            "tier": {},
+        }
+        # One pass with the bucket rules of _matches_players / _matches_time inlined; per-value predicate
+        # calls would cost ~13 calls per game.
+        for index, row in enumerate(rows):
+            minimum, maximum = row.get("min_players"), row.get("max_players")
+            if isinstance(minimum, int) and isinstance(maximum, int) and minimum > 0 and maximum > 0:
+                for count in range(minimum, min(maximum, _MANY_PLAYERS - 1) + 1):
+                    positions["players"][str(count)].append(index)
+                if maximum >= _MANY_PLAYERS:
+                    positions["players"]["5+"].append(index)
+            play_time = row.get("play_time")
+            if isinstance(play_time, int) and play_time > 0:
+                positions["time"][_time_bucket(play_time)].append(index)
+            if row.get("strategy_tier"):
+                positions["tier"].setdefault(str(row["strategy_tier"]), []).append(index)
+        positions["tier"] = dict(sorted(positions["tier"].items()))
+        self.bitsets: dict[str, dict[str, int]] = {
+            facet: {value: _bitset(members, len(rows)) for value, members in values.items()}
+            for facet, values in positions.items()
+        }
+
+    def mask(self, ids: list[str]) -> int:
+        return _bitset([self.positions[game_id] for game_id in ids if game_id in self.positions], len(self.ids))
+
+    def counts(self, selected: dict[str, str | None], base: int | None = None) -> dict[str, dict[str, int]]:
+        base = self.everything if base is None else base
+        counts: dict[str, dict[str, int]] = {}
+        for facet, values in self.bitsets.items():
+            scope = base
+            for other, value in selected.items():
+                if other != facet and value:
+                    scope &= self.bitsets[other].get(value, 0)
+            counts[facet] = {value: (scope & bits).bit_count() for value, bits in values.items()}
+        return counts
+
+
+async def _facet_index() -> DirectoryFacetIndex:
+    hit, index = _facet_index_cache.lookup("catalog")
+    if not hit:
+        index = DirectoryFacetIndex(await supabase.catalog_projection())
+        _facet_index_cache.set("catalog", index)
+    return index
+
+
+async def _directory_facets(
+    q: str | None,
+    *,
+    players: str | None,
+    time_filter: DirectoryTime | None,
+    tier: str | None,
+) -> dict[str, dict[str, int]]:
+    try:
+        index = await _facet_index()
+        base = None
+        if q and q.strip():
+            candidates = await _search_candidates(q.strip())
+            if candidates is None:
+                return {}
+            base = index.mask([str(game["id"]) for game in candidates])
+        return index.counts({"players": players, "time": time_filter, "tier": tier}, base)
+    except Exception as exc:
+        logger.warning("Directory facets unavailable: %s", exc)
+        return {}
+
+
+def _rank_filtered(
     rows: list[dict[str, Any]],
     *,
     players: str | None,
     time_filter: DirectoryTime | None,
     tier: str | None,
     sort: DirectorySort,
-    limit: int,
-    offset: int,
-) -> dict[str, Any]:
-    """Filter canonical ranked search results without replacing relevance with recent order."""
+) -> list[dict[str, Any]]:
     filtered = _filter_rows(rows, players=players, time_filter=time_filter, tier=tier)
     if sort != "recent":
         reverse = sort == "year"
         filtered.sort(key=lambda game: _sort_key(game, sort), reverse=reverse)
-    return {"data": filtered[offset : offset + limit], "total": len(filtered)}
+    return filtered
+
 
+async def _search_candidates(q: str) -> list[dict[str, Any]] | None:
+    key = (normalize_lookup(q),)
+    hit, cached = _ranked_ids_cache.lookup(key)
+    if hit:
+        return cached
+    candidates = await supabase.search_candidates(q)
+    if candidates is not None:
+        _ranked_ids_cache.set(key, candidates)
+    return candidates
 
-def _query_local(
+
+async def _ranked_search_ids(
+    q: str,
+    *,
+    players: str | None,
+    time_filter: DirectoryTime | None,
+    tier: str | None,
+    sort: DirectorySort,
+) -> list[str] | None:
+    """Return every matching id after filters, in relevance (or requested) order; None if search is degraded."""
+    key = (normalize_lookup(q), players, time_filter, tier, sort)
+    hit, cached = _ranked_ids_cache.lookup(key)
+    if hit:
+        return cached
+    candidates = await _search_candidates(q)
+    if candidates is None:
+        return None
+    ranked = _rank_filtered(candidates, players=players, time_filter=time_filter, tier=tier, sort=sort)
+    ids = [str(game["id"]) for game in ranked]
+    _ranked_ids_cache.set(key, ids)
+    return ids
+
+
+# Keyset orders; the unique id key last makes every cursor position unambiguous. Local sorts keep
+# updated_at DESC ahead of id, the order the former full-table read was stable against.
+_CLOUD_KEYS: dict[str, tuple[SeekKey, ...]] = {
+    "recent": (SeekKey("created_at", desc=True), SeekKey("id")),
+    "title": (SeekKey("title_ja"), SeekKey("title"), SeekKey("id")),
+    "year": (SeekKey("published_year", desc=True), SeekKey("id")),
+    "play_time": (SeekKey("play_time"), SeekKey("id")),
+}
+_LOCAL_KEYS: dict[str, tuple[SeekKey, ...]] = {
+    "recent": (SeekKey("created_at", desc=True), SeekKey("updated_at", desc=True), SeekKey("id")),
+    "title": (
+        SeekKey("nfkc_casefold(COALESCE(NULLIF(title_ja, ''), NULLIF(title, ''), ''))"),
+        SeekKey("updated_at", desc=True),
+        SeekKey("id"),
+    ),
+    "year": (SeekKey("published_year", desc=True), SeekKey("updated_at", desc=True), SeekKey("id")),
+    "play_time": (
+        SeekKey("(play_time IS NULL OR play_time <= 0)"),
+        SeekKey("play_time"),
+        SeekKey("updated_at", desc=True),
+        SeekKey("id"),
+    ),
+}
+_LOCAL_TIME_CONDITIONS: dict[str, str] = {
+    "30-": "play_time > 0 AND play_time <= 30",
+    "30-60": "play_time > 30 AND play_time <= 60",
+    "60-120": "play_time > 60 AND play_time <= 120",
+    "120+": "play_time > 120",
+}
+
+
+def _query_local(  # noqa: PLR0913 - one keyword per directory filter and paging input
     *,
-    q: str | None,
     players: str | None,
     time_filter: DirectoryTime | None,
     tier: str | None,
     sort: DirectorySort,
     limit: int,
     offset: int,
+    after: list[Any] | None = None,
+    count: bool = True,
 ) -> dict[str, Any]:
-    rows = local_db.list_recent(limit=50000, offset=0)["data"]
-    filtered = [
-        game
-        for game in rows
-        if _matches_query(game, q or "")
-        and _matches_players(game, players)
-        and _matches_time(game, time_filter)
-        and (not tier or game.get("strategy_tier") == tier)
-    ]
-    reverse = sort in {"recent", "year"}
-    filtered.sort(key=lambda game: _sort_key(game, sort), reverse=reverse)
-    return {"data": filtered[offset : offset + limit], "total": len(filtered)}
+    """Translate directory filters into parameterized SQLite so only the requested page is read."""
+    conditions: list[str] = []
+    params: list[Any] = []
+    if players:
+        conditions.append("min_players > 0 AND max_players > 0")
+        if players == "5+":
+            conditions.append("max_players >= 5")
+        else:
+            conditions.append("min_players <= ? AND max_players >= ?")
+            params.extend([int(players)] * 2)
+    if time_filter:
+        conditions.append(_LOCAL_TIME_CONDITIONS[time_filter])
+    if tier:
+        conditions.append("strategy_tier = ?")
+        params.append(tier)
+    return local_db.list_games_page(conditions, params, _LOCAL_KEYS[sort], limit, offset, after=after, count=count)
+
+
+def _cursor_scope(sort: DirectorySort, q: str | None, players: str | None, time_filter: str | None, tier: str | None):
+    # Binds a cursor to the listing that issued it, so a changed filter cannot resume at a foreign position.
+    filters = json.dumps([normalize_lookup(q), players, time_filter, tier], ensure_ascii=False)
+    return f"games:{sort}:{hashlib.sha1(filters.encode('utf-8')).hexdigest()[:12]}"
+
+
+def _slice_ranked(ids: list[str], *, scope: str, cursor: str | None, offset: int, limit: int):
+    start = offset
+    if cursor:
+        (last_id,) = decode_cursor(cursor, scope, 1)
+        if last_id not in ids:
+            raise CursorError("cursor expired; restart from the first page")
+        start = ids.index(last_id) + 1
+    page = ids[start : start + limit]
+    next_cursor = encode_cursor(scope, [page[-1]]) if page and start + limit < len(ids) else None
+    return page, next_cursor
 
 
-async def list_directory_games(
+async def list_directory_games(  # noqa: PLR0913
     *,
     q: str | None = None,
     players: str | None = None,
@@ -129,64 +318,143 @@ async def list_directory_games(
     sort: DirectorySort = "recent",
     limit: int = 48,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
-    """Return one filtered directory page without loading the full catalog into the browser."""
+    """Return one filtered directory page without loading the full catalog into the browser.
+
+    ``cursor`` (a previous response's ``next_cursor``) resumes by seek predicate and takes precedence over
+    ``offset``; it raises ``CursorError`` when it was issued for a different sort or filter set.
+    """
+    page = await _directory_page(
+        q=q,
+        players=players,
+        time_filter=time_filter,
+        tier=tier,
+        sort=sort,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    # Runs after the page so a q search reuses the candidates the page just cached.
+    facets = await _directory_facets(q, players=players, time_filter=time_filter, tier=tier)
+    return {**page, "facets": facets}
+
+
+async def _directory_page(  # noqa: PLR0913
+    *,
+    q: str | None,
+    players: str | None,
+    time_filter: DirectoryTime | None,
+    tier: str | None,
+    sort: DirectorySort,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+) -> dict[str, Any]:
+    scope = _cursor_scope(sort, q, players, time_filter, tier)
     if q and q.strip():
-        ranked = await supabase.search(q.strip())
-        return _query_ranked_search_results(
-            ranked,
+        ids = await _ranked_search_ids(q.strip(), players=players, time_filter=time_filter, tier=tier, sort=sort)
+        rows_by_id: dict[str, dict[str, Any]] | None = None
+        if ids is None:
+            ranked = _rank_filtered(
+                await supabase.search(q.strip()), players=players, time_filter=time_filter, tier=tier, sort=sort
+            )
+            rows_by_id = {str(game["id"]): game for game in ranked}
+            ids = list(rows_by_id)
+        page_ids, next_cursor = _slice_ranked(ids, scope=scope, cursor=cursor, offset=offset, limit=limit)
+        data = (
+            [rows_by_id[game_id] for game_id in page_ids]
+            if rows_by_id is not None
+            else await supabase.get_by_ids(page_ids)
+        )
+        return {"data": data, "total": len(ids), "next_cursor": next_cursor}
+
+    local = supabase.is_local()
+    keys = _LOCAL_KEYS[sort] if local else _CLOUD_KEYS[sort]
+    after = decode_cursor(cursor, scope, len(keys)) if cursor else None
+    # Only a first page counts exactly; later pages reuse that total while it is fresh.
+    total_key = (local, players, time_filter, tier)
+    hit, total = _totals_cache.lookup(total_key) if after is not None or offset else (False, None)
+
+    if local:
+        page = _query_local(
             players=players,
             time_filter=time_filter,
             tier=tier,
             sort=sort,
             limit=limit,
             offset=offset,
+            after=after,
+            count=not hit,
         )
-
-    if supabase.is_local():
-        local_db.init_db()
-        return _query_local(
-            q=None,
+        rows, counted, last_key = page["data"], page["total"], page["last_key"]
+    else:
+        rows, counted = await _query_cloud(
+            keys,
             players=players,
             time_filter=time_filter,
             tier=tier,
-            sort=sort,
             limit=limit,
             offset=offset,
+            after=after,
+            count=not hit,
         )
+        last_key = [rows[-1].get(key.column) for key in keys] if rows else None
+    if not hit:
+        total = counted or 0
+        _totals_cache.set(total_key, total)
+    next_cursor = encode_cursor(scope, last_key) if last_key and len(rows) == limit else None
+    return {"data": rows, "total": total, "next_cursor": next_cursor}
+
+
+async def _query_cloud(  # noqa: PLR0913
+    keys: tuple[SeekKey, ...],
+    *,
+    players: str | None,
+    time_filter: DirectoryTime | None,
+    tier: str | None,
+    limit: int,
+    offset: int,
+    after: list[Any] | None,
+    count: bool,
+) -> tuple[list[dict[str, Any]], int | None]:
+    client = supabase._get_async_client()
+    # A seek page's own count would only cover the rows after the cursor.
+    query = client.table("games").select("*", count="exact" if count and after is None else None)
+    query = _cloud_filters(query, players=players, time_filter=time_filter, tier=tier)
+    for key in keys:
+        query = query.order(key.column, desc=key.desc, nullsfirst=False)
+
+    if after is None:
+        result = await query.range(offset, offset + limit - 1).execute()
+        return result.data, result.count
+    page = query.or_(postgrest_seek_filter(keys, after)).limit(limit).execute()
+    if not count:
+        return (await page).data, None
+    head = client.table("games").select("id", count="exact", head=True)
+    result, counted = await asyncio.gather(
+        page, _cloud_filters(head, players=players, time_filter=time_filter, tier=tier).execute()
+    )
+    return result.data, counted.count
 
-    def _q() -> dict[str, Any]:
-        query = supabase._get_client().table("games").select("*", count="exact")
-
-        if players:
-            if players == "5+":
-                query = query.gte("max_players", 5)
-            else:
-                player_count = int(players)
-                query = query.lte("min_players", player_count).gte("max_players", player_count)
-
-        if time_filter == "30-":
-            query = query.gt("play_time", 0).lte("play_time", 30)
-        elif time_filter == "30-60":
-            query = query.gt("play_time", 30).lte("play_time", 60)
-        elif time_filter == "60-120":
-            query = query.gt("play_time", 60).lte("play_time", 120)
-        elif time_filter == "120+":
-            query = query.gt("play_time", 120)
-
-        if tier:
-            query = query.eq("strategy_tier", tier)
-
-        if sort == "title":
-            query = query.order("title_ja", desc=False, nullsfirst=False).order("title", desc=False, nullsfirst=False)
-        elif sort == "year":
-            query = query.order("published_year", desc=True, nullsfirst=False)
-        elif sort == "play_time":
-            query = query.order("play_time", desc=False, nullsfirst=False)
+
+def _cloud_filters(query, *, players: str | None, time_filter: DirectoryTime | None, tier: str | None):
+    if players:
+        if players == "5+":
+            query = query.gte("max_players", 5)
         else:
-            query = query.order("created_at", desc=True, nullsfirst=False)
+            player_count = int(players)
+            query = query.lte("min_players", player_count).gte("max_players", player_count)
 
-        result = query.range(offset, offset + limit - 1).execute()
-        return {"data": result.data, "total": result.count or 0}
+    if time_filter == "30-":
+        query = query.gt("play_time", 0).lte("play_time", 30)
+    elif time_filter == "30-60":
+        query = query.gt("play_time", 30).lte("play_time", 60)
+    elif time_filter == "60-120":
+        query = query.gt("play_time", 60).lte("play_time", 120)
+    elif time_filter == "120+":
+        query = query.gt("play_time", 120)
 
-    return await anyio.to_thread.run_sync(_q)
+    if tier:
+        query = query.eq("strategy_tier", tier)
+    return query
@@ -1,22 +1,41 @@
+import asyncio
 import logging
 
-import anyio
-
 from app.core import supabase
+from app.core.dataloader import current_loaders, loader_scope
 from app.models.evidence import (
+    MAX_EVIDENCE_BATCH_CLAIMS,
     Claim,
     ClaimDetailResponse,
     ClaimTarget,
+    ClaimTrace,
+    EvidenceBatchRequest,
+    EvidenceBatchResponse,
     EvidenceBinding,
     EvidenceBindingDetail,
     EvidenceSource,
+    EvidenceTargetType,
     EvidenceTraceResponse,
     SourceLocator,
+    TargetClaimTraces,
     build_claim_trace,
 )
 
 logger = logging.getLogger("services.evidence")
 
+_TARGET_FIELDS = ("rule_id", "component_id", "component_set_id", "property_key", "ordinal", "ability_id", "field_path")
+# Identifying claim columns per target type; the first one is selective enough for an in_() lookup.
+_TARGET_COLUMNS = {
+    EvidenceTargetType.RULE_NODE: ("rule_id",),
+    EvidenceTargetType.COMPONENT: ("component_id",),
+    EvidenceTargetType.COMPONENT_SET: ("component_set_id",),
+    EvidenceTargetType.PROPERTY_DEFINITION: ("property_key",),
+    EvidenceTargetType.COMPONENT_PROPERTY: ("component_id", "property_key", "ordinal"),
+    EvidenceTargetType.ABILITY_PRINTED_TEXT: ("ability_id",),
+    EvidenceTargetType.ABILITY_NORMALIZED: ("ability_id",),
+    EvidenceTargetType.GAME_METADATA: ("field_path",),
+}
+
 
 class EvidenceReadError(RuntimeError):
     """Raised when canonical evidence exists behind an unreadable backend path."""
@@ -36,7 +55,8 @@ class EvidenceService:
         if supabase.is_local():
             return EvidenceTraceResponse(status="not_available", **base)
         try:
-            return await anyio.to_thread.run_sync(self._load_trace, game, ruleset_id, target, base)
+            with loader_scope():
+                return await self._load_trace(game, ruleset_id, target, base)
         except Exception as exc:
             logger.exception("Evidence trace read failed for %s/%s", slug, ruleset_id)
             raise EvidenceReadError(f"evidence trace backend failure for {slug}/{ruleset_id}") from exc
@@ -46,28 +66,42 @@ class EvidenceService:
         if not game or supabase.is_local():
             return None
         try:
-            return await anyio.to_thread.run_sync(self._load_claim_detail, game, ruleset_id, claim_id)
+            with loader_scope():
+                return await self._load_claim_detail(game, ruleset_id, claim_id)
         except Exception as exc:
             logger.exception("Claim detail read failed for %s/%s/%s", slug, ruleset_id, claim_id)
             raise EvidenceReadError(f"claim evidence backend failure for {slug}/{ruleset_id}/{claim_id}") from exc
 
+    async def get_traces(self, slug: str, request: EvidenceBatchRequest) -> EvidenceBatchResponse | None:
+        game = await supabase.get_by_slug(slug)
+        if not game:
+            return None
+        base = {"game_id": str(game["id"]), "slug": str(game["slug"]), "ruleset_id": request.rule_set_id}
+        if supabase.is_local():
+            return EvidenceBatchResponse(status="not_available", **base)
+        try:
+            with loader_scope():
+                return await self._load_batch(game, request, base)
+        except Exception as exc:
+            logger.exception("Evidence batch read failed for %s/%s", slug, request.rule_set_id)
+            raise EvidenceReadError(f"evidence batch backend failure for {slug}/{request.rule_set_id}") from exc
+
     @staticmethod
-    def _validate_ruleset(client, game: dict, ruleset_id: str) -> bool:
+    async def _validate_ruleset(client, game: dict, ruleset_id: str) -> bool:
         rows = (
-            client.table("rule_sets")
+            await client.table("rule_sets")
             .select("id")
             .eq("id", ruleset_id)
             .eq("game_id", game["id"])
             .limit(1)
             .execute()
-            .data
-        )
+        ).data
         return bool(rows)
 
     @classmethod
-    def _load_trace(cls, game: dict, ruleset_id: str, target: ClaimTarget, base: dict) -> EvidenceTraceResponse:
-        client = supabase._get_client()
-        if not cls._validate_ruleset(client, game, ruleset_id):
+    async def _load_trace(cls, game: dict, ruleset_id: str, target: ClaimTarget, base: dict) -> EvidenceTraceResponse:
+        client = supabase._get_async_client()
+        if not await cls._validate_ruleset(client, game, ruleset_id):
             return EvidenceTraceResponse(status="not_available", **base)
 
         query = (
@@ -91,79 +125,160 @@ class EvidenceService:
         if target.field_path is not None:
             query = query.eq("field_path", target.field_path)
 
-        claim_rows = query.order("created_at").execute().data
+        claim_rows = (await query.order("created_at").execute()).data
         if not claim_rows:
             return EvidenceTraceResponse(status="not_available", **base)
 
-        traces = [cls._build_trace(client, row) for row in claim_rows]
+        traces = await cls._build_traces(claim_rows)
         return EvidenceTraceResponse(status="available", claims=traces, **base)
 
     @classmethod
-    def _load_claim_detail(cls, game: dict, ruleset_id: str, claim_id: str) -> ClaimDetailResponse | None:
-        client = supabase._get_client()
-        if not cls._validate_ruleset(client, game, ruleset_id):
+    async def _load_batch(cls, game: dict, request: EvidenceBatchRequest, base: dict) -> EvidenceBatchResponse:
+        client = supabase._get_async_client()
+        if not await cls._validate_ruleset(client, game, request.rule_set_id):
+            return EvidenceBatchResponse(status="not_available", **base)
+
+        truncated = False
+        if request.target_type is not None:
+            claim_rows, truncated = await cls._load_claims_of_type(client, request.rule_set_id, request.target_type)
+            grouped = cls._group_by_target(claim_rows)
+            targets = [cls._claim_model(rows[0]).target for rows in grouped.values()]
+        else:
+            claim_rows = await cls._load_claims_for_targets(request.rule_set_id, request.targets)
+            grouped = cls._group_by_target(claim_rows)
+            targets = list({cls._target_key(target): target for target in request.targets}.values())
+
+        selected: list[tuple[ClaimTarget, list[dict]]] = []
+        claim_count = 0
+        for target in targets:
+            rows = grouped.get(cls._target_key(target), [])
+            if claim_count + len(rows) > MAX_EVIDENCE_BATCH_CLAIMS:
+                truncated = True
+                break
+            selected.append((target, rows))
+            claim_count += len(rows)
+
+        traces = iter(await cls._build_traces([row for _target, rows in selected for row in rows]))
+        entries = [
+            TargetClaimTraces(target=target, claims=[next(traces) for _row in rows]) for target, rows in selected
+        ]
+        status = "available" if any(entry.claims for entry in entries) else "not_available"
+        return EvidenceBatchResponse(status=status, traces=entries, truncated=truncated, **base)
+
+    @staticmethod
+    async def _load_claims_of_type(client, rule_set_id: str, target_type: EvidenceTargetType) -> tuple[list[dict], bool]:
+        columns = _TARGET_COLUMNS[target_type]
+        query = client.table("claims").select("*").eq("rule_set_id", rule_set_id).eq("target_type", target_type.value)
+        for column in columns:
+            query = query.order(column)
+        rows = (await query.order("created_at").limit(MAX_EVIDENCE_BATCH_CLAIMS + 1).execute()).data
+        if len(rows) <= MAX_EVIDENCE_BATCH_CLAIMS:
+            return rows, False
+        # Rows are ordered by target, so only the last target can be cut short; drop it whole.
+        last_key = EvidenceService._row_target_key(rows[-1])
+        return [row for row in rows if EvidenceService._row_target_key(row) != last_key], True
+
+    @staticmethod
+    async def _load_claims_for_targets(rule_set_id: str, targets: list[ClaimTarget]) -> list[dict]:
+        loaders = current_loaders()
+        keys_by_type: dict[EvidenceTargetType, set[str]] = {}
+        for target in targets:
+            column = _TARGET_COLUMNS[target.target_type][0]
+            keys_by_type.setdefault(target.target_type, set()).add(str(getattr(target, column)))
+        row_lists = await asyncio.gather(
+            *(
+                loaders.rows(
+                    "claims",
+                    _TARGET_COLUMNS[target_type][0],
+                    filters={"rule_set_id": rule_set_id, "target_type": target_type.value},
+                    order="created_at",
+                ).load_many(sorted(keys))
+                for target_type, keys in keys_by_type.items()
+            )
+        )
+        return [row for lists in row_lists for rows in lists for row in rows]
+
+    @classmethod
+    def _group_by_target(cls, claim_rows: list[dict]) -> dict[tuple, list[dict]]:
+        grouped: dict[tuple, list[dict]] = {}
+        for row in claim_rows:
+            grouped.setdefault(cls._row_target_key(row), []).append(row)
+        return grouped
+
+    @staticmethod
+    def _target_key(target: ClaimTarget) -> tuple:
+        return (target.target_type.value, *(getattr(target, field) for field in _TARGET_FIELDS))
+
+    @staticmethod
+    def _row_target_key(row: dict) -> tuple:
+        return (row["target_type"], *(row.get(field) for field in _TARGET_FIELDS))
+
+    @classmethod
+    async def _load_claim_detail(cls, game: dict, ruleset_id: str, claim_id: str) -> ClaimDetailResponse | None:
+        client = supabase._get_async_client()
+        if not await cls._validate_ruleset(client, game, ruleset_id):
             return None
         rows = (
-            client.table("claims")
+            await client.table("claims")
             .select("*")
             .eq("rule_set_id", ruleset_id)
             .eq("claim_id", claim_id)
             .limit(1)
             .execute()
-            .data
-        )
+        ).data
         if not rows:
             return None
         return ClaimDetailResponse(
             game_id=str(game["id"]),
             slug=str(game["slug"]),
             ruleset_id=ruleset_id,
-            trace=cls._build_trace(client, rows[0]),
+            trace=(await cls._build_traces(rows))[0],
         )
 
     @classmethod
-    def _build_trace(cls, client, claim_row: dict):
-        claim = cls._claim_model(claim_row)
-        binding_rows = (
-            client.table("evidence_bindings")
-            .select("*")
-            .eq("claim_id", claim.claim_id)
-            .order("created_at")
-            .execute()
-            .data
+    async def _build_traces(cls, claim_rows: list[dict]) -> list[ClaimTrace]:
+        """Assemble traces with one bindings, one sources, and one locators query in total."""
+        loaders = current_loaders()
+        claims = [cls._claim_model(row) for row in claim_rows]
+        binding_lists = await loaders.rows("evidence_bindings", "claim_id", order="created_at").load_many(
+            claim.claim_id for claim in claims
+        )
+        binding_rows = [row for rows in binding_lists for row in rows]
+        source_ids = sorted({str(row["source_id"]) for row in binding_rows})
+        locator_ids = sorted({str(row["locator_id"]) for row in binding_rows if row.get("locator_id")})
+        source_lists, locator_lists = await asyncio.gather(
+            loaders.rows("evidence_sources", "source_id").load_many(source_ids),
+            loaders.rows("source_locators", "locator_id").load_many(locator_ids),
         )
-        details = [cls._binding_detail(client, row) for row in binding_rows]
-        return build_claim_trace(claim, details)
+        sources = {str(rows[0]["source_id"]): rows[0] for rows in source_lists if rows}
+        # Locator ids are only unique within a source, so index by the (source_id, locator_id) pair.
+        locators = {
+            (str(row["source_id"]), str(row["locator_id"])): row for rows in locator_lists for row in rows
+        }
+        return [
+            build_claim_trace(claim, [cls._binding_detail(row, sources, locators) for row in bindings])
+            for claim, bindings in zip(claims, binding_lists, strict=True)
+        ]
 
     @classmethod
-    def _binding_detail(cls, client, row: dict) -> EvidenceBindingDetail:
-        source_rows = (
-            client.table("evidence_sources")
-            .select("*")
-            .eq("source_id", row["source_id"])
-            .limit(1)
-            .execute()
-            .data
-        )
-        if not source_rows:
+    def _binding_detail(
+        cls,
+        row: dict,
+        sources: dict[str, dict],
+        locators: dict[tuple[str, str], dict],
+    ) -> EvidenceBindingDetail:
+        source_row = sources.get(str(row["source_id"]))
+        if source_row is None:
             raise ValueError(f"missing evidence source {row['source_id']}")
         locator = None
         if row.get("locator_id"):
-            locator_rows = (
-                client.table("source_locators")
-                .select("*")
-                .eq("source_id", row["source_id"])
-                .eq("locator_id", row["locator_id"])
-                .limit(1)
-                .execute()
-                .data
-            )
-            if not locator_rows:
+            locator_row = locators.get((str(row["source_id"]), str(row["locator_id"])))
+            if locator_row is None:
                 raise ValueError(f"missing source locator {row['locator_id']}")
-            locator = cls._locator_model(locator_rows[0])
+            locator = cls._locator_model(locator_row)
         return EvidenceBindingDetail(
             binding=cls._binding_model(row),
-            source=cls._source_model(source_rows[0]),
+            source=cls._source_model(source_row),
             locator=locator,
         )
 
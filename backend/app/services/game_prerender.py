@@ -0,0 +1,119 @@
+"""Static pre-rendering of ``/games/{slug}`` pages.
+
+Every visible game is rendered through ``generate_seo_html`` into
+``<dist>/games/<slug>/index.html`` so the CDN can serve crawler traffic without
+invoking the API function. A manifest of each page's ``updated_at`` lets an
+incremental run re-render only the games that changed since the previous run.
+Retired (410) and search-hidden games are never written, and their stale files
+are removed, so those slugs keep falling through to the dynamic route.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from app.core.supabase import list_for_sitemap
+from app.services.search_visibility import should_hide_game_from_search, should_return_gone
+from app.services.seo_renderer import generate_seo_html
+
+logger = logging.getLogger("services.game_prerender")
+
+MANIFEST_NAME = ".prerender-manifest.json"
+_PAGE_SIZE = 1000
+# Only path-safe slugs become directories; anything else stays on the dynamic route.
+_STATIC_SLUG = re.compile(r"^[a-z0-9][a-z0-9-]{0,127}$")
+
+
+@dataclass
+class PrerenderReport:
+    rendered: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    removed: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+
+def _is_static(slug: str) -> bool:
+    return bool(_STATIC_SLUG.match(slug)) and not should_return_gone(slug) and not should_hide_game_from_search(slug)
+
+
+async def _catalog_versions() -> dict[str, str | None]:
+    versions: dict[str, str | None] = {}
+    after = ""
+    while True:
+        rows = await list_for_sitemap(after, limit=_PAGE_SIZE, columns=("slug", "updated_at"))
+        for row in rows:
+            slug = str(row.get("slug") or "").strip()
+            if slug and _is_static(slug):
+                versions[slug] = row.get("updated_at")
+        if len(rows) < _PAGE_SIZE:
+            return versions
+        after = rows[-1]["slug"]
+
+
+def _read_manifest(path: Path) -> dict[str, str | None]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest.get("pages", {}) if isinstance(manifest, dict) else {}
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(f".{path.name}.tmp")
+    staging.write_text(content, encoding="utf-8")
+    staging.replace(path)
+
+
+async def prerender_games(dist: Path, *, incremental: bool = False, concurrency: int = 8) -> PrerenderReport:
+    """Render game pages under ``dist/games``; ``incremental`` skips pages whose ``updated_at`` is unchanged."""
+    games_dir = dist / "games"
+    manifest_path = games_dir / MANIFEST_NAME
+    previous = _read_manifest(manifest_path) if incremental else {}
+    versions = await _catalog_versions()
+    report = PrerenderReport()
+
+    pending = []
+    for slug, updated_at in versions.items():
+        if slug in previous and previous[slug] == updated_at and (games_dir / slug / "index.html").exists():
+            report.unchanged += 1
+        else:
+            pending.append(slug)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    pages: dict[str, str | None] = {slug: previous[slug] for slug in versions if slug in previous}
+
+    async def _render(slug: str) -> None:
+        async with semaphore:
+            try:
+                content = await generate_seo_html(slug)
+            except Exception:
+                logger.exception("Pre-rendering %s failed", slug)
+                content = None
+        if content is None:
+            report.failed.append(slug)
+            pages.pop(slug, None)
+            return
+        await asyncio.to_thread(_write_atomic, games_dir / slug / "index.html", content)
+        report.rendered.append(slug)
+        pages[slug] = versions[slug]
+
+    await asyncio.gather(*(_render(slug) for slug in pending))
+
+    # Deleted, retired and hidden games must not keep a static page that shadows the dynamic route.
+    if games_dir.exists():
+        for stale in games_dir.iterdir():
+            if stale.is_dir() and stale.name not in versions:
+                shutil.rmtree(stale)
+                report.removed.append(stale.name)
+
+    manifest = {"pages": dict(sorted(pages.items()))}
+    _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+    report.rendered.sort()
+    report.failed.sort()
+    report.removed.sort()
+    return report
@@ -2,8 +2,6 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-import anyio
-
 from app.core import supabase
 from app.services.identity_coherence import audit_title_work_coherence
 
@@ -19,59 +17,51 @@ async def _load_identity_coherence_context() -> tuple[list[dict[str, Any]], list
     if supabase.is_local():
         raise GameIdentityConflictError("Title identity changes require verified alias bindings")
 
-    def _q() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-        client = supabase._get_client()
-        games = client.table("games").select("id,slug,work_id,title,title_ja,title_en").execute().data
-        aliases = client.table("game_title_aliases").select("game_id,title").execute().data
-        return games, aliases
-
-    return await anyio.to_thread.run_sync(_q)
+    client = supabase._get_async_client()
+    games = (await client.table("games").select("id,slug,work_id,title,title_ja,title_en").execute()).data
+    aliases = (await client.table("game_title_aliases").select("game_id,title").execute()).data
+    return games, aliases
 
 
 async def _load_source_work_bindings(source_url: str) -> set[str]:
     if supabase.is_local():
         raise GameIdentityConflictError("Source URL changes require canonical evidence bindings")
 
-    def _q() -> set[str]:
-        client = supabase._get_client()
-        source_rows = client.table("evidence_sources").select("source_id").eq("url", source_url).execute().data
-        source_ids = sorted({str(row.get("source_id") or "") for row in source_rows if row.get("source_id")})
-        if not source_ids:
-            return set()
-
-        binding_rows = (
-            client.table("evidence_bindings")
-            .select("claim_id")
-            .in_("source_id", source_ids)
-            .eq("relation", "supports")
-            .execute()
-            .data
-        )
-        claim_ids = sorted({str(row.get("claim_id") or "") for row in binding_rows if row.get("claim_id")})
-        if not claim_ids:
-            return set()
-
-        claim_rows = (
-            client.table("claims")
-            .select("claim_id,rule_set_id")
-            .in_("claim_id", claim_ids)
-            .eq("lifecycle_status", "accepted")
-            .execute()
-            .data
-        )
-        rule_set_ids = sorted({str(row.get("rule_set_id") or "") for row in claim_rows if row.get("rule_set_id")})
-        if not rule_set_ids:
-            return set()
-
-        rule_set_rows = client.table("rule_sets").select("id,game_id").in_("id", rule_set_ids).execute().data
-        game_ids = sorted({str(row.get("game_id") or "") for row in rule_set_rows if row.get("game_id")})
-        if not game_ids:
-            return set()
-
-        game_rows = client.table("games").select("id,work_id").in_("id", game_ids).execute().data
-        return {str(row.get("work_id") or "") for row in game_rows if row.get("work_id")}
-
-    return await anyio.to_thread.run_sync(_q)
+    client = supabase._get_async_client()
+    source_rows = (await client.table("evidence_sources").select("source_id").eq("url", source_url).execute()).data
+    source_ids = sorted({str(row.get("source_id") or "") for row in source_rows if row.get("source_id")})
+    if not source_ids:
+        return set()
+
+    binding_rows = (
+        await client.table("evidence_bindings")
+        .select("claim_id")
+        .in_("source_id", source_ids)
+        .eq("relation", "supports")
+        .execute()
+    ).data
+    claim_ids = sorted({str(row.get("claim_id") or "") for row in binding_rows if row.get("claim_id")})
+    if not claim_ids:
+        return set()
+
+    claim_rows = (
+        await client.table("claims")
+        .select("claim_id,rule_set_id")
+        .in_("claim_id", claim_ids)
+        .eq("lifecycle_status", "accepted")
+        .execute()
+    ).data
+    rule_set_ids = sorted({str(row.get("rule_set_id") or "") for row in claim_rows if row.get("rule_set_id")})
+    if not rule_set_ids:
+        return set()
+
+    rule_set_rows = (await client.table("rule_sets").select("id,game_id").in_("id", rule_set_ids).execute()).data
+    game_ids = sorted({str(row.get("game_id") or "") for row in rule_set_rows if row.get("game_id")})
+    if not game_ids:
+        return set()
+
+    game_rows = (await client.table("games").select("id,work_id").in_("id", game_ids).execute()).data
+    return {str(row.get("work_id") or "") for row in game_rows if row.get("work_id")}
 
 
 async def _validate_manual_source_update(game: dict[str, Any], safe_updates: dict[str, Any]) -> None:
@@ -130,10 +120,8 @@ class GameService:
             self.use_local = False
             logger.info("Supabase connected. Using cloud DB.")
         except Exception:
+            # The local schema is created once at startup (app.main lifespan), not per request.
             logger.warning("Supabase not configured. Falling back to local SQLite.")
-            from app.core import local_db
-
-            local_db.init_db()
 
     async def search_games(self, query: str) -> list[dict[str, Any]]:
         return await supabase.search(query)
@@ -141,7 +129,12 @@ class GameService:
     async def get_game_by_slug(self, slug: str) -> dict[str, Any] | None:
         return await supabase.get_by_slug(slug)
 
+    def record_view(self, game_id: str) -> None:
+        supabase.increment_view_count(game_id)
+
     async def update_game_manual(self, slug: str, updates: dict[str, Any]) -> dict[str, Any]:
+        # The full merged row is written back, so it must not be built from a cached read.
+        supabase.invalidate_cached_game(slug)
         game = await supabase.get_by_slug(slug)
         if not game:
             raise ValueError(f"Game not found for slug: {slug}")
@@ -153,6 +146,7 @@ class GameService:
         await _validate_manual_source_update(game, safe_updates)
         merged["updated_at"] = datetime.now(UTC).isoformat()
         out = await supabase.upsert(merged)
+        supabase.invalidate_cached_game(slug, game.get("id"))
         if not out:
             raise RuntimeError(f"Update failed for game: {slug}")
         return out[0]
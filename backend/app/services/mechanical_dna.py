@@ -1,7 +1,5 @@
 import logging
 
-import anyio
-
 from app.core import supabase
 from app.models.mechanical_dna import (
     HierarchyMatch,
@@ -38,21 +36,20 @@ class MechanicalDNAService:
         if supabase.is_local():
             return MechanicalDNAResponse(status="not_available", **base)
         try:
-            return await anyio.to_thread.run_sync(self._load_connections, game, base, limit)
+            return await self._load_connections(game, base, limit)
         except Exception as exc:
             logger.warning("Mechanical DNA unavailable for %s: %s", slug, exc)
             return MechanicalDNAResponse(status="not_available", **base)
 
     @classmethod
-    def _load_connections(cls, game: dict, base: dict, limit: int) -> MechanicalDNAResponse:
-        client = supabase._get_client()
+    async def _load_connections(cls, game: dict, base: dict, limit: int) -> MechanicalDNAResponse:
+        client = supabase._get_async_client()
         source_links = (
-            client.table("game_concepts")
+            await client.table("game_concepts")
             .select("concept_id,verification_status")
             .eq("game_id", game["id"])
             .execute()
-            .data
-        )
+        ).data
         source_ids = {
             str(link["concept_id"])
             for link in source_links
@@ -61,7 +58,7 @@ class MechanicalDNAService:
         if not source_ids:
             return MechanicalDNAResponse(status="not_available", **base)
 
-        hierarchy_neighbors = cls._load_hierarchy_neighbors(client, source_ids)
+        hierarchy_neighbors = await cls._load_hierarchy_neighbors(client, source_ids)
         search_ids = source_ids | {
             neighbor_id
             for neighbors in hierarchy_neighbors.values()
@@ -69,12 +66,11 @@ class MechanicalDNAService:
         }
 
         overlapping_links = (
-            client.table("game_concepts")
+            await client.table("game_concepts")
             .select("game_id,concept_id,verification_status")
             .in_("concept_id", sorted(search_ids))
             .execute()
-            .data
-        )
+        ).data
         candidate_ids = sorted(
             {
                 str(link["game_id"])
@@ -87,12 +83,11 @@ class MechanicalDNAService:
             return MechanicalDNAResponse(status="available", **base)
 
         all_candidate_links = (
-            client.table("game_concepts")
+            await client.table("game_concepts")
             .select("game_id,concept_id,verification_status")
             .in_("game_id", candidate_ids)
             .execute()
-            .data
-        )
+        ).data
         candidate_concepts: dict[str, set[str]] = {game_id: set() for game_id in candidate_ids}
         for link in all_candidate_links:
             if link.get("verification_status") not in ACCEPTED_VERIFICATION:
@@ -100,14 +95,13 @@ class MechanicalDNAService:
             candidate_concepts.setdefault(str(link["game_id"]), set()).add(str(link["concept_id"]))
 
         game_rows = (
-            client.table("games")
+            await client.table("games")
             .select("id,slug,title,image_url")
             .in_("id", candidate_ids)
             .execute()
-            .data
-        )
+        ).data
         games_by_id = {str(row["id"]): row for row in game_rows}
-        labels = cls._load_preferred_labels(client, source_ids)
+        labels = await cls._load_preferred_labels(client, source_ids)
 
         unranked: list[dict] = []
         for candidate_id in candidate_ids:
@@ -154,21 +148,19 @@ class MechanicalDNAService:
         return MechanicalDNAResponse(status="available", connections=connections, **base)
 
     @staticmethod
-    def _load_hierarchy_neighbors(client, source_ids: set[str]) -> dict[str, list[tuple[str, str]]]:
+    async def _load_hierarchy_neighbors(client, source_ids: set[str]) -> dict[str, list[tuple[str, str]]]:
         outgoing = (
-            client.table("concept_relations")
+            await client.table("concept_relations")
             .select("from_concept_id,to_concept_id,relation_type,verification_status")
             .in_("from_concept_id", sorted(source_ids))
             .execute()
-            .data
-        )
+        ).data
         incoming = (
-            client.table("concept_relations")
+            await client.table("concept_relations")
             .select("from_concept_id,to_concept_id,relation_type,verification_status")
             .in_("to_concept_id", sorted(source_ids))
             .execute()
-            .data
-        )
+        ).data
         neighbors: dict[str, set[tuple[str, str]]] = {concept_id: set() for concept_id in source_ids}
         for row in outgoing:
             relation_type = row.get("relation_type")
@@ -207,15 +199,14 @@ class MechanicalDNAService:
         )
 
     @staticmethod
-    def _load_preferred_labels(client, concept_ids: set[str]) -> dict[str, dict[str, str]]:
+    async def _load_preferred_labels(client, concept_ids: set[str]) -> dict[str, dict[str, str]]:
         rows = (
-            client.table("concept_labels")
+            await client.table("concept_labels")
             .select("concept_id,language_code,label")
             .in_("concept_id", sorted(concept_ids))
             .eq("label_type", "pref")
             .execute()
-            .data
-        )
+        ).data
         grouped: dict[str, dict[str, str]] = {}
         for row in rows:
             concept_id = str(row["concept_id"])
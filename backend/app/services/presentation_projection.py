@@ -1,9 +1,8 @@
 import logging
 from collections import defaultdict
 
-import anyio
-
 from app.core import supabase
+from app.core.dataloader import current_loaders, loader_scope
 from app.models.presentation_projection import (
     GlossaryProjectionSection,
     PresentationProjectionResponse,
@@ -55,19 +54,19 @@ def accepted_supported_claim(claim: dict, bindings: list[dict]) -> dict | None:
 
 def project_rule_rows(rule_rows: list[dict], eligible_claims: dict[str, list[dict]]) -> list[ProjectedRule]:
     """Project only current, evidence-backed base RuleNodes; stale claims fail closed."""
+    # The first eligible claim per (rule_id, statement) wins, as claims arrive in claim_id order.
+    current: dict[tuple[str, str], dict] = {}
+    for rule_id, candidates in eligible_claims.items():
+        for candidate in candidates:
+            statement = (candidate.get("normalized_payload") or {}).get("statement")
+            if isinstance(statement, str):
+                current.setdefault((rule_id, statement), candidate)
+
     projected: list[ProjectedRule] = []
     for row in rule_rows:
         if row["node_type"] == "variant":
             continue
-        candidates = eligible_claims.get(row["rule_id"], [])
-        evidence = next(
-            (
-                candidate
-                for candidate in candidates
-                if (candidate.get("normalized_payload") or {}).get("statement") == row["normalized_statement"]
-            ),
-            None,
-        )
+        evidence = current.get((row["rule_id"], row["normalized_statement"]))
         if evidence is None:
             continue
         projected.append(
@@ -131,12 +130,8 @@ class PresentationProjectionService:
         if supabase.is_local():
             return self._empty_response(game, rule_set_id, language_code)
         try:
-            return await anyio.to_thread.run_sync(
-                self._load_projection,
-                game,
-                rule_set_id,
-                language_code,
-            )
+            with loader_scope():
+                return await self._load_projection(game, rule_set_id, language_code)
         except Exception as exc:
             logger.exception("Presentation projection read failed for %s/%s", slug, rule_set_id)
             raise PresentationProjectionReadError(
@@ -167,31 +162,29 @@ class PresentationProjectionService:
         )
 
     @classmethod
-    def _load_projection(cls, game: dict, rule_set_id: str, language_code: str) -> PresentationProjectionResponse:
-        client = supabase._get_client()
+    async def _load_projection(cls, game: dict, rule_set_id: str, language_code: str) -> PresentationProjectionResponse:
+        client = supabase._get_async_client()
         rule_sets = (
-            client.table("rule_sets")
+            await client.table("rule_sets")
             .select("id")
             .eq("id", rule_set_id)
             .eq("game_id", game["id"])
             .limit(1)
             .execute()
-            .data
-        )
+        ).data
         if not rule_sets:
             return cls._empty_response(game, rule_set_id, language_code)
 
         rule_rows = (
-            client.table("rule_nodes")
+            await client.table("rule_nodes")
             .select("rule_id,node_type,normalized_statement,sequence")
             .eq("rule_set_id", rule_set_id)
             .order("sequence")
             .execute()
-            .data
-        )
-        eligible_claims = cls._load_eligible_rule_claims(client, rule_set_id)
+        ).data
+        eligible_claims = await cls._load_eligible_rule_claims(client, rule_set_id)
         projected_rules = project_rule_rows(rule_rows, eligible_claims)
-        glossary_items = cls._load_glossary(client, str(game["id"]), rule_set_id, language_code)
+        glossary_items = await cls._load_glossary(client, str(game["id"]), rule_set_id, language_code)
 
         quick_rules = [item for item in projected_rules if item.node_type in _QUICK_RULE_TYPES]
         setup = [item for item in projected_rules if item.node_type in _SETUP_TYPES]
@@ -236,25 +229,21 @@ class PresentationProjectionService:
         )
 
     @staticmethod
-    def _load_eligible_rule_claims(client, rule_set_id: str) -> dict[str, list[dict]]:
+    async def _load_eligible_rule_claims(client, rule_set_id: str) -> dict[str, list[dict]]:
         claims = (
-            client.table("claims")
+            await client.table("claims")
             .select("claim_id,rule_id,normalized_payload,lifecycle_status")
             .eq("rule_set_id", rule_set_id)
             .eq("target_type", "rule_node")
             .order("claim_id")
             .execute()
-            .data
-        )
+        ).data
+        # Every claim's bindings in chunked in_() queries instead of one query per claim.
+        binding_lists = await current_loaders().rows(
+            "evidence_bindings", "claim_id", select="source_id,relation"
+        ).load_many(claim["claim_id"] for claim in claims)
         eligible: dict[str, list[dict]] = defaultdict(list)
-        for claim in claims:
-            bindings = (
-                client.table("evidence_bindings")
-                .select("source_id,relation")
-                .eq("claim_id", claim["claim_id"])
-                .execute()
-                .data
-            )
+        for claim, bindings in zip(claims, binding_lists, strict=True):
             evidence = accepted_supported_claim(claim, bindings)
             rule_id = claim.get("rule_id")
             if evidence is not None and rule_id:
@@ -262,15 +251,14 @@ class PresentationProjectionService:
         return dict(eligible)
 
     @staticmethod
-    def _load_glossary(client, game_id: str, rule_set_id: str, language_code: str) -> list[ProjectedGlossaryEntry]:
+    async def _load_glossary(client, game_id: str, rule_set_id: str, language_code: str) -> list[ProjectedGlossaryEntry]:
         rule_links = (
-            client.table("rule_node_concepts")
+            await client.table("rule_node_concepts")
             .select("rule_id,concept_id,verification_status")
             .eq("rule_set_id", rule_set_id)
             .eq("verification_status", "verified")
             .execute()
-            .data
-        )
+        ).data
         rule_ids_by_concept: dict[str, set[str]] = defaultdict(set)
         for link in rule_links:
             rule_ids_by_concept[link["concept_id"]].add(link["rule_id"])
@@ -278,13 +266,12 @@ class PresentationProjectionService:
             return []
 
         game_links = (
-            client.table("game_concepts")
+            await client.table("game_concepts")
             .select("concept_id,usage_role,verification_status")
             .eq("game_id", game_id)
             .eq("verification_status", "verified")
             .execute()
-            .data
-        )
+        ).data
         allowed_game_concepts = {
             row["concept_id"]
             for row in game_links
@@ -294,24 +281,22 @@ class PresentationProjectionService:
         items: list[ProjectedGlossaryEntry] = []
         for concept_id in concept_ids:
             concept_rows = (
-                client.table("concepts")
+                await client.table("concepts")
                 .select("concept_id,definition,lifecycle_status,verification_status")
                 .eq("concept_id", concept_id)
                 .eq("lifecycle_status", "active")
                 .eq("verification_status", "verified")
                 .limit(1)
                 .execute()
-                .data
-            )
+            ).data
             if not concept_rows:
                 continue
             labels = (
-                client.table("concept_labels")
+                await client.table("concept_labels")
                 .select("language_code,label_type,label")
                 .eq("concept_id", concept_id)
                 .execute()
-                .data
-            )
+            ).data
             preferred = next(
                 (row["label"] for row in labels if row["language_code"] == language_code and row["label_type"] == "pref"),
                 None,
@@ -329,12 +314,11 @@ class PresentationProjectionService:
                 if row["language_code"] == language_code and row["label_type"] == "alt"
             )
             relations = (
-                client.table("concept_relations")
+                await client.table("concept_relations")
                 .select("from_concept_id,to_concept_id,relation_type,verification_status")
                 .eq("verification_status", "verified")
                 .execute()
-                .data
-            )
+            ).data
             related = sorted(
                 {
                     row["to_concept_id"] if row["from_concept_id"] == concept_id else row["from_concept_id"]
@@ -1,18 +1,80 @@
+import asyncio
 import logging
 from collections.abc import Iterable
 
-import anyio
-
 from app.core import supabase
+from app.core.sized_cache import SizedLRUCache
+from app.core.ttl_cache import TTLCache
 from app.models.rule_graph import (
     RuleEdge,
+    RuleGraphDiffResponse,
+    RuleGraphPathResponse,
     RuleGraphReadResponse,
     RuleNode,
     RuleNodeType,
+    RuleRelationType,
 )
+from app.services.rule_graph_diff import RuleGraphDigests, diff_graphs
+from app.services.rule_graph_engine import RuleGraphEngine, RuleGraphQueryError
 
 logger = logging.getLogger("services.rule_graph")
 
+# Which rule set a request resolves to is re-read at most every 30s, like game slugs.
+_RULE_SET_TTL_SECONDS = 30.0
+_rule_set_cache = TTLCache(max_entries=1024, ttl_seconds=_RULE_SET_TTL_SECONDS)
+# Compiled graphs are immutable per (rule_set_id, source_revision, version); a new revision
+# gets a new key and the old snapshot ages out by LRU.
+_SNAPSHOT_MAX_BYTES = 32 * 1024 * 1024
+_snapshots = SizedLRUCache(max_bytes=_SNAPSHOT_MAX_BYTES)
+# Diffs between two immutable revisions never change; keyed by both snapshot keys.
+_DIFF_MAX_BYTES = 8 * 1024 * 1024
+_diffs = SizedLRUCache(max_bytes=_DIFF_MAX_BYTES)
+
+
+class _GraphSnapshot:
+    """A validated graph plus its serialized response bodies, one per node type filter."""
+
+    def __init__(self, key: tuple, graph: RuleGraphReadResponse, base_rule_set_id: str | None = None):
+        self.key = key
+        self.graph = graph
+        self.base_rule_set_id = base_rule_set_id
+        self.bodies: dict[frozenset[RuleNodeType], bytes] = {frozenset(): _serialize(graph)}
+        self._engine: RuleGraphEngine | None = None
+        self._digests: RuleGraphDigests | None = None
+
+    @property
+    def size(self) -> int:
+        # The validated models are weighed as one more copy of the unfiltered body.
+        indexes = [index for index in (self._engine, self._digests) if index is not None]
+        bodies = sum(len(body) for body in self.bodies.values()) + len(self.bodies[frozenset()])
+        return bodies + sum(index.nbytes for index in indexes)
+
+    @property
+    def engine(self) -> RuleGraphEngine:
+        """Traversal index, compiled on first use and kept with the snapshot."""
+        if self._engine is None:
+            self._engine = RuleGraphEngine(self.graph)
+            _snapshots.resize(self.key, self.size)
+        return self._engine
+
+    @property
+    def digests(self) -> RuleGraphDigests:
+        """Per-node and per-edge digest index for diffs, built on first use."""
+        if self._digests is None:
+            self._digests = RuleGraphDigests(self.graph)
+            _snapshots.resize(self.key, self.size)
+        return self._digests
+
+    def matches(self, base: dict) -> bool:
+        return all(getattr(self.graph, field) == value for field, value in base.items())
+
+    def select(self, rule_types: frozenset[RuleNodeType]) -> RuleGraphReadResponse:
+        return self.graph.select_types(set(rule_types)) if rule_types else self.graph
+
+
+def _serialize(graph: RuleGraphReadResponse) -> bytes:
+    return graph.model_dump_json().encode("utf-8")
+
 
 class RuleGraphService:
     async def get_by_slug(
@@ -21,6 +83,126 @@ class RuleGraphService:
         rule_types: Iterable[RuleNodeType] | None = None,
         rule_set_id: str | None = None,
     ) -> RuleGraphReadResponse | None:
+        resolved = await self._resolve(slug, rule_set_id)
+        if resolved is None:
+            return None
+        selected = frozenset(rule_types or ())
+        if isinstance(resolved, _GraphSnapshot):
+            return resolved.select(selected)
+        return resolved
+
+    async def get_json_by_slug(
+        self,
+        slug: str,
+        rule_types: Iterable[RuleNodeType] | None = None,
+        rule_set_id: str | None = None,
+    ) -> bytes | None:
+        """Return the serialized graph response; repeated reads of a revision reuse cached bytes."""
+        resolved = await self._resolve(slug, rule_set_id)
+        if resolved is None:
+            return None
+        if not isinstance(resolved, _GraphSnapshot):
+            return _serialize(resolved)
+        selected = frozenset(rule_types or ())
+        body = resolved.bodies.get(selected)
+        if body is None:
+            body = resolved.bodies[selected] = _serialize(resolved.select(selected))
+            _snapshots.resize(resolved.key, resolved.size)
+        return body
+
+    async def get_subgraph(  # noqa: PLR0913, PLR0917 - subgraph route parameters passed through
+        self,
+        slug: str,
+        root: str,
+        depth: int,
+        relations: Iterable[RuleRelationType] | None = None,
+        rule_set_id: str | None = None,
+        reverse: bool = False,
+    ) -> RuleGraphReadResponse | None:
+        """Rules within ``depth`` hops of ``root``; raises ``RuleGraphQueryError`` for an unknown root."""
+        resolved = await self._resolve(slug, rule_set_id)
+        if not isinstance(resolved, _GraphSnapshot):
+            return resolved
+        return resolved.engine.subgraph(root, depth, relations, reverse=reverse)
+
+    async def get_path(
+        self,
+        slug: str,
+        from_rule_id: str,
+        to_rule_id: str,
+        relations: Iterable[RuleRelationType] | None = None,
+        rule_set_id: str | None = None,
+    ) -> RuleGraphPathResponse | None:
+        """Shortest directed rule path; ``found`` is false when ``to_rule_id`` is unreachable."""
+        resolved = await self._resolve(slug, rule_set_id)
+        if resolved is None:
+            return None
+        graph = resolved.graph if isinstance(resolved, _GraphSnapshot) else resolved
+        response = RuleGraphPathResponse(
+            status=graph.status,
+            game_id=graph.game_id,
+            slug=graph.slug,
+            rule_set_id=graph.rule_set_id,
+            source_revision=graph.source_revision,
+            from_rule_id=from_rule_id,
+            to_rule_id=to_rule_id,
+        )
+        if not isinstance(resolved, _GraphSnapshot):
+            return response
+        path = resolved.engine.path(from_rule_id, to_rule_id, relations)
+        if path is None:
+            return response
+        nodes, edges = path
+        return response.model_copy(
+            update={
+                "found": True,
+                "nodes": [graph.nodes[node] for node in nodes],
+                "edges": [graph.edges[edge] for edge in edges],
+            }
+        )
+
+    async def get_diff(
+        self,
+        slug: str,
+        to_rule_set_id: str,
+        from_rule_set_id: str | None = None,
+    ) -> RuleGraphDiffResponse | None:
+        """Diff two rule sets of a game; ``from`` defaults to the ``base_rule_set_id`` of ``to``."""
+        after = await self._resolve(slug, to_rule_set_id)
+        if after is None:
+            return None
+        if isinstance(after, _GraphSnapshot) and not from_rule_set_id:
+            from_rule_set_id = after.base_rule_set_id
+            if not from_rule_set_id:
+                raise RuleGraphQueryError(f"rule set {to_rule_set_id} has no base rule set; pass from")
+        before = await self._resolve(slug, from_rule_set_id) if from_rule_set_id else None
+        graph = after.graph if isinstance(after, _GraphSnapshot) else after
+        response = RuleGraphDiffResponse(
+            status="not_available",
+            game_id=graph.game_id,
+            slug=graph.slug,
+            from_rule_set_id=from_rule_set_id or "",
+            to_rule_set_id=to_rule_set_id,
+        )
+        if not isinstance(after, _GraphSnapshot) or not isinstance(before, _GraphSnapshot):
+            return response
+
+        key = (before.key, after.key, graph.game_id, graph.slug)
+        hit, cached = _diffs.lookup(key)
+        if hit:
+            return cached
+        diff = response.model_copy(
+            update={
+                "status": "available",
+                "from_source_revision": before.graph.source_revision,
+                "to_source_revision": after.graph.source_revision,
+                **diff_graphs(before.digests, after.digests),
+            }
+        )
+        _diffs.set(key, diff, len(diff.model_dump_json()))
+        return diff
+
+    async def _resolve(self, slug: str, rule_set_id: str | None) -> "_GraphSnapshot | RuleGraphReadResponse | None":
         game = await supabase.get_by_slug(slug)
         if not game:
             return None
@@ -35,68 +217,76 @@ class RuleGraphService:
             return RuleGraphReadResponse(status="not_available", **base)
 
         try:
-            graph = await anyio.to_thread.run_sync(self._load_graph, game, base, rule_set_id)
+            rule_set = await self._resolve_rule_set(game, rule_set_id)
+            if rule_set is None:
+                return RuleGraphReadResponse(status="not_available", **base)
+            return await self._snapshot(rule_set, base)
         except Exception as exc:
             # Deploying application code before the database migration must fail closed.
             logger.warning("Rule graph unavailable for %s: %s", slug, exc)
-            graph = RuleGraphReadResponse(status="not_available", **base)
+            return RuleGraphReadResponse(status="not_available", **base)
 
-        if rule_types:
-            return graph.select_types(set(rule_types))
-        return graph
+    async def _snapshot(self, rule_set: dict, base: dict) -> _GraphSnapshot:
+        key = (str(rule_set["id"]), rule_set.get("source_revision"), rule_set.get("version"))
+        hit, snapshot = _snapshots.lookup(key)
+        if hit and snapshot.matches(base):
+            return snapshot
+        if hit:
+            # The game was renamed or re-bound to a work; the rules themselves are unchanged.
+            graph = snapshot.graph.model_copy(update=base)
+        else:
+            graph = await self._load_graph(rule_set, base)
+        snapshot = _GraphSnapshot(key, graph, rule_set.get("base_rule_set_id"))
+        _snapshots.set(key, snapshot, snapshot.size)
+        return snapshot
 
     @staticmethod
-    def _load_graph(game: dict, base: dict, rule_set_id: str | None) -> RuleGraphReadResponse:
-        client = supabase._get_client()
+    async def _resolve_rule_set(game: dict, rule_set_id: str | None) -> dict | None:
+        cache_key = (str(game["id"]), rule_set_id or "")
+        hit, rule_set = _rule_set_cache.lookup(cache_key)
+        if hit:
+            return rule_set
+        client = supabase._get_async_client()
 
         if rule_set_id:
             rule_sets = (
-                client.table("rule_sets")
+                await client.table("rule_sets")
                 .select("*")
                 .eq("game_id", game["id"])
                 .eq("id", rule_set_id)
                 .limit(1)
                 .execute()
-                .data
-            )
+            ).data
         else:
             # Multiple simultaneously active RuleSets are valid after migration 013
             # (for example physical publisher rules + BGA implementation). Never
             # guess which truth boundary the caller intended.
             rule_sets = (
-                client.table("rule_sets")
+                await client.table("rule_sets")
                 .select("*")
                 .eq("game_id", game["id"])
                 .eq("is_active", True)
                 .order("version", desc=True)
                 .limit(2)
                 .execute()
-                .data
-            )
+            ).data
             if len(rule_sets) > 1:
                 logger.info("RuleSet selection required for game %s", game.get("slug"))
-                return RuleGraphReadResponse(status="not_available", **base)
+                rule_sets = []
 
-        if not rule_sets:
-            return RuleGraphReadResponse(status="not_available", **base)
+        rule_set = rule_sets[0] if rule_sets else None
+        _rule_set_cache.set(cache_key, rule_set)
+        return rule_set
 
-        rule_set = rule_sets[0]
-        node_rows = (
-            client.table("rule_nodes")
-            .select("*")
-            .eq("rule_set_id", rule_set["id"])
-            .order("sequence")
-            .execute()
-            .data
-        )
-        edge_rows = (
-            client.table("rule_edges")
-            .select("*")
-            .eq("rule_set_id", rule_set["id"])
-            .order("sequence")
-            .execute()
-            .data
+    @staticmethod
+    async def _load_graph(rule_set: dict, base: dict) -> RuleGraphReadResponse:
+        client = supabase._get_async_client()
+        node_response, edge_response = await asyncio.gather(
+            client.table("rule_nodes").select("*").eq("rule_set_id", rule_set["id"]).order("sequence").execute(),
+            client.table("rule_edges").select("*").eq("rule_set_id", rule_set["id"]).order("sequence").execute(),
         )
+        node_rows = node_response.data
+        edge_rows = edge_response.data
 
         nodes = [
             RuleNode(
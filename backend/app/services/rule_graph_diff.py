@@ -0,0 +1,88 @@
+"""Structural diff between two compiled rule graphs.
+
+Each graph gets a digest index once per snapshot: a content digest per node
+(every field but ``rule_id``), a digest of each node's outgoing edges, and a
+digest per edge keyed by ``(from_rule_id, to_rule_id, relation_type)``. A diff
+is then a single pass over both indexes; full field comparison only runs for
+nodes and edges whose digests differ.
+"""
+
+import hashlib
+
+from app.models.rule_graph import RuleEdge, RuleEdgeChange, RuleGraphReadResponse, RuleNode, RuleNodeChange
+
+EdgeKey = tuple[str, str, str, int]
+EdgeIndex = dict[EdgeKey, tuple[bytes, RuleEdge]]
+_DIGEST_SIZE = 16
+
+
+def _digest(*parts: bytes) -> bytes:
+    hasher = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for part in parts:
+        hasher.update(len(part).to_bytes(4, "big"))
+        hasher.update(part)
+    return hasher.digest()
+
+
+class RuleGraphDigests:
+    def __init__(self, graph: RuleGraphReadResponse):
+        self.edges: EdgeIndex = {}
+        occurrences: dict[tuple[str, str, str], int] = {}
+        outgoing: dict[str, list[bytes]] = {}
+        for edge in graph.edges:
+            identity = (edge.from_rule_id, edge.to_rule_id, edge.relation_type.value)
+            key = (*identity, occurrences.get(identity, 0))
+            occurrences[identity] = key[3] + 1
+            digest = _digest(edge.model_dump_json().encode("utf-8"))
+            self.edges[key] = (digest, edge)
+            outgoing.setdefault(edge.from_rule_id, []).append(digest)
+
+        self.nodes: dict[str, tuple[bytes, bytes, RuleNode]] = {
+            node.rule_id: (
+                _digest(node.model_dump_json(exclude={"rule_id"}).encode("utf-8")),
+                _digest(*sorted(outgoing.get(node.rule_id, ()))),
+                node,
+            )
+            for node in graph.nodes
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return (2 * len(self.nodes) + len(self.edges)) * _DIGEST_SIZE
+
+
+def _changed_fields(before: RuleNode, after: RuleNode) -> list[str]:
+    before_fields, after_fields = before.model_dump(exclude={"rule_id"}), after.model_dump(exclude={"rule_id"})
+    return [field for field in after_fields if before_fields[field] != after_fields[field]]
+
+
+def diff_graphs(before: RuleGraphDigests, after: RuleGraphDigests) -> dict[str, list]:
+    """Return added/removed/modified nodes and edges, ordered as in the graph they come from."""
+    added_nodes = [node for rule_id, (_c, _a, node) in after.nodes.items() if rule_id not in before.nodes]
+    removed_nodes = [node for rule_id, (_c, _a, node) in before.nodes.items() if rule_id not in after.nodes]
+    modified_nodes = []
+    for rule_id, (content, adjacency, node) in after.nodes.items():
+        previous = before.nodes.get(rule_id)
+        if previous is None or (previous[0], previous[1]) == (content, adjacency):
+            continue
+        changed = _changed_fields(previous[2], node) if previous[0] != content else []
+        if previous[1] != adjacency:
+            changed.append("edges")
+        modified_nodes.append(RuleNodeChange(rule_id=rule_id, changed_fields=changed, before=previous[2], after=node))
+
+    return {
+        "added_nodes": added_nodes,
+        "removed_nodes": removed_nodes,
+        "modified_nodes": modified_nodes,
+        "added_edges": _only_in(after.edges, before.edges),
+        "removed_edges": _only_in(before.edges, after.edges),
+        "modified_edges": [
+            RuleEdgeChange(before=before.edges[key][1], after=edge)
+            for key, (digest, edge) in after.edges.items()
+            if key in before.edges and before.edges[key][0] != digest
+        ],
+    }
+
+
+def _only_in(edges: EdgeIndex, other: EdgeIndex) -> list[RuleEdge]:
+    return [edge for key, (_edge_digest, edge) in edges.items() if key not in other]
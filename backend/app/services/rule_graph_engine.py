@@ -0,0 +1,307 @@
+"""Compiled, index-based view of one rule graph for traversal queries.
+
+Rule ids are interned to dense integers in graph order. Edges are stored per
+``RuleRelationType`` as CSR adjacency (an offsets array plus a targets array,
+both directions), so neighbour lookups are slices instead of scans over the edge
+list. Compilation also precomputes phase containment (``phase_rule_id`` plus
+explicit ``contains`` edges), a topological order over ``next``/``requires``
+and reachability bitsets over every relation. Engines are built once per
+cached rule graph snapshot and are read-only afterwards.
+"""
+
+from array import array
+from collections import deque
+from collections.abc import Iterable
+
+from app.models.rule_graph import RuleEdge, RuleGraphReadResponse, RuleNodeType, RuleRelationType
+
+
+class RuleGraphQueryError(ValueError):
+    """Raised when a traversal names a rule id that is not in the graph."""
+
+
+class _Adjacency:
+    """CSR adjacency for one relation and direction; ``edges`` holds positions in ``graph.edges``."""
+
+    __slots__ = ("edges", "offsets", "targets")
+
+    def __init__(self, node_count: int, pairs: list[tuple[int, int, int]]):
+        counts = [0] * (node_count + 1)
+        for source, _target, _edge in pairs:
+            counts[source + 1] += 1
+        for position in range(node_count):
+            counts[position + 1] += counts[position]
+        self.offsets = array("i", counts)
+        self.targets = array("i", [0] * len(pairs))
+        self.edges = array("i", [0] * len(pairs))
+        cursor = list(counts[:-1])
+        for source, target, edge in pairs:
+            self.targets[cursor[source]] = target
+            self.edges[cursor[source]] = edge
+            cursor[source] += 1
+
+    def neighbours(self, node: int) -> Iterable[tuple[int, int]]:
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.targets[start:end], self.edges[start:end], strict=True)
+
+
+class RuleGraphEngine:
+    def __init__(self, graph: RuleGraphReadResponse):
+        self.graph = graph
+        self.rule_ids = [node.rule_id for node in graph.nodes]
+        self.index = {rule_id: position for position, rule_id in enumerate(self.rule_ids)}
+        count = len(self.rule_ids)
+
+        by_type: dict[RuleNodeType, list[int]] = {}
+        for position, node in enumerate(graph.nodes):
+            by_type.setdefault(node.node_type, []).append(position)
+        self.by_type = {node_type: array("i", members) for node_type, members in by_type.items()}
+
+        pairs: dict[RuleRelationType, list[tuple[int, int, int]]] = {relation: [] for relation in RuleRelationType}
+        for position, edge in enumerate(graph.edges):
+            pairs[edge.relation_type].append((self.index[edge.from_rule_id], self.index[edge.to_rule_id], position))
+        self._out = {relation: _Adjacency(count, items) for relation, items in pairs.items()}
+        self._in = {
+            relation: _Adjacency(count, [(target, source, edge) for source, target, edge in items])
+            for relation, items in pairs.items()
+        }
+
+        self.phase_members = self._phase_members()
+        self.order = self._topological_order()
+        self.rank = array("i", [0] * count)
+        for position, node in enumerate(self.order):
+            self.rank[node] = position
+        self._reach = self._reachability()
+
+    @property
+    def nbytes(self) -> int:
+        tables = [*self._out.values(), *self._in.values()]
+        arrays = [self.rank, *self.by_type.values(), *self.phase_members.values()]
+        arrays += [table_array for table in tables for table_array in (table.offsets, table.targets, table.edges)]
+        bitsets = sum((bits.bit_length() + 7) // 8 for bits in self._reach)
+        return sum(len(item) * item.itemsize for item in arrays) + bitsets
+
+    def position(self, rule_id: str) -> int:
+        try:
+            return self.index[rule_id]
+        except KeyError:
+            raise RuleGraphQueryError(f"unknown rule_id: {rule_id}") from None
+
+    def nodes_of_type(self, *node_types: RuleNodeType) -> list[int]:
+        return sorted(node for node_type in node_types for node in self.by_type.get(node_type, ()))
+
+    def can_reach(self, source: int, target: int) -> bool:
+        return source == target or bool(self._reach[source] >> target & 1)
+
+    def subgraph(
+        self,
+        root: str,
+        depth: int,
+        relations: Iterable[RuleRelationType] | None = None,
+        *,
+        reverse: bool = False,
+    ) -> RuleGraphReadResponse:
+        """Nodes within ``depth`` hops of ``root`` along ``relations``, in play order, with the edges among them."""
+        selected = tuple(relations or RuleRelationType)
+        start = self.position(root)
+        adjacency = [(self._in if reverse else self._out)[relation] for relation in selected]
+        follow_phases = RuleRelationType.CONTAINS in selected
+        seen = {start}
+        frontier = [start]
+        for _hop in range(depth):
+            frontier = self._expand(frontier, seen, adjacency, follow_phases=follow_phases, reverse=reverse)
+            if not frontier:
+                break
+        return self._project(seen, relations=set(selected))
+
+    def path(
+        self,
+        source: str,
+        target: str,
+        relations: Iterable[RuleRelationType] | None = None,
+    ) -> tuple[list[int], list[int]] | None:
+        """Shortest directed path as (node positions, edge positions), or None when unreachable."""
+        selected = tuple(relations or RuleRelationType)
+        start, goal = self.position(source), self.position(target)
+        if start == goal:
+            return [start], []
+        if len(selected) == len(RuleRelationType) and not self.can_reach(start, goal):
+            return None
+        return self._breadth_first(start, goal, [self._out[relation] for relation in selected])
+
+    def edges_between(self, nodes: set[int], relations: set[RuleRelationType] | None = None) -> list[RuleEdge]:
+        return [
+            edge
+            for edge in self.graph.edges
+            if (relations is None or edge.relation_type in relations)
+            and self.index[edge.from_rule_id] in nodes
+            and self.index[edge.to_rule_id] in nodes
+        ]
+
+    def _expand(
+        self,
+        frontier: list[int],
+        seen: set[int],
+        adjacency: list[_Adjacency],
+        *,
+        follow_phases: bool,
+        reverse: bool,
+    ) -> list[int]:
+        """One BFS hop: the unseen neighbours of ``frontier``, which are added to ``seen``."""
+        following = []
+        for node in frontier:
+            reached = [target for table in adjacency for target, _edge in table.neighbours(node)]
+            if follow_phases:
+                reached.extend(self._phase_parent(node) if reverse else self.phase_members.get(node, ()))
+            for target in reached:
+                if target not in seen:
+                    seen.add(target)
+                    following.append(target)
+        return following
+
+    def _breadth_first(self, start: int, goal: int, adjacency: list[_Adjacency]) -> tuple[list[int], list[int]] | None:
+        previous: dict[int, tuple[int, int]] = {start: (-1, -1)}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for table in adjacency:
+                for neighbour, edge in table.neighbours(node):
+                    if neighbour in previous:
+                        continue
+                    previous[neighbour] = (node, edge)
+                    if neighbour == goal:
+                        return self._unwind(previous, goal)
+                    queue.append(neighbour)
+        return None
+
+    def _project(self, nodes: set[int], relations: set[RuleRelationType]) -> RuleGraphReadResponse:
+        ordered = sorted(nodes, key=self.rank.__getitem__)
+        return self.graph.model_copy(
+            update={
+                "nodes": [self.graph.nodes[node] for node in ordered],
+                "edges": self.edges_between(nodes, relations),
+            }
+        )
+
+    def _phase_parent(self, node: int) -> list[int]:
+        parents = [source for source, _edge in self._in[RuleRelationType.CONTAINS].neighbours(node)]
+        phase_rule_id = self.graph.nodes[node].phase_rule_id
+        if phase_rule_id in self.index:
+            parents.append(self.index[phase_rule_id])
+        return parents
+
+    def _phase_members(self) -> dict[int, array]:
+        members: dict[int, list[int]] = {}
+        for position, node in enumerate(self.graph.nodes):
+            if node.phase_rule_id in self.index and self.index[node.phase_rule_id] != position:
+                members.setdefault(self.index[node.phase_rule_id], []).append(position)
+        for phase in range(len(self.rule_ids)):
+            for member, _edge in self._out[RuleRelationType.CONTAINS].neighbours(phase):
+                members.setdefault(phase, []).append(member)
+        return {phase: array("i", sorted(set(items))) for phase, items in members.items()}
+
+    def _topological_order(self) -> list[int]:
+        # ``a next b`` puts a first; ``a requires b`` puts b first. Ties (and any cycle
+        # remainder) keep graph order, which is already ``sequence`` order.
+        count = len(self.rule_ids)
+        successors: list[list[int]] = [[] for _ in range(count)]
+        indegree = [0] * count
+        for source in range(count):
+            for target, _edge in self._out[RuleRelationType.NEXT].neighbours(source):
+                successors[source].append(target)
+                indegree[target] += 1
+            for target, _edge in self._out[RuleRelationType.REQUIRES].neighbours(source):
+                successors[target].append(source)
+                indegree[source] += 1
+        ready = [node for node in range(count) if indegree[node] == 0]
+        order: list[int] = []
+        placed = [False] * count
+        while ready:
+            ready.sort(reverse=True)
+            node = ready.pop()
+            order.append(node)
+            placed[node] = True
+            for following in successors[node]:
+                indegree[following] -= 1
+                if indegree[following] == 0:
+                    ready.append(following)
+        order.extend(node for node in range(count) if not placed[node])
+        return order
+
+    def _reachability(self) -> list[int]:
+        # Tarjan SCCs over all relations, then bitsets per component in reverse topological order.
+        count = len(self.rule_ids)
+        successors = [
+            [target for table in self._out.values() for target, _edge in table.neighbours(node)]
+            for node in range(count)
+        ]
+        component, components = _strongly_connected(successors)
+        # Tarjan emits components in reverse topological order, so successors are complete first.
+        reach = [0] * len(components)
+        for position, members in enumerate(components):
+            bits = 0
+            for member in members:
+                bits |= 1 << member
+                for target in successors[member]:
+                    if component[target] != position:
+                        bits |= reach[component[target]]
+            reach[position] = bits
+        return [reach[component[node]] for node in range(count)]
+
+    @staticmethod
+    def _unwind(previous: dict[int, tuple[int, int]], goal: int) -> tuple[list[int], list[int]]:
+        nodes, edges = [goal], []
+        node = goal
+        while previous[node][0] != -1:
+            node, edge = previous[node]
+            nodes.append(node)
+            edges.append(edge)
+        return nodes[::-1], edges[::-1]
+
+
+def _strongly_connected(successors: list[list[int]]) -> tuple[list[int], list[list[int]]]:
+    """Iterative Tarjan: each node's component index, and the components in reverse topological order."""
+    count = len(successors)
+    component = [-1] * count
+    low = [0] * count
+    number = [-1] * count
+    stack: list[int] = []
+    on_stack = [False] * count
+    components: list[list[int]] = []
+    counter = 0
+    for root in range(count):
+        if number[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, child = work.pop()
+            if child == 0:
+                number[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            if child < len(successors[node]):
+                work.append((node, child + 1))
+                target = successors[node][child]
+                if number[target] == -1:
+                    work.append((target, 0))
+                elif on_stack[target]:
+                    low[node] = min(low[node], number[target])
+                continue
+            for target in successors[node]:
+                if on_stack[target]:
+                    low[node] = min(low[node], low[target])
+            if low[node] == number[node]:
+                components.append(_pop_component(stack, on_stack, component, node, len(components)))
+    return component, components
+
+
+def _pop_component(stack: list[int], on_stack: list[bool], component: list[int], root: int, index: int) -> list[int]:
+    members = []
+    while True:
+        member = stack.pop()
+        on_stack[member] = False
+        component[member] = index
+        members.append(member)
+        if member == root:
+            return members
@@ -0,0 +1,218 @@
+"""Cross-game search over canonical rule node statements.
+
+Reads are answered from one process-resident ``RuleSearchIndex``. Every 30s a
+read first re-reads the rule sets whose ``updated_at`` (or whose nodes'
+``updated_at``) moved past the last watermark, and re-indexes only those rule
+sets; deactivated ones are dropped. Migration 027 stamps ``updated_at`` on
+every update and touches a rule set when one of its nodes is deleted or moved,
+so those changes are picked up by the same refresh. A full rebuild every 10
+minutes also drops deleted rule sets.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from app.core import supabase
+from app.core.rule_search_index import RuleSearchIndex
+from app.models.rule_graph import (
+    RuleNodeType,
+    RuleSearchHit,
+    RuleSearchIntent,
+    RuleSearchResponse,
+    RuleVerificationStatus,
+)
+
+logger = logging.getLogger("services.rule_search")
+
+_REFRESH_SECONDS = 30.0
+_REBUILD_SECONDS = 600.0
+_PAGE_SIZE = 1000
+# One in_() query per this many rule set ids stays well below URL length limits.
+_RULE_SET_BATCH = 100
+_RULE_SET_COLUMNS = "id,game_id,is_active,updated_at"
+_NODE_COLUMNS = (
+    "rule_set_id,rule_id,node_type,normalized_statement,sequence,verification_status,"
+    "evidence_ref,source_claim_ref,updated_at"
+)
+
+
+def _empty_watermarks() -> dict[str, str | None]:
+    return {"rule_sets": None, "rule_nodes": None}
+
+
+@dataclass
+class _IndexState:
+    """The process-resident index with its refresh times and watermarks."""
+
+    index: RuleSearchIndex | None = None
+    built: float = 0.0
+    refreshed: float = 0.0
+    watermarks: dict[str, str | None] = field(default_factory=_empty_watermarks)
+    lock: asyncio.Lock | None = None
+    lock_loop: asyncio.AbstractEventLoop | None = None
+
+    def mutex(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self.lock is None or self.lock_loop is not loop:
+            self.lock = asyncio.Lock()
+            self.lock_loop = loop
+        return self.lock
+
+
+_state = _IndexState()
+
+
+async def _read_pages(make_query) -> list[dict]:
+    rows: list[dict] = []
+    while True:
+        page = (await make_query().range(len(rows), len(rows) + _PAGE_SIZE - 1).execute()).data
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+
+
+async def _nodes_by_rule_set(client, rule_set_ids: list[str]) -> dict[str, list[dict]]:
+    nodes: dict[str, list[dict]] = {rule_set_id: [] for rule_set_id in rule_set_ids}
+    for start in range(0, len(rule_set_ids), _RULE_SET_BATCH):
+        batch = rule_set_ids[start : start + _RULE_SET_BATCH]
+        rows = await _read_pages(
+            lambda batch=batch: (
+                client.table("rule_nodes")
+                .select(_NODE_COLUMNS)
+                .in_("rule_set_id", batch)
+                .order("rule_set_id")
+                .order("rule_id")
+            )
+        )
+        for row in rows:
+            nodes[str(row["rule_set_id"])].append(row)
+    return nodes
+
+
+async def _fresh_index() -> RuleSearchIndex:
+    state = _state
+    if state.index is not None and time.monotonic() - state.refreshed < _REFRESH_SECONDS:
+        return state.index
+    async with state.mutex():
+        now = time.monotonic()
+        if state.index is not None and now - state.refreshed < _REFRESH_SECONDS:
+            return state.index
+        client = supabase._get_async_client()
+        rebuild = state.index is None or now - state.built >= _REBUILD_SECONDS
+        index = RuleSearchIndex() if rebuild else state.index
+        watermarks = _empty_watermarks() if rebuild else dict(state.watermarks)
+
+        def rule_sets_query():
+            query = client.table("rule_sets").select(_RULE_SET_COLUMNS)
+            if watermarks["rule_sets"]:
+                query = query.gte("updated_at", watermarks["rule_sets"])
+            return query.order("updated_at").order("id")
+
+        rule_sets = {str(row["id"]): row for row in await _read_pages(rule_sets_query)}
+        if not rebuild:
+            # Node edits that did not touch their rule set row still re-index the whole rule set.
+            def touched_nodes_query():
+                query = client.table("rule_nodes").select("rule_set_id,updated_at")
+                if watermarks["rule_nodes"]:
+                    query = query.gte("updated_at", watermarks["rule_nodes"])
+                return query.order("updated_at").order("id")
+
+            touched = await _read_pages(touched_nodes_query)
+            missing = sorted({str(row["rule_set_id"]) for row in touched} - set(rule_sets))
+            for start in range(0, len(missing), _RULE_SET_BATCH):
+                rows = await (
+                    client.table("rule_sets")
+                    .select(_RULE_SET_COLUMNS)
+                    .in_("id", missing[start : start + _RULE_SET_BATCH])
+                    .execute()
+                )
+                rule_sets.update((str(row["id"]), row) for row in rows.data)
+            watermarks["rule_nodes"] = max(
+                (row["updated_at"] for row in touched if row.get("updated_at")), default=watermarks["rule_nodes"]
+            )
+
+        active = [rule_set_id for rule_set_id, row in rule_sets.items() if row.get("is_active")]
+        nodes = await _nodes_by_rule_set(client, active)
+        for rule_set_id, row in rule_sets.items():
+            if row.get("is_active"):
+                index.replace_rule_set(row, nodes[rule_set_id])
+            else:
+                index.remove_rule_set(rule_set_id)
+        # gte re-reads rows stamped exactly at the watermark, so concurrent writes in that instant are not lost.
+        watermarks["rule_sets"] = max(
+            (row["updated_at"] for row in rule_sets.values() if row.get("updated_at")),
+            default=watermarks["rule_sets"],
+        )
+        if rebuild:
+            watermarks["rule_nodes"] = max(
+                (row["updated_at"] for rows in nodes.values() for row in rows if row.get("updated_at")),
+                default=None,
+            )
+        state.index, state.refreshed = index, now
+        state.watermarks.update(watermarks)
+        if rebuild:
+            state.built = now
+        return index
+
+
+def reset_index() -> None:
+    _state.index, _state.built, _state.refreshed = None, 0.0, 0.0
+    _state.watermarks.update(_empty_watermarks())
+
+
+class RuleSearchService:
+    async def search(  # noqa: PLR0913 - keyword-only search filters
+        self,
+        query: str = "",
+        *,
+        node_types: Iterable[RuleNodeType] | None = None,
+        game_slug: str | None = None,
+        verification_statuses: Iterable[RuleVerificationStatus] | None = None,
+        intent: RuleSearchIntent | None = None,
+        limit: int = 20,
+    ) -> RuleSearchResponse | None:
+        """Ranked rule matches across games; None when ``game_slug`` names no game."""
+        game_ids = None
+        if game_slug:
+            game = await supabase.get_by_slug(game_slug)
+            if not game:
+                return None
+            game_ids = [str(game["id"])]
+
+        if supabase.is_local():
+            return RuleSearchResponse(status="not_available", query=query)
+        try:
+            index = await _fresh_index()
+        except Exception as exc:
+            # Deploying application code before the database migration must fail closed.
+            logger.warning("Rule search index unavailable: %s", exc)
+            return RuleSearchResponse(status="not_available", query=query)
+
+        matches = index.search(
+            query,
+            node_types=[node_type.value for node_type in node_types or ()],
+            game_ids=game_ids,
+            verification_statuses=[status.value for status in verification_statuses or ()],
+            intent=intent.value if intent else None,
+        )
+        return RuleSearchResponse(
+            status="available",
+            query=query,
+            total=len(matches),
+            results=[
+                RuleSearchHit(
+                    rule_id=document.rule_id,
+                    rule_set_id=document.rule_set_id,
+                    game_id=document.game_id,
+                    node_type=document.node_type,
+                    verification_status=document.verification_status,
+                    normalized_statement=document.normalized_statement,
+                    evidence_ref=document.evidence_ref,
+                    source_claim_ref=document.source_claim_ref,
+                )
+                for document in matches[:limit]
+            ],
+        )
@@ -1,7 +1,5 @@
 import logging
 
-import anyio
-
 from app.core import supabase
 from app.models.ruleset import RuleSet, RuleSetListResponse
 
@@ -23,7 +21,7 @@ class RuleSetService:
             return RuleSetListResponse(status="not_available", **base)
 
         try:
-            rows = await anyio.to_thread.run_sync(self._load_rulesets, game)
+            rows = await self._load_rulesets(game)
         except Exception as exc:
             # Application code may be deployed before migration 013. Fail closed
             # instead of inferring edition/platform identity from legacy Game data.
@@ -40,17 +38,16 @@ class RuleSetService:
         )
 
     @staticmethod
-    def _load_rulesets(game: dict) -> list[dict]:
+    async def _load_rulesets(game: dict) -> list[dict]:
         return (
-            supabase._get_client()
+            await supabase._get_async_client()
             .table("rule_sets")
             .select("*")
             .eq("game_id", game["id"])
             .order("is_active", desc=True)
             .order("version", desc=True)
             .execute()
-            .data
-        )
+        ).data
 
     @staticmethod
     def _to_model(row: dict) -> RuleSet:
@@ -12,19 +12,114 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://bodoge-no-mikata.vercel.app"
 
 
-def _replace_or_insert_tag(document: str, pattern: str, replacement: str) -> str:
-    updated, count = re.subn(pattern, replacement, document, count=1, flags=re.IGNORECASE | re.DOTALL)
-    if count:
-        return updated
-    return document.replace("</head>", f"  {replacement}\n</head>", 1)
+_TITLE_TAG = re.compile(r"<title\b[^>]*>.*?</title>", re.IGNORECASE | re.DOTALL)
+_CANONICAL_TAG = re.compile(r'<link\b(?=[^>]*\brel=["\']canonical["\'])[^>]*>', re.IGNORECASE | re.DOTALL)
+_SSR_ROOT = '<div id="root"></div>'
+# (slot, attribute, key) for every per-game <meta> tag, in document insertion order.
+_META_SLOTS = (
+    ("description", "name", "description"),
+    ("robots", "name", "robots"),
+    ("og_title", "property", "og:title"),
+    ("og_description", "property", "og:description"),
+    ("og_url", "property", "og:url"),
+    ("og_image", "property", "og:image"),
+    ("twitter_title", "name", "twitter:title"),
+    ("twitter_description", "name", "twitter:description"),
+    ("twitter_image", "name", "twitter:image"),
+)
+# Private-use code points never occur in index.html and survive html.escape.
+_SLOT_MARKER = re.compile("\ue000(\\w+)\ue001")
+_FALLBACK_TEMPLATE = '<html lang="ja"><head><title>ボドゲのミカタ</title></head><body><div id="root"></div></body></html>'
 
 
-def _meta_tag(document: str, *, attr: str, key: str, content: str) -> str:
-    escaped_content = html.escape(content, quote=True)
-    escaped_key = re.escape(key)
-    pattern = rf'<meta\b(?=[^>]*\b{attr}=["\']{escaped_key}["\'])[^>]*>'
-    replacement = f'<meta {attr}="{html.escape(key, quote=True)}" content="{escaped_content}" />'
-    return _replace_or_insert_tag(document, pattern, replacement)
+def _slot(name: str) -> str:
+    return f"\ue000{name}\ue001"
+
+
+def _meta_pattern(attr: str, key: str) -> re.Pattern[str]:
+    return re.compile(rf'<meta\b(?=[^>]*\b{attr}=["\']{re.escape(key)}["\'])[^>]*>', re.IGNORECASE | re.DOTALL)
+
+
+def _meta_html(attr: str, key: str, content: str) -> str:
+    return f'<meta {attr}="{html.escape(key, quote=True)}" content="{html.escape(content, quote=True)}" />'
+
+
+class _CompiledTemplate:
+    """index.html split once into static segments and named slots; rendering is one join."""
+
+    def __init__(self, document: str):
+        self.defaults: dict[str, str] = {}
+        # Slots with no tag in the template are inserted before </head>, indented, only when given a value.
+        self.inserted: set[str] = set()
+        document = self._slot_tag(document, _TITLE_TAG, "title")
+        for name, attr, key in _META_SLOTS:
+            document = self._slot_tag(document, _meta_pattern(attr, key), name)
+        document = self._slot_tag(document, _CANONICAL_TAG, "canonical")
+        self.inserted.add("json_ld")
+        document = document.replace("</head>", f"{_slot('json_ld')}</head>", 1)
+        document = document.replace(_SSR_ROOT, _slot("ssr_root"), 1)
+        # Even indexes are static text, odd indexes are slot names.
+        self.segments = _SLOT_MARKER.split(document)
+
+    def _slot_tag(self, document: str, pattern: re.Pattern[str], name: str) -> str:
+        match = pattern.search(document)
+        if match:
+            # The template's own tag stays when a page does not override it (e.g. robots).
+            self.defaults[name] = match.group(0)
+            return f"{document[: match.start()]}{_slot(name)}{document[match.end() :]}"
+        self.inserted.add(name)
+        return document.replace("</head>", f"{_slot(name)}</head>", 1)
+
+    def render(self, values: dict[str, str]) -> str:
+        pieces = []
+        for index, segment in enumerate(self.segments):
+            if index % 2 == 0:
+                pieces.append(segment)
+                continue
+            value = values.get(segment, self.defaults.get(segment, ""))
+            pieces.append(f"  {value}\n" if value and segment in self.inserted else value)
+        return "".join(pieces)
+
+
+_template_cache: dict[Path | None, tuple[float, _CompiledTemplate]] = {}
+
+
+def _template_paths() -> list[Path]:
+    root = Path(os.getenv("LAMBDA_TASK_ROOT", Path(__file__).resolve().parent.parent.parent.parent))
+    return [
+        root / "frontend" / "dist" / "index.html",
+        root / "public" / "index.html",
+        root / "index.html",
+    ]
+
+
+def compiled_template() -> _CompiledTemplate:
+    """Return the compiled index.html, recompiling only when the file found or its mtime changes."""
+    paths = _template_paths()
+    for path in paths:
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        except OSError as exc:
+            logger.warning(f"Error reading path {path}: {exc}")
+            continue
+        cached = _template_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            template = _CompiledTemplate(path.read_text(encoding="utf-8"))
+        except Exception as exc:
+            logger.warning(f"Error reading path {path}: {exc}")
+            continue
+        _template_cache[path] = (mtime, template)
+        return template
+
+    cached = _template_cache.get(None)
+    if cached is None:
+        logger.error(f"index.html template not found in {paths}")
+        cached = _template_cache[None] = (0.0, _CompiledTemplate(_FALLBACK_TEMPLATE))
+    return cached[1]
 
 
 def _safe_json_script(data: dict) -> str:
@@ -114,60 +209,26 @@ async def generate_seo_html(slug: str) -> str | None:
         ],
     }
 
-    root = Path(os.getenv("LAMBDA_TASK_ROOT", Path(__file__).resolve().parent.parent.parent.parent))
-    possible_paths = [
-        root / "frontend" / "dist" / "index.html",
-        root / "public" / "index.html",
-        root / "index.html",
-    ]
-    html_content = ""
-    for path in possible_paths:
-        try:
-            if path.exists():
-                html_content = path.read_text(encoding="utf-8")
-                break
-        except Exception as exc:
-            logger.warning(f"Error reading path {path}: {exc}")
-
-    if not html_content:
-        logger.error(f"index.html template not found in {possible_paths}")
-        html_content = '<html lang="ja"><head><title>ボドゲのミカタ</title></head><body><div id="root"></div></body></html>'
-
-    escaped_title = html.escape(page_title, quote=False)
-    html_content = _replace_or_insert_tag(
-        html_content,
-        r"<title\b[^>]*>.*?</title>",
-        f"<title>{escaped_title}</title>",
-    )
-    html_content = _meta_tag(html_content, attr="name", key="description", content=seo_description)
-    if hide_from_search:
-        html_content = _meta_tag(html_content, attr="name", key="robots", content="noindex, follow")
-    html_content = _meta_tag(html_content, attr="property", key="og:title", content=page_title)
-    html_content = _meta_tag(html_content, attr="property", key="og:description", content=seo_description)
-    html_content = _meta_tag(html_content, attr="property", key="og:url", content=game_url)
-    html_content = _meta_tag(html_content, attr="property", key="og:image", content=image_url)
-    html_content = _meta_tag(html_content, attr="name", key="twitter:title", content=page_title)
-    html_content = _meta_tag(html_content, attr="name", key="twitter:description", content=seo_description)
-    html_content = _meta_tag(html_content, attr="name", key="twitter:image", content=image_url)
-
-    canonical_tag = f'<link rel="canonical" href="{html.escape(game_url, quote=True)}" />'
-    html_content = _replace_or_insert_tag(
-        html_content,
-        r'<link\b(?=[^>]*\brel=["\']canonical["\'])[^>]*>',
-        canonical_tag,
-    )
-
     json_ld = _safe_json_script(structured_data)
-    script_tag = f'<script type="application/ld+json" data-game-seo="true">{json_ld}</script>'
     breadcrumb_json_ld = _safe_json_script(breadcrumb_data)
-    breadcrumb_script_tag = (
-        f'<script type="application/ld+json" data-breadcrumb-seo="true">{breadcrumb_json_ld}</script>'
-    )
-    html_content = html_content.replace(
-        "</head>",
-        f"  {script_tag}\n  {breadcrumb_script_tag}\n</head>",
-        1,
-    )
+    values = {
+        "title": f"<title>{html.escape(page_title, quote=False)}</title>",
+        "description": _meta_html("name", "description", seo_description),
+        "og_title": _meta_html("property", "og:title", page_title),
+        "og_description": _meta_html("property", "og:description", seo_description),
+        "og_url": _meta_html("property", "og:url", game_url),
+        "og_image": _meta_html("property", "og:image", image_url),
+        "twitter_title": _meta_html("name", "twitter:title", page_title),
+        "twitter_description": _meta_html("name", "twitter:description", seo_description),
+        "twitter_image": _meta_html("name", "twitter:image", image_url),
+        "canonical": f'<link rel="canonical" href="{html.escape(game_url, quote=True)}" />',
+        "json_ld": (
+            f'<script type="application/ld+json" data-game-seo="true">{json_ld}</script>\n'
+            f'  <script type="application/ld+json" data-breadcrumb-seo="true">{breadcrumb_json_ld}</script>'
+        ),
+    }
+    if hide_from_search:
+        values["robots"] = _meta_html("name", "robots", "noindex, follow")
 
     safe_title = html.escape(title)
     safe_summary = html.escape(str(game.get("summary") or ""))
@@ -203,4 +264,5 @@ async def generate_seo_html(slug: str) -> str | None:
     </section>
   </article>
 </div>"""
-    return html_content.replace('<div id="root"></div>', ssr_content, 1)
+    values["ssr_root"] = ssr_content
+    return compiled_template().render(values)
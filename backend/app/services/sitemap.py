@@ -1,64 +1,164 @@
+import hashlib
 import os
-import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
 
 from app.core.supabase import list_for_sitemap
+from app.core.ttl_cache import TTLCache
 from app.services.search_visibility import should_hide_game_from_search
 
 NS_SITEMAP = "http://www.sitemaps.org/schemas/sitemap/0.9"
 NS_IMAGE = "http://www.google.com/schemas/sitemap-image/1.1"
-ET.register_namespace("", NS_SITEMAP)
-ET.register_namespace("image", NS_IMAGE)
 STATIC_LASTMOD = "2025-12-20"
+STATIC_PAGES = (
+    {"loc": "/", "priority": "1.0", "changefreq": "daily"},
+    {"loc": "/data", "priority": "0.8", "changefreq": "weekly"},
+)
+# The sitemaps.org limit per child sitemap; the static pages count against the first chunk.
+SITEMAP_MAX_URLS = 50_000
+_PAGE_SIZE = 1000
+# Chunk boundaries come from one slug/updated_at walk of the catalog, reused while fresh so
+# crawler hits on the index and on unchanged chunks never re-read the games table.
+_PLAN_TTL_SECONDS = 300.0
+_plan_cache = TTLCache(max_entries=1, ttl_seconds=_PLAN_TTL_SECONDS)
 
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_URLSET_OPEN = f'<urlset xmlns="{NS_SITEMAP}" xmlns:image="{NS_IMAGE}">'
 
-async def get_sitemap_xml() -> str:
-    base_url = os.getenv("NEXT_PUBLIC_BASE_URL", "https://bodoge-no-mikata.vercel.app")
-    games = await list_for_sitemap()
-    root = ET.Element(f"{{{NS_SITEMAP}}}urlset")
-    static_pages = [
-        {"loc": "/", "priority": "1.0", "changefreq": "daily"},
-        {"loc": "/data", "priority": "0.8", "changefreq": "weekly"},
-    ]
-    for page in static_pages:
-        url_elem = ET.SubElement(root, f"{{{NS_SITEMAP}}}url")
-        loc = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}loc")
-        loc.text = f"{base_url}{page['loc']}"
-        lastmod = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}lastmod")
-        lastmod.text = STATIC_LASTMOD
-        changefreq = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}changefreq")
-        changefreq.text = page["changefreq"]
-        priority = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}priority")
-        priority.text = page["priority"]
-
-    for game in games:
-        slug = str(game.get("slug") or "").strip()
-        if not slug or should_hide_game_from_search(slug):
-            continue
-
-        url_elem = ET.SubElement(root, f"{{{NS_SITEMAP}}}url")
-        loc = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}loc")
-        loc.text = f"{base_url}/games/{slug}"
-        lastmod = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}lastmod")
-        updated = game.get("updated_at")
-        if updated:
-            try:
-                dt = datetime.fromisoformat(updated.replace("Z", "+00:00"))
-                lastmod.text = dt.strftime("%Y-%m-%d")
-            except Exception:
-                lastmod.text = STATIC_LASTMOD
-        else:
-            lastmod.text = STATIC_LASTMOD
-        changefreq = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}changefreq")
-        changefreq.text = "weekly"
-        priority = ET.SubElement(url_elem, f"{{{NS_SITEMAP}}}priority")
-        priority.text = "0.7"
-        image_url = game.get("image_url")
-        if image_url:
-            if image_url.startswith("/"):
-                image_url = f"{base_url}{image_url}"
-            image = ET.SubElement(url_elem, f"{{{NS_IMAGE}}}image")
-            image_loc = ET.SubElement(image, f"{{{NS_IMAGE}}}loc")
-            image_loc.text = image_url
-    xml_str = ET.tostring(root, encoding="unicode", method="xml")
-    return '<?xml version="1.0" encoding="UTF-8"?>\n' + xml_str
+
+@dataclass(frozen=True)
+class SitemapChunk:
+    """One child sitemap: the games with ``after_slug < slug <= through_slug``."""
+
+    number: int
+    after_slug: str
+    through_slug: str | None
+    game_urls: int
+    max_updated_at: str | None
+
+    @property
+    def etag(self) -> str:
+        identity = f"{self.number}:{self.after_slug}:{self.through_slug}:{self.game_urls}:{self.max_updated_at}"
+        return f'"{hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]}"'
+
+    @property
+    def last_modified(self) -> str | None:
+        parsed = _parse_timestamp(self.max_updated_at)
+        return format_datetime(parsed, usegmt=True) if parsed and parsed.tzinfo else None
+
+
+def base_url() -> str:
+    return os.getenv("NEXT_PUBLIC_BASE_URL", "https://bodoge-no-mikata.vercel.app")
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _lastmod(value: str | None) -> str:
+    parsed = _parse_timestamp(value)
+    return parsed.strftime("%Y-%m-%d") if parsed else STATIC_LASTMOD
+
+
+def _visible_slug(row: dict) -> str | None:
+    slug = str(row.get("slug") or "").strip()
+    return slug if slug and not should_hide_game_from_search(slug) else None
+
+
+async def _iter_games(
+    after_slug: str,
+    through_slug: str | None,
+    columns: tuple[str, ...] = ("slug", "updated_at", "image_url"),
+) -> AsyncIterator[list[dict]]:
+    # Keyset pages by slug; each yielded page is already filtered to emittable games.
+    while True:
+        rows = await list_for_sitemap(after_slug, through_slug=through_slug, limit=_PAGE_SIZE, columns=columns)
+        if not rows:
+            return
+        yield [row for row in rows if _visible_slug(row)]
+        if len(rows) < _PAGE_SIZE:
+            return
+        after_slug = rows[-1]["slug"]
+
+
+async def sitemap_chunks() -> list[SitemapChunk]:
+    """Split the visible catalog into child sitemaps of at most ``SITEMAP_MAX_URLS`` URLs."""
+    hit, chunks = _plan_cache.lookup("chunks")
+    if hit:
+        return chunks
+
+    chunks = []
+    after, through, count, latest = "", None, 0, None
+    capacity = SITEMAP_MAX_URLS - len(STATIC_PAGES)
+    async for rows in _iter_games("", None, columns=("slug", "updated_at")):
+        for row in rows:
+            if count == capacity:
+                chunks.append(SitemapChunk(len(chunks) + 1, after, through, count, latest))
+                after, count, latest, capacity = through, 0, None, SITEMAP_MAX_URLS
+            through = row["slug"]
+            count += 1
+            updated = row.get("updated_at")
+            if updated and (latest is None or updated > latest):
+                latest = updated
+    chunks.append(SitemapChunk(len(chunks) + 1, after, through, count, latest))
+    _plan_cache.set("chunks", chunks)
+    return chunks
+
+
+def sitemap_index_etag(chunks: list[SitemapChunk]) -> str:
+    digest = hashlib.sha256("|".join(chunk.etag for chunk in chunks).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def sitemap_index_xml(chunks: list[SitemapChunk], root_url: str) -> str:
+    entries = "".join(
+        f"<sitemap><loc>{escape(f'{root_url}/sitemaps/games-{chunk.number}.xml')}</loc>"
+        f"<lastmod>{_lastmod(chunk.max_updated_at)}</lastmod></sitemap>"
+        for chunk in chunks
+    )
+    return f'{_XML_DECLARATION}<sitemapindex xmlns="{NS_SITEMAP}">{entries}</sitemapindex>'
+
+
+def _url_entry(loc: str, lastmod: str, changefreq: str, priority: str, image_url: str | None = None) -> str:
+    image = f"<image:image><image:loc>{escape(image_url)}</image:loc></image:image>" if image_url else ""
+    return (
+        f"<url><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod>"
+        f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority>{image}</url>"
+    )
+
+
+async def iter_sitemap_chunk(chunk: SitemapChunk, root_url: str) -> AsyncIterator[str]:
+    """Stream one child sitemap as XML text, one keyset page of games per yielded piece."""
+    yield _XML_DECLARATION + _URLSET_OPEN
+    if chunk.number == 1:
+        yield "".join(
+            _url_entry(f"{root_url}{page['loc']}", STATIC_LASTMOD, page["changefreq"], page["priority"])
+            for page in STATIC_PAGES
+        )
+    if chunk.game_urls:
+        async for rows in _iter_games(chunk.after_slug, chunk.through_slug):
+            pieces = []
+            for row in rows:
+                image_url = row.get("image_url")
+                if image_url and image_url.startswith("/"):
+                    image_url = f"{root_url}{image_url}"
+                loc = f"{root_url}/games/{_visible_slug(row)}"
+                pieces.append(_url_entry(loc, _lastmod(row.get("updated_at")), "weekly", "0.7", image_url))
+            yield "".join(pieces)
+    yield "</urlset>"
+
+
+async def get_sitemap_xml(number: int = 1) -> str | None:
+    """Return one whole child sitemap (``None`` past the last chunk); the HTTP route streams instead."""
+    chunks = await sitemap_chunks()
+    if not 1 <= number <= len(chunks):
+        return None
+    return "".join([piece async for piece in iter_sitemap_chunk(chunks[number - 1], base_url())])
@@ -0,0 +1,172 @@
+import operator as _operator
+import re
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import supabase
+
+_COMPARISONS = {"gt": _operator.gt, "gte": _operator.ge, "lte": _operator.le}
+_MIGRATIONS = Path(__file__).resolve().parents[1] / "app" / "db" / "migrations"
+_CREATE_TABLE = re.compile(r"CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+) \(")
+_COLUMN = re.compile(r"^  ([a-z_][a-z0-9_]*) ")
+
+
+def _split_top_level(text: str) -> list[str]:
+    parts, depth, quoted, start = [], 0, False, 0
+    for position, char in enumerate(text):
+        if char == '"' and text[position - 1 : position] != "\\":
+            quoted = not quoted
+        elif not quoted and char in "()":
+            depth += 1 if char == "(" else -1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append(text[start:position])
+            start = position + 1
+    return [*parts, text[start:]]
+
+
+def _logic_tree(term: str):
+    """Predicate for one PostgREST ``or``/``and`` logic-tree term, as built by ``postgrest_seek_filter``."""
+    for operator, combine in (("and(", all), ("or(", any)):
+        if term.startswith(operator):
+            branches = [_logic_tree(branch) for branch in _split_top_level(term[len(operator) : -1])]
+            return lambda row: combine(branch(row) for branch in branches)
+    column, operator, raw = term.split(".", 2)
+    text = raw[1:-1].replace('\\"', '"').replace("\\\\", "\\") if raw.startswith('"') else raw
+    if operator == "is":
+        return lambda row: row.get(column) is None
+    compare = {"eq": _operator.eq, "gt": _operator.gt, "lt": _operator.lt}[operator]
+
+    def _match(row: dict) -> bool:
+        value = row.get(column)
+        return value is not None and compare(value, type(value)(text))
+
+    return _match
+
+
+def _migration_columns() -> dict[str, set[str]]:
+    """Columns of every table the migrations create, so the fake can reject orders PostgREST answers with 400."""
+    columns: dict[str, set[str]] = {}
+    for path in sorted(_MIGRATIONS.glob("*.sql")):
+        table = None
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if match := _CREATE_TABLE.search(line):
+                table = match.group(1)
+                columns.setdefault(table, set())
+            elif table and line.startswith(")"):
+                table = None
+            elif table and (match := _COLUMN.match(line)):
+                columns[table].add(match.group(1))
+    return {table: names for table, names in columns.items() if names}
+
+
+_SCHEMA = _migration_columns()
+
+
+class FakeAsyncQuery:
+    def __init__(self, backend: "FakeAsyncPostgrest", table: str):
+        self._backend = backend
+        self._table = table
+        self._filters: list[tuple[str, str, object]] = []
+        self._orders: list[tuple[str, bool]] = []
+        self._limit: int | None = None
+        self._offset = 0
+        self._count = False
+        self._head = False
+
+    def select(self, _columns: str = "*", *, count: str | None = None, head: bool = False):
+        self._count = count is not None
+        self._head = head
+        return self
+
+    def eq(self, column: str, value):
+        self._filters.append(("eq", column, value))
+        return self
+
+    def gt(self, column: str, value):
+        self._filters.append(("gt", column, value))
+        return self
+
+    def gte(self, column: str, value):
+        self._filters.append(("gte", column, value))
+        return self
+
+    def lte(self, column: str, value):
+        self._filters.append(("lte", column, value))
+        return self
+
+    def in_(self, column: str, values):
+        self._filters.append(("in", column, [str(value) for value in values]))
+        return self
+
+    def or_(self, filters: str):
+        self._filters.append(("or", filters, _logic_tree(f"or({filters})")))
+        return self
+
+    def order(self, column: str, *, desc: bool = False, nullsfirst: bool | None = None):
+        if self._table in _SCHEMA and column not in _SCHEMA[self._table]:
+            raise ValueError(f"column {self._table}.{column} does not exist")
+        self._orders.append((column, desc))
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def range(self, start: int, end: int):
+        self._offset = start
+        self._limit = end - start + 1
+        return self
+
+    def _matches(self, row: dict) -> bool:
+        for operator, column, value in self._filters:
+            if operator == "eq" and row.get(column) != value:
+                return False
+            if operator == "in" and str(row.get(column)) not in value:
+                return False
+            if operator == "or" and not value(row):
+                return False
+            if operator in _COMPARISONS and (row.get(column) is None or not _COMPARISONS[operator](row[column], value)):
+                return False
+        return True
+
+    async def execute(self):
+        self._backend.queries.append((self._table, tuple(self._filters)))
+        rows = [dict(row) for row in self._backend.tables.get(self._table, []) if self._matches(row)]
+        # PostgreSQL does not keep ties in a stable order between queries; rotating the heap per round trip
+        # makes a page walk that orders by a non-unique key skip and repeat rows here as it can there.
+        if rows:
+            shift = len(self._backend.queries) % len(rows)
+            rows = rows[shift:] + rows[:shift]
+        for column, desc in reversed(self._orders):
+            rows.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        total = len(rows)
+        rows = rows[self._offset :]
+        if self._limit is not None:
+            rows = rows[: self._limit]
+        return SimpleNamespace(data=[] if self._head else rows, count=total if self._count else None)
+
+
+class FakeAsyncPostgrest:
+    """In-memory stand-in for ``AsyncPostgrestClient`` that records every round trip."""
+
+    def __init__(self, tables: dict[str, list[dict]]):
+        self.tables = tables
+        self.queries: list[tuple[str, tuple]] = []
+
+    def table(self, name: str) -> FakeAsyncQuery:
+        return FakeAsyncQuery(self, name)
+
+    def queries_for(self, table: str) -> list[tuple]:
+        return [filters for name, filters in self.queries if name == table]
+
+
+@pytest.fixture
+def fake_postgrest(monkeypatch):
+    def _install(tables: dict[str, list[dict]]) -> FakeAsyncPostgrest:
+        backend = FakeAsyncPostgrest(tables)
+        monkeypatch.setattr(supabase, "_get_async_client", lambda: backend)
+        return backend
+
+    return _install
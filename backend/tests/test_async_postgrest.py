@@ -0,0 +1,104 @@
+import httpx
+import pytest
+
+from app.core.postgrest import AsyncPostgrestClient, PostgrestError
+
+
+def _client(handler) -> AsyncPostgrestClient:
+    return AsyncPostgrestClient(
+        "https://project.supabase.co/",
+        "service-key",
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.mark.asyncio
+async def test_select_chain_encodes_postgrest_filters_order_and_range():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[{"id": "game-1"}], headers={"Content-Range": "0-24/3573"})
+
+    client = _client(handler)
+    response = await (
+        client.table("games")
+        .select("id, slug", count="exact")
+        .eq("is_active", True)
+        .in_("slug", ["catan", "a,b", 'quote"d'])
+        .order("title_ja", desc=False, nullsfirst=False)
+        .order("created_at", desc=True)
+        .range(25, 49)
+        .execute()
+    )
+    await client.aclose()
+
+    request = seen[0]
+    assert request.method == "GET"
+    assert request.url.path == "/rest/v1/games"
+    assert request.headers["apikey"] == "service-key"
+    assert request.headers["authorization"] == "Bearer service-key"
+    assert request.headers["prefer"] == "count=exact"
+    params = request.url.params
+    assert params["select"] == "id,slug"
+    assert params["is_active"] == "eq.true"
+    assert params["slug"] == 'in.(catan,"a,b","quote\\"d")'
+    assert params["order"] == "title_ja.asc.nullslast,created_at.desc"
+    assert params["offset"] == "25"
+    assert params["limit"] == "25"
+    assert response.data == [{"id": "game-1"}]
+    assert response.count == 3573
+
+
+@pytest.mark.asyncio
+async def test_head_select_reads_only_the_count():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, headers={"Content-Range": "*/42"})
+
+    client = _client(handler)
+    response = await client.table("games").select("id", count="exact", head=True).gte("max_players", 5).execute()
+    await client.aclose()
+
+    assert seen[0].method == "HEAD"
+    assert seen[0].headers["prefer"] == "count=exact"
+    assert response.data == []
+    assert response.count == 42
+
+
+@pytest.mark.asyncio
+async def test_write_and_rpc_requests_use_representation_and_post_body():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[{"ok": True}])
+
+    client = _client(handler)
+    await client.table("games").upsert({"slug": "catan"}, on_conflict="slug").execute()
+    await client.rpc("increment_view_count", {"p_slug": "catan"}).execute()
+    await client.aclose()
+
+    upsert, rpc = seen
+    assert upsert.method == "POST"
+    assert upsert.url.params["on_conflict"] == "slug"
+    assert upsert.headers["prefer"] == "return=representation,resolution=merge-duplicates"
+    assert upsert.content == b'{"slug":"catan"}'
+    assert rpc.url.path == "/rest/v1/rpc/increment_view_count"
+    assert rpc.content == b'{"p_slug":"catan"}'
+
+
+@pytest.mark.asyncio
+async def test_error_response_keeps_postgres_code_for_conflict_detection():
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(409, json={"code": "23505", "message": "duplicate key value"})
+
+    client = _client(handler)
+    with pytest.raises(PostgrestError) as raised:
+        await client.table("user_list_items").insert({"list_id": "l", "game_id": "g"}).execute()
+    await client.aclose()
+
+    assert raised.value.status_code == 409
+    assert "23505" in str(raised.value)
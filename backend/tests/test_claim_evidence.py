@@ -7,6 +7,8 @@ from app.models.evidence import (
     Claim,
     ClaimDetailResponse,
     ClaimTarget,
+    EvidenceBatchRequest,
+    EvidenceBatchResponse,
     EvidenceBinding,
     EvidenceBindingDetail,
     EvidenceSource,
@@ -15,6 +17,8 @@ from app.models.evidence import (
     build_claim_trace,
 )
 from app.routers import games
+from app.services import evidence as evidence_service
+from app.services.evidence import EvidenceService
 
 
 def _claim(claim_id: str = "claim.rule.end", **overrides) -> Claim:
@@ -234,6 +238,20 @@ class FakeEvidenceService:
             claims=[trace],
         )
 
+    async def get_traces(self, slug, request):
+        if slug == "missing":
+            return None
+        return EvidenceBatchResponse(
+            status="available",
+            game_id="game-1",
+            slug=slug,
+            ruleset_id=request.rule_set_id,
+            traces=[
+                {"target": target, "claims": [build_claim_trace(_claim(target=target), [_binding_detail()])]}
+                for target in request.targets
+            ],
+        )
+
     async def get_claim(self, slug, ruleset_id, claim_id):
         if slug == "missing" or claim_id == "missing":
             return None
@@ -281,3 +299,104 @@ def test_claim_detail_api_returns_trace():
     response = client.get("/api/games/example/claims/claim.rule.end", params={"rule_set_id": "ruleset-1"})
     assert response.status_code == 200
     assert response.json()["trace"]["claim"]["claim_id"] == "claim.rule.end"
+
+
+def test_evidence_batch_api_requires_exactly_one_target_selector():
+    client = TestClient(_app())
+    rule_target = {"target_type": "rule_node", "rule_id": "rule.game-end"}
+
+    response = client.post("/api/games/example/evidence", json={"rule_set_id": "ruleset-1", "targets": [rule_target]})
+    assert response.status_code == 200
+    assert response.json()["traces"][0]["target"]["rule_id"] == "rule.game-end"
+
+    both = client.post(
+        "/api/games/example/evidence",
+        json={"rule_set_id": "ruleset-1", "targets": [rule_target], "target_type": "rule_node"},
+    )
+    neither = client.post("/api/games/example/evidence", json={"rule_set_id": "ruleset-1"})
+    too_many = client.post(
+        "/api/games/example/evidence",
+        json={"rule_set_id": "ruleset-1", "targets": [rule_target] * 201},
+    )
+    missing = client.post("/api/games/missing/evidence", json={"rule_set_id": "ruleset-1", "targets": [rule_target]})
+    assert [both.status_code, neither.status_code, too_many.status_code] == [422, 422, 422]
+    assert missing.status_code == 404
+
+
+def _claim_row(claim_id: str, **target) -> dict:
+    return {
+        "claim_id": claim_id,
+        "rule_set_id": "ruleset-1",
+        "claim_type": "component_property",
+        "normalized_payload": {},
+        "lifecycle_status": "accepted",
+        "created_at": claim_id,
+        **target,
+    }
+
+
+@pytest.mark.asyncio
+async def test_evidence_batch_maps_each_requested_target_to_its_claims(fake_postgrest):
+    property_target = {"target_type": "component_property", "component_id": "card.scout", "property_key": "cost"}
+    backend = fake_postgrest(
+        {
+            "rule_sets": [{"id": "ruleset-1", "game_id": "game-1"}],
+            "claims": [
+                _claim_row("claim.cost.0", ordinal=0, **property_target),
+                _claim_row("claim.cost.1", ordinal=1, **property_target),
+                _claim_row("claim.rule.end", target_type="rule_node", rule_id="rule.end"),
+            ],
+            "evidence_bindings": [
+                {"binding_id": "binding.cost.0", "claim_id": "claim.cost.0", "source_id": "source.rules", "relation": "supports"}
+            ],
+            "evidence_sources": [
+                {"source_id": "source.rules", "url": "https://publisher.example/rules", "source_type": "publisher_rules"}
+            ],
+        }
+    )
+    request = EvidenceBatchRequest(
+        rule_set_id="ruleset-1",
+        targets=[
+            ClaimTarget(ordinal=1, **property_target),
+            ClaimTarget(target_type="rule_node", rule_id="rule.end"),
+            ClaimTarget(ordinal=0, **property_target),
+            ClaimTarget(target_type="rule_node", rule_id="rule.unknown"),
+        ],
+    )
+    base = {"game_id": "game-1", "slug": "example", "ruleset_id": "ruleset-1"}
+
+    response = await EvidenceService._load_batch({"id": "game-1"}, request, base)
+
+    assert [[trace.claim.claim_id for trace in entry.claims] for entry in response.traces] == [
+        ["claim.cost.1"],
+        ["claim.rule.end"],
+        ["claim.cost.0"],
+        [],
+    ]
+    assert response.traces[2].claims[0].support_status == "supported"
+    assert len(backend.queries_for("rule_sets")) == 1
+    assert len(backend.queries_for("claims")) == 2
+    assert len(backend.queries_for("evidence_bindings")) == 1
+
+
+@pytest.mark.asyncio
+async def test_evidence_batch_by_type_caps_claims_without_splitting_a_target(monkeypatch, fake_postgrest):
+    monkeypatch.setattr(evidence_service, "MAX_EVIDENCE_BATCH_CLAIMS", 3)
+    fake_postgrest(
+        {
+            "rule_sets": [{"id": "ruleset-1", "game_id": "game-1"}],
+            "claims": [
+                _claim_row(f"claim.{rule}.{index}", target_type="rule_node", rule_id=f"rule.{rule}")
+                for rule in ("a", "b", "c")
+                for index in range(2)
+            ],
+        }
+    )
+    request = EvidenceBatchRequest(rule_set_id="ruleset-1", target_type="rule_node")
+    base = {"game_id": "game-1", "slug": "example", "ruleset_id": "ruleset-1"}
+
+    response = await EvidenceService._load_batch({"id": "game-1"}, request, base)
+
+    assert response.truncated is True
+    assert [entry.target.rule_id for entry in response.traces] == ["rule.a"]
+    assert [trace.claim.claim_id for trace in response.traces[0].claims] == ["claim.a.0", "claim.a.1"]
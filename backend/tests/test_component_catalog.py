@@ -21,6 +21,14 @@ from app.models.component_catalog import (
     ComponentRefPropertyValue,
 )
 from app.routers import games
+from app.services import component_catalog
+from app.services.component_catalog import ComponentCatalogService
+from app.services.component_query import (
+    ComponentPropertyIndex,
+    ComponentQueryError,
+    parse_predicates,
+    parse_sort,
+)
 
 
 def test_card_catalog_supports_enum_numeric_and_concept_ref_properties():
@@ -191,6 +199,8 @@ class FakeComponentCatalogService:
     async def list_components(self, slug, rule_set_id, **kwargs):
         if slug == "missing":
             return None
+        if kwargs.get("where") == ["bogus<=1"]:
+            raise ComponentQueryError("bogus is not a filterable property")
         return ComponentListResponse(
             status="available",
             game_id="game-1",
@@ -212,6 +222,16 @@ class FakeComponentCatalogService:
             component=Component(component_id=component_id, ruleset_id=rule_set_id, component_set_id="cards", canonical_name="Scout", kind="card"),
         )
 
+    async def export_components(self, slug, rule_set_id):
+        if slug == "missing":
+            return None
+
+        async def components():
+            for component_id in ("card.alpha", "card.beta"):
+                yield Component(component_id=component_id, ruleset_id=rule_set_id, canonical_name=component_id, kind="card")
+
+        return components()
+
 
 def _app():
     app = FastAPI()
@@ -238,3 +258,294 @@ def test_component_catalog_api_requires_explicit_ruleset_identity():
     client = TestClient(_app())
     response = client.get("/api/games/example/components")
     assert response.status_code == 422
+
+
+def _catalog_tables(ability_count: int) -> dict[str, list[dict]]:
+    abilities = [
+        {"rule_set_id": "ruleset-yro", "component_id": "adventurer.scout", "ability_id": f"ability.{index}", "printed_text": "Draw"}
+        for index in range(ability_count)
+    ]
+    return {
+        "rule_sets": [{"id": "ruleset-yro", "game_id": "game-1"}],
+        "component_catalogs": [{"id": "catalog-1", "rule_set_id": "ruleset-yro", "updated_at": "2026-01-01T00:00:00Z"}],
+        "components": [
+            {"rule_set_id": "ruleset-yro", "component_id": "adventurer.scout", "canonical_name": "Scout", "kind": "card"}
+        ],
+        "component_property_definitions": [
+            {"rule_set_id": "ruleset-yro", "property_key": "combat_value", "labels": {"en": "Combat"}, "value_type": "integer"}
+        ],
+        "component_properties": [
+            {
+                "rule_set_id": "ruleset-yro",
+                "component_id": "adventurer.scout",
+                "property_key": "combat_value",
+                "ordinal": 0,
+                "value_type": "integer",
+                "integer_value": 2,
+            }
+        ],
+        "component_abilities": abilities,
+        "component_ability_concepts": [
+            {"rule_set_id": "ruleset-yro", "ability_id": row["ability_id"], "concept_id": "concept.draw"} for row in abilities
+        ],
+        "component_ability_rule_nodes": [],
+        "component_concepts": [{"rule_set_id": "ruleset-yro", "component_id": "adventurer.scout", "concept_id": "concept.scout"}],
+        "component_rule_nodes": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_component_detail_round_trips_do_not_grow_with_ability_count(fake_postgrest):
+    game = {"id": "game-1", "slug": "yro"}
+    query_counts = []
+    for ability_count in (1, 8):
+        component_catalog.invalidate_catalog_caches()
+        backend = fake_postgrest(_catalog_tables(ability_count))
+        detail = await ComponentCatalogService._load_component_detail(game, "ruleset-yro", "adventurer.scout")
+        assert len(detail.component.abilities) == ability_count
+        assert detail.component.abilities[-1].concept_ids == ["concept.draw"]
+        assert detail.component.properties[0].values[0].value == 2
+        query_counts.append(len(backend.queries))
+
+    assert query_counts[0] == query_counts[1]
+
+
+@pytest.mark.asyncio
+async def test_property_definitions_are_cached_per_rule_set_until_invalidated(fake_postgrest):
+    component_catalog.invalidate_catalog_caches()
+    game = {"id": "game-1", "slug": "yro"}
+    backend = fake_postgrest(_catalog_tables(1))
+
+    await ComponentCatalogService._load_component_detail(game, "ruleset-yro", "adventurer.scout")
+    sets = await ComponentCatalogService._load_sets(game, "ruleset-yro", {"game_id": "game-1", "slug": "yro", "ruleset_id": "ruleset-yro"})
+    assert [item.property_key for item in sets.property_definitions] == ["combat_value"]
+    assert len(backend.queries_for("component_property_definitions")) == 1
+
+    component_catalog.invalidate_catalog_caches("ruleset-yro")
+    await ComponentCatalogService._load_component_detail(game, "ruleset-yro", "adventurer.scout")
+    assert len(backend.queries_for("component_property_definitions")) == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_caches_follow_an_ingest_run_by_another_process(fake_postgrest):
+    component_catalog.invalidate_catalog_caches()
+    game = {"id": "game-1", "slug": "yro"}
+    base = {"game_id": "game-1", "slug": "yro", "ruleset_id": "ruleset-yro"}
+    backend = fake_postgrest(_catalog_tables(1))
+    await ComponentCatalogService._load_sets(game, "ruleset-yro", base)
+
+    # The ingestion RPC rewrites definitions and bumps component_catalogs.updated_at; nothing here is invalidated.
+    backend.tables["component_property_definitions"][0]["labels"] = {"en": "Attack"}
+    backend.tables["component_catalogs"][0]["updated_at"] = "2026-01-02T00:00:00Z"
+    sets = await ComponentCatalogService._load_sets(game, "ruleset-yro", base)
+
+    assert sets.property_definitions[0].labels == {"en": "Attack"}
+    assert len(backend.queries_for("component_property_definitions")) == 2
+
+
+def test_component_list_api_rejects_unknown_predicate_with_422():
+    client = TestClient(_app())
+    response = client.get("/api/games/example/components", params={"rule_set_id": "ruleset-1", "where": "bogus<=1"})
+    assert response.status_code == 422
+    assert "bogus" in response.json()["detail"]
+
+
+_DECK_DEFINITIONS = {
+    "cost": PropertyDefinition(property_key="cost", value_type="integer", filterable=True, sortable=True),
+    "suit": PropertyDefinition(property_key="suit", value_type="enum", enum_values=["red", "blue"], filterable=True),
+    "flavor": PropertyDefinition(property_key="flavor", value_type="text"),
+}
+
+
+def _deck_index() -> ComponentPropertyIndex:
+    names = {"card.ace": "Ace", "card.bishop": "Bishop", "card.crown": "Crown", "card.dragon": "Dragon"}
+    properties = [
+        ("card.ace", "cost", 0, "integer_value", 1),
+        ("card.bishop", "cost", 0, "integer_value", 3),
+        ("card.crown", "cost", 0, "integer_value", 5),
+        ("card.ace", "suit", 0, "enum_value", "red"),
+        ("card.bishop", "suit", 0, "enum_value", "blue"),
+        ("card.bishop", "suit", 1, "enum_value", "red"),
+        ("card.dragon", "suit", 0, "enum_value", "red"),
+    ]
+    return ComponentPropertyIndex(
+        [{"component_id": key, "canonical_name": name, "kind": "card"} for key, name in names.items()],
+        [
+            {"component_id": component_id, "property_key": key, "ordinal": ordinal, column: value}
+            for component_id, key, ordinal, column, value in properties
+        ],
+        [{"component_id": "card.crown", "concept_id": "concept.royal"}],
+        _DECK_DEFINITIONS,
+    )
+
+
+def test_property_index_filters_typed_and_multi_valued_properties():
+    index = _deck_index()
+
+    def ids(*expressions, sort=None):
+        items = index.query(parse_predicates(list(expressions), _DECK_DEFINITIONS), parse_sort(sort, _DECK_DEFINITIONS))
+        return [item.component_id for item in items]
+
+    assert ids("cost<=3") == ["card.ace", "card.bishop"]
+    assert ids("suit=red") == ["card.ace", "card.bishop", "card.dragon"]
+    assert ids("suit=red", "cost>1") == ["card.bishop"]
+    assert ids("has_concept=concept.royal") == ["card.crown"]
+    assert ids(sort="-cost") == ["card.crown", "card.bishop", "card.ace", "card.dragon"]
+    assert ids("suit!=blue", sort="-canonical_name") == ["card.dragon", "card.crown", "card.ace"]
+
+
+def test_property_index_treats_null_typed_values_as_missing():
+    index = ComponentPropertyIndex(
+        [{"component_id": key, "canonical_name": key, "kind": "card"} for key in ("card.a", "card.b", "card.c")],
+        [
+            {"component_id": "card.a", "property_key": "cost", "ordinal": 0, "integer_value": None},
+            {"component_id": "card.b", "property_key": "cost", "ordinal": 0, "integer_value": 2},
+            {"component_id": "card.c", "property_key": "cost", "ordinal": 0, "integer_value": None},
+            {"component_id": "card.c", "property_key": "cost", "ordinal": 1, "integer_value": 4},
+        ],
+        [],
+        _DECK_DEFINITIONS,
+    )
+
+    def ids(*expressions, sort=None):
+        items = index.query(parse_predicates(list(expressions), _DECK_DEFINITIONS), parse_sort(sort, _DECK_DEFINITIONS))
+        return [item.component_id for item in items]
+
+    assert ids(sort="cost") == ["card.b", "card.c", "card.a"]
+    assert ids(sort="-cost") == ["card.c", "card.b", "card.a"]
+    assert ids("cost>=2") == ["card.b", "card.c"]
+    assert ids("cost!=2") == ["card.a", "card.c"]
+
+
+@pytest.mark.parametrize(
+    ("expressions", "sort"),
+    [
+        (["flavor=sweet"], None),
+        (["suit<red"], None),
+        (["suit=green"], None),
+        (["cost<=cheap"], None),
+        (["has_concept!=concept.royal"], None),
+        (["cost"], None),
+        ([], "suit"),
+    ],
+)
+def test_property_predicates_fail_closed_on_definition_mismatch(expressions, sort):
+    with pytest.raises(ComponentQueryError):
+        parse_predicates(expressions, _DECK_DEFINITIONS)
+        parse_sort(sort, _DECK_DEFINITIONS)
+
+
+@pytest.mark.asyncio
+async def test_filtered_component_list_pages_from_one_cached_index(fake_postgrest):
+    component_catalog.invalidate_catalog_caches()
+    tables = _catalog_tables(0)
+    tables["component_property_definitions"][0].update(filterable=True, sortable=True)
+    tables["components"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": f"adventurer.{index:02d}", "canonical_name": f"A{index:02d}", "kind": "card"}
+        for index in range(12)
+    ]
+    tables["component_properties"] = [
+        {
+            "rule_set_id": "ruleset-yro",
+            "component_id": f"adventurer.{index:02d}",
+            "property_key": "combat_value",
+            "ordinal": 0,
+            "integer_value": index % 4,
+        }
+        for index in range(12)
+    ]
+    backend = fake_postgrest(tables)
+    game = {"id": "game-1", "slug": "yro"}
+    base = {"game_id": "game-1", "slug": "yro", "ruleset_id": "ruleset-yro"}
+
+    first = await ComponentCatalogService._load_component_list(
+        game, "ruleset-yro", None, None, 2, 0, base, where=["combat_value>=2"], sort="-combat_value"
+    )
+    second = await ComponentCatalogService._load_component_list(
+        game, "ruleset-yro", None, None, 2, 2, base, where=["combat_value>=2"], sort="-combat_value"
+    )
+
+    assert first.total == second.total == 6
+    assert [item.component_id for item in first.components] == ["adventurer.03", "adventurer.07"]
+    assert [item.component_id for item in second.components] == ["adventurer.11", "adventurer.02"]
+    assert len(backend.queries_for("components")) == 1
+    assert len(backend.queries_for("component_properties")) == 1
+
+
+@pytest.mark.asyncio
+async def test_component_export_walks_keyset_chunks_and_bulk_joins_each_chunk(fake_postgrest, monkeypatch):
+    component_catalog.invalidate_catalog_caches()
+    monkeypatch.setattr(component_catalog, "_EXPORT_CHUNK_SIZE", 2)
+    ids = [f"adventurer.{index:02d}" for index in range(5)]
+    tables = _catalog_tables(0)
+    tables["components"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": component_id, "canonical_name": component_id, "kind": "card"}
+        for component_id in reversed(ids)
+    ]
+    tables["component_properties"] = [
+        {
+            "rule_set_id": "ruleset-yro",
+            "component_id": component_id,
+            "property_key": "combat_value",
+            "ordinal": 0,
+            "value_type": "integer",
+            "integer_value": index,
+        }
+        for index, component_id in enumerate(ids)
+    ]
+    tables["component_abilities"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": "adventurer.03", "ability_id": "ability.03", "printed_text": "Draw"}
+    ]
+    tables["component_ability_concepts"] = [
+        {"rule_set_id": "ruleset-yro", "ability_id": "ability.03", "concept_id": "concept.draw"}
+    ]
+    tables["component_concepts"] = [{"rule_set_id": "ruleset-yro", "component_id": "adventurer.04", "concept_id": "concept.scout"}]
+    backend = fake_postgrest(tables)
+
+    exported = [component async for component in ComponentCatalogService._iter_components(backend, "ruleset-yro", None)]
+
+    assert [component.component_id for component in exported] == ids
+    assert [component.properties[0].values[0].value for component in exported] == [0, 1, 2, 3, 4]
+    assert exported[3].abilities[0].concept_ids == ["concept.draw"]
+    assert exported[4].concept_ids == ["concept.scout"]
+    assert [component.abilities for component in exported[:3]] == [[], [], []]
+    assert len(backend.queries_for("components")) == 3
+    assert len(backend.queries_for("component_properties")) == 3
+    assert len(backend.queries_for("component_property_definitions")) == 1
+
+
+@pytest.mark.asyncio
+async def test_component_export_pages_link_rows_by_their_full_primary_key(fake_postgrest, monkeypatch):
+    component_catalog.invalidate_catalog_caches()
+    monkeypatch.setattr(component_catalog, "_INDEX_PAGE_SIZE", 2)
+    tables = _catalog_tables(0)
+    tables["components"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": "adventurer.00", "canonical_name": "A", "kind": "card"}
+    ]
+    concepts = ["concept.draw", "concept.scout", "concept.trade", "concept.rest", "concept.fight"]
+    tables["component_concepts"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": "adventurer.00", "concept_id": concept_id, "reference_kind": kind}
+        for concept_id in concepts
+        for kind in ("printed", "inferred")
+    ]
+    tables["component_rule_nodes"] = [
+        {"rule_set_id": "ruleset-yro", "component_id": "adventurer.00", "rule_id": f"rule.{index}", "reference_kind": "printed"}
+        for index in range(5)
+    ]
+    backend = fake_postgrest(tables)
+
+    exported = [component async for component in ComponentCatalogService._iter_components(backend, "ruleset-yro", None)]
+
+    assert exported[0].concept_ids == sorted(concepts)
+    assert exported[0].rule_ids == [f"rule.{index}" for index in range(5)]
+
+def test_component_export_api_streams_ndjson_and_404s_without_catalog():
+    client = TestClient(_app())
+    response = client.get("/api/games/example/components/export", params={"rule_set_id": "ruleset-1"})
+    missing = client.get("/api/games/missing/components/export", params={"rule_set_id": "ruleset-1"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert [Component.model_validate_json(line).component_id for line in lines] == ["card.alpha", "card.beta"]
+    assert missing.status_code == 404
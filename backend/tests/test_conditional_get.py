@@ -0,0 +1,175 @@
+import json
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.main import is_public_game_read_path
+from app.middleware import conditional
+from app.middleware.conditional import ConditionalGetMiddleware, etag_matches
+from app.routers import games
+
+GAME = {"id": "game-1", "slug": "example", "title": "Example", "updated_at": "2026-01-01T00:00:00Z"}
+
+
+class CountingService:
+    def __init__(self):
+        self.reads = 0
+
+    async def get_game_by_slug(self, slug: str):
+        self.reads += 1
+        return dict(GAME) if slug == "example" else None
+
+
+class CountingRuleGraphService:
+    def __init__(self):
+        self.reads = 0
+
+    async def get_json_by_slug(self, slug, *, rule_types=None, rule_set_id=None):
+        self.reads += 1
+        return json.dumps({"game_id": "game-1", "slug": slug, "status": "not_available"}).encode("utf-8")
+
+
+class MutableComponentService:
+    def __init__(self):
+        self.name = "Gold coin"
+
+    async def list_components(self, slug, rule_set_id, **filters):
+        component = {"component_id": "coin", "canonical_name": self.name, "kind": "token", "quantity": 20}
+        return {
+            "status": "available",
+            "game_id": "game-1",
+            "slug": slug,
+            "ruleset_id": rule_set_id,
+            "components": [component],
+            "total": 1,
+        }
+
+
+def _client(monkeypatch, rule_set: dict | None = None):
+    async def fake_get_by_slug(slug):
+        return dict(GAME) if slug == "example" else None
+
+    async def fake_rule_set_version(rule_set_id):
+        return rule_set
+
+    monkeypatch.setattr(conditional.supabase, "get_by_slug", fake_get_by_slug)
+    monkeypatch.setattr(conditional.supabase, "get_rule_set_version", fake_rule_set_version)
+    service, graphs, components = CountingService(), CountingRuleGraphService(), MutableComponentService()
+    app = FastAPI()
+    app.add_middleware(
+        ConditionalGetMiddleware, cache_control="public, max-age=0", is_cached_path=is_public_game_read_path
+    )
+    app.include_router(games.router, prefix="/api")
+    app.dependency_overrides[games.get_game_service] = lambda: service
+    app.dependency_overrides[games.get_rule_graph_service] = lambda: graphs
+    app.dependency_overrides[games.get_component_catalog_service] = lambda: components
+    return TestClient(app), service, graphs
+
+
+def test_revision_validator_answers_304_without_running_the_route(monkeypatch):
+    client, service, _graphs = _client(monkeypatch)
+
+    first = client.get("/api/games/example")
+    assert first.status_code == 200
+    assert first.headers["etag"].startswith('W/"')
+
+    revalidated = client.get("/api/games/example", headers={"If-None-Match": first.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == "public, max-age=0"
+    assert service.reads == 1
+
+
+def test_rule_set_scoped_validator_changes_with_the_source_revision(monkeypatch):
+    rule_set = {"id": "rs-1", "game_id": "game-1", "source_revision": "r1", "updated_at": "2026-01-01"}
+    client, _service, graphs = _client(monkeypatch, rule_set)
+
+    first = client.get("/api/games/example/rule-graph", params={"rule_set_id": "rs-1"})
+    etag = first.headers["etag"]
+    path = "/api/games/example/rule-graph?rule_set_id=rs-1"
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+    assert graphs.reads == 1
+
+    rule_set["source_revision"] = "r2"
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert graphs.reads == 2
+
+
+def test_not_modified_carries_only_the_cache_control_its_200_would_send(monkeypatch):
+    rule_set = {"id": "rs-1", "game_id": "game-1", "source_revision": "r1", "updated_at": "2026-01-01"}
+    client, _service, _graphs = _client(monkeypatch, rule_set)
+
+    @client.app.get("/api/games/example/private")
+    async def private():
+        return Response(content=b"{}", media_type="application/json", headers={"Cache-Control": "private"})
+
+    for path in ("/api/games/example/rule-graph?rule_set_id=rs-1", "/api/games/example/private"):
+        first = client.get(path)
+        revalidated = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+
+        assert revalidated.status_code == 304
+        assert revalidated.headers.get("cache-control") == first.headers.get("cache-control")
+        assert "s-maxage" not in revalidated.headers.get("cache-control", "")
+
+
+def test_component_changes_are_revalidated_even_when_the_rule_set_row_is_unchanged(monkeypatch):
+    rule_set = {"id": "rs-1", "game_id": "game-1", "source_revision": "r1", "updated_at": "2026-01-01"}
+    client, _service, _graphs = _client(monkeypatch, rule_set)
+    components = client.app.dependency_overrides[games.get_component_catalog_service]()
+    path = "/api/games/example/components?rule_set_id=rs-1"
+
+    first = client.get(path)
+    assert client.get(path, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    # Component ingestion upserts component rows without touching rule_sets.
+    components.name = "Silver coin"
+    changed = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first.headers["etag"]
+    assert changed.json()["components"][0]["canonical_name"] == "Silver coin"
+
+
+def test_route_headers_survive_and_vary_is_extended(monkeypatch):
+    client, _service, _graphs = _client(monkeypatch)
+
+    @client.app.get("/api/games/example/cookies")
+    async def cookies():
+        response = Response(content=b"{}", media_type="application/json", headers={"Vary": "Origin"})
+        response.set_cookie("a", "1")
+        response.set_cookie("b", "2")
+        return response
+
+    response = client.get("/api/games/example/cookies")
+    assert response.headers["vary"] == "Origin, Accept-Encoding"
+    assert response.headers.get_list("set-cookie") == ["a=1; Path=/; SameSite=lax", "b=2; Path=/; SameSite=lax"]
+    assert response.headers["content-length"] == "2"
+
+
+def test_other_reads_fall_back_to_a_body_hash_and_large_bodies_are_compressed(monkeypatch):
+    client, _service, _graphs = _client(monkeypatch)
+
+    async def fake_directory_query(**kwargs):
+        return {"data": [{**GAME, "id": f"game-{index}", "summary": "x" * 40} for index in range(40)], "total": 40}
+
+    monkeypatch.setattr(games, "list_directory_games", fake_directory_query)
+
+    first = client.get("/api/games", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["vary"] == "Accept-Encoding"
+    assert first.json()["total"] == 40
+    assert client.get("/api/games", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    raw = client.get("/api/games", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert raw.headers["etag"] == first.headers["etag"]
+
+
+def test_missing_games_are_not_validated_and_etag_lists_use_weak_comparison(monkeypatch):
+    client, _service, _graphs = _client(monkeypatch)
+
+    assert client.get("/api/games/missing", headers={"If-None-Match": "*"}).status_code == 404
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches('W/"a"', '"a"')
+    assert not etag_matches('"a"', 'W/"b"')
@@ -1,8 +1,22 @@
 import pytest
 
+from app.core import local_db
+from app.core.keyset import CursorError
 from app.services import directory_query
 
 
+@pytest.fixture
+def local_games(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_db, "DB_PATH", tmp_path / "games.db")
+
+    def _install(rows):
+        for row in rows:
+            local_db.upsert_game({**row, "slug": row["id"], "updated_at": row["created_at"]})
+
+    yield _install
+    local_db.close_db()
+
+
 def _game(
     game_id: str,
     *,
@@ -18,7 +32,6 @@ def _game(
         "id": game_id,
         "title": title,
         "title_ja": title,
-        "title_en": None,
         "summary": f"{title} summary",
         "description": None,
         "min_players": minimum,
@@ -30,16 +43,17 @@ def _game(
     }
 
 
-def test_local_directory_filters_before_pagination(monkeypatch):
+def test_local_directory_filters_before_pagination(local_games):
     rows = [
         _game("a", title="Alpha", minimum=2, maximum=4, play_time=25, year=2024, created_at="2024-01-01", tier="A"),
         _game("b", title="Beta", minimum=5, maximum=6, play_time=45, year=2023, created_at="2025-01-01", tier="B"),
-        _game("c", title="Alpha Plus", minimum=3, maximum=5, play_time=80, year=2025, created_at="2026-01-01", tier="A"),
+        _game(
+            "c", title="Alpha Plus", minimum=3, maximum=5, play_time=80, year=2025, created_at="2026-01-01", tier="A"
+        ),
     ]
-    monkeypatch.setattr(directory_query.local_db, "list_recent", lambda limit, offset: {"data": rows, "total": len(rows)})
+    local_games(rows)
 
     result = directory_query._query_local(
-        q="alpha",
         players="3",
         time_filter="60-120",
         tier="A",
@@ -52,16 +66,15 @@ def test_local_directory_filters_before_pagination(monkeypatch):
     assert [game["id"] for game in result["data"]] == ["c"]
 
 
-def test_local_directory_paginates_sorted_results(monkeypatch):
+def test_local_directory_paginates_sorted_results(local_games):
     rows = [
         _game("old", title="Old", minimum=2, maximum=4, play_time=30, year=2020, created_at="2020-01-01"),
         _game("new", title="New", minimum=2, maximum=4, play_time=30, year=2026, created_at="2026-01-01"),
         _game("middle", title="Middle", minimum=2, maximum=4, play_time=30, year=2023, created_at="2023-01-01"),
     ]
-    monkeypatch.setattr(directory_query.local_db, "list_recent", lambda limit, offset: {"data": rows, "total": len(rows)})
+    local_games(rows)
 
     result = directory_query._query_local(
-        q=None,
         players=None,
         time_filter=None,
         tier=None,
@@ -74,15 +87,14 @@ def test_local_directory_paginates_sorted_results(monkeypatch):
     assert [game["id"] for game in result["data"]] == ["middle"]
 
 
-def test_five_plus_filter_matches_games_that_support_at_least_five(monkeypatch):
+def test_five_plus_filter_matches_games_that_support_at_least_five(local_games):
     rows = [
         _game("four", title="Four", minimum=2, maximum=4, play_time=30, year=2024, created_at="2024-01-01"),
         _game("five", title="Five", minimum=2, maximum=5, play_time=30, year=2024, created_at="2024-01-02"),
     ]
-    monkeypatch.setattr(directory_query.local_db, "list_recent", lambda limit, offset: {"data": rows, "total": len(rows)})
+    local_games(rows)
 
     result = directory_query._query_local(
-        q=None,
         players="5+",
         time_filter=None,
         tier=None,
@@ -95,41 +107,255 @@ def test_five_plus_filter_matches_games_that_support_at_least_five(monkeypatch):
     assert result["data"][0]["id"] == "five"
 
 
+def test_local_directory_sorts_in_sql_with_unknown_values_last(local_games):
+    local_games(
+        [
+            _game("long", title="ｚｅｔａ", minimum=2, maximum=4, play_time=90, year=2021, created_at="2021-01-01"),
+            _game("unknown", title="Beta", minimum=2, maximum=4, play_time=0, year=0, created_at="2022-01-01"),
+            _game("short", title="alpha", minimum=2, maximum=4, play_time=20, year=2019, created_at="2019-01-01"),
+        ]
+    )
+
+    def ids(sort):
+        result = directory_query._query_local(players=None, time_filter=None, tier=None, sort=sort, limit=48, offset=0)
+        return [game["id"] for game in result["data"]]
+
+    assert ids("play_time") == ["short", "long", "unknown"]
+    assert ids("title") == ["short", "unknown", "long"]
+    assert ids("year") == ["long", "short", "unknown"]
+
+
+@pytest.mark.parametrize("sort", ["recent", "title", "year", "play_time"])
+@pytest.mark.asyncio
+async def test_local_cursor_pages_match_offset_pages_for_every_sort(local_games, monkeypatch, sort):
+    monkeypatch.setattr(directory_query.supabase, "_client", None)
+    monkeypatch.setattr(directory_query, "_directory_facets", _no_facets)
+    directory_query._totals_cache.clear()
+    local_games(
+        [
+            _game(
+                f"g{index}",
+                title=f"Game {index % 4}",
+                minimum=2,
+                maximum=4,
+                play_time=(index % 3) * 30,
+                year=2020 + index % 3,
+                created_at=f"2024-01-{index % 5 + 1:02d}",
+            )
+            for index in range(11)
+        ]
+    )
+
+    offset_ids = [game["id"] for game in (await directory_query.list_directory_games(sort=sort, limit=11))["data"]]
+    cursors, cursor_ids, totals = [], [], []
+    while True:
+        page = await directory_query.list_directory_games(sort=sort, limit=3, cursor=cursors[-1] if cursors else None)
+        cursor_ids += [game["id"] for game in page["data"]]
+        totals.append(page["total"])
+        if page["next_cursor"] is None:
+            break
+        cursors.append(page["next_cursor"])
+
+    assert cursor_ids == offset_ids
+    assert set(totals) == {11}
+    with pytest.raises(CursorError):
+        await directory_query.list_directory_games(sort=sort, players="2", limit=3, cursor=cursors[0])
+
+
+async def _no_facets(*_args, **_kwargs):
+    return {}
+
+
+def _cloud_rows(count: int) -> list[dict]:
+    rows = [
+        _game(
+            f"g{index:02d}",
+            title=f"Game {index % 4}",
+            minimum=2,
+            maximum=4,
+            play_time=(index % 3) * 30,
+            year=2020 + index % 3,
+            created_at=f"2024-01-{index % 5 + 1:02d}",
+        )
+        for index in range(count)
+    ]
+    return [{**row, "updated_at": row["created_at"]} for row in rows]
+
+
+@pytest.mark.parametrize("sort", ["recent", "title", "year", "play_time"])
+@pytest.mark.asyncio
+async def test_cloud_cursor_pages_that_miss_the_totals_cache_count_the_whole_listing(fake_postgrest, monkeypatch, sort):
+    monkeypatch.setattr(directory_query.supabase, "is_local", lambda: False)
+    monkeypatch.setattr(directory_query, "_directory_facets", _no_facets)
+    directory_query._totals_cache.clear()
+    fake_postgrest({"games": _cloud_rows(11)})
+
+    offset_ids = [game["id"] for game in (await directory_query.list_directory_games(sort=sort, limit=11))["data"]]
+    cursor, cursor_ids, totals = None, [], []
+    while True:
+        # Every seek page misses the cache, as it does once the first page's total has expired.
+        directory_query._totals_cache.clear()
+        page = await directory_query.list_directory_games(sort=sort, limit=3, cursor=cursor)
+        cursor_ids += [game["id"] for game in page["data"]]
+        totals.append(page["total"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert cursor_ids == offset_ids
+    assert set(totals) == {11}
+
+
+@pytest.mark.asyncio
+async def test_cloud_recent_list_counts_seek_pages_without_the_cursor_predicate(fake_postgrest, monkeypatch):
+    monkeypatch.setattr(directory_query.supabase, "is_local", lambda: False)
+    directory_query.supabase._list_total_cache.clear()
+    fake_postgrest({"games": _cloud_rows(7)})
+
+    first = await directory_query.supabase.list_recent(limit=3)
+    directory_query.supabase._list_total_cache.clear()
+    second = await directory_query.supabase.list_recent(limit=3, cursor=first["next_cursor"])
+    third = await directory_query.supabase.list_recent(limit=3, cursor=second["next_cursor"])
+
+    ids = [game["id"] for page in (first, second, third) for game in page["data"]]
+    assert sorted(ids) == sorted(row["id"] for row in _cloud_rows(7))
+    assert [page["total"] for page in (first, second, third)] == [7, 7, 7]
+    assert third["next_cursor"] is None
+
+
+def test_local_directory_filters_are_served_by_indexes(local_games):
+    local_games([])
+    plan = " ".join(
+        str(row[-1])
+        for row in local_db.get_db().execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM games WHERE strategy_tier = ? ORDER BY created_at DESC", ["A"]
+        )
+    )
+    assert "idx_games_strategy_tier" in plan or "idx_games_created_at" in plan
+
+
 def test_ranked_search_keeps_canonical_relevance_for_default_sort():
     rows = [
         _game("exact", title="Skull King", minimum=2, maximum=8, play_time=45, year=2013, created_at="2020-01-01"),
         _game("summary", title="Pirate Tricks", minimum=2, maximum=4, play_time=30, year=2026, created_at="2026-01-01"),
     ]
 
-    result = directory_query._query_ranked_search_results(
-        rows,
-        players=None,
-        time_filter=None,
-        tier=None,
-        sort="recent",
-        limit=48,
-        offset=0,
-    )
+    ranked = directory_query._rank_filtered(rows, players=None, time_filter=None, tier=None, sort="recent")
 
-    assert [game["id"] for game in result["data"]] == ["exact", "summary"]
+    assert [game["id"] for game in ranked] == ["exact", "summary"]
 
 
-@pytest.mark.asyncio
-async def test_directory_query_reuses_canonical_search(monkeypatch):
-    ranked = [
-        _game("alias-hit", title="6 nimmt!", minimum=2, maximum=10, play_time=45, year=1994, created_at="2020-01-01"),
-        _game("other", title="11 nimmt!", minimum=2, maximum=7, play_time=30, year=2010, created_at="2026-01-01"),
-    ]
+@pytest.fixture
+def ranked_search(monkeypatch):
+    directory_query._ranked_ids_cache.clear()
+    directory_query._facet_index_cache.clear()
     calls = []
+    hydrated = []
+
+    def _install(ranked):
+        rows = {game["id"]: game for game in ranked}
+
+        async def fake_candidates(query):
+            calls.append(query)
+            return ranked
 
-    async def fake_search(query):
-        calls.append(query)
-        return ranked
+        async def fake_get_by_ids(ids):
+            hydrated.append(list(ids))
+            return [rows[game_id] for game_id in ids]
 
-    monkeypatch.setattr(directory_query.supabase, "search", fake_search)
+        monkeypatch.setattr(directory_query.supabase, "search_candidates", fake_candidates)
+
+        async def fake_projection():
+            return ranked
+
+        monkeypatch.setattr(directory_query.supabase, "get_by_ids", fake_get_by_ids)
+        monkeypatch.setattr(directory_query.supabase, "catalog_projection", fake_projection)
+        return calls, hydrated
+
+    yield _install
+    directory_query._ranked_ids_cache.clear()
+    directory_query._facet_index_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_directory_query_reuses_canonical_search(ranked_search):
+    calls, hydrated = ranked_search(
+        [
+            _game(
+                "alias-hit", title="6 nimmt!", minimum=2, maximum=10, play_time=45, year=1994, created_at="2020-01-01"
+            ),
+            _game("other", title="11 nimmt!", minimum=2, maximum=7, play_time=30, year=2010, created_at="2026-01-01"),
+        ]
+    )
 
     result = await directory_query.list_directory_games(q="6 Nimmt", limit=1)
 
     assert calls == ["6 Nimmt"]
+    assert hydrated == [["alias-hit"]]
     assert result["total"] == 2
     assert [game["id"] for game in result["data"]] == ["alias-hit"]
+
+
+@pytest.mark.asyncio
+async def test_ranked_search_filters_before_limit_and_pages_from_cached_ids(ranked_search):
+    games = [
+        _game(
+            f"g{index:03d}",
+            title=f"Trick {index}",
+            minimum=2,
+            maximum=6 if index % 2 else 4,
+            play_time=30,
+            year=2020,
+            created_at="2020-01-01",
+        )
+        for index in range(300)
+    ]
+    calls, hydrated = ranked_search(games)
+
+    first = await directory_query.list_directory_games(q="trick", players="5+", limit=48)
+    deep = await directory_query.list_directory_games(q="ＴＲＩＣＫ", players="5+", limit=48, offset=144)
+
+    assert first["total"] == deep["total"] == 150
+    assert [game["id"] for game in first["data"]][:2] == ["g001", "g003"]
+    assert [game["id"] for game in deep["data"]] == [f"g{index:03d}" for index in range(289, 300, 2)]
+    assert calls == ["trick"]
+    assert [len(ids) for ids in hydrated] == [48, 6]
+
+
+def test_facet_counts_intersect_other_filters_and_ignore_their_own():
+    rows = [
+        _game("a", title="A", minimum=2, maximum=4, play_time=25, year=2020, created_at="x", tier="S"),
+        _game("b", title="B", minimum=5, maximum=6, play_time=45, year=2020, created_at="x", tier="A"),
+        _game("c", title="C", minimum=3, maximum=5, play_time=80, year=2020, created_at="x", tier="S"),
+        _game("d", title="D", minimum=0, maximum=0, play_time=0, year=2020, created_at="x"),
+    ]
+    index = directory_query.DirectoryFacetIndex(rows)
+
+    unfiltered = index.counts({"players": None, "time": None, "tier": None})
+    assert unfiltered["players"] == {"1": 0, "2": 1, "3": 2, "4": 2, "5+": 2}
+    assert unfiltered["time"] == {"30-": 1, "30-60": 1, "60-120": 1, "120+": 0}
+    assert unfiltered["tier"] == {"A": 1, "S": 2}
+
+    filtered = index.counts({"players": "3", "time": None, "tier": "S"})
+    assert filtered["players"]["5+"] == 1  # c only: the tier filter applies, the players filter does not
+    assert filtered["tier"] == {"A": 0, "S": 2}
+    assert filtered["time"] == {"30-": 1, "30-60": 0, "60-120": 1, "120+": 0}
+
+    searched = index.counts({"players": None, "time": None, "tier": None}, index.mask(["b", "missing"]))
+    assert searched["tier"] == {"A": 1, "S": 0}
+
+
+@pytest.mark.asyncio
+async def test_directory_response_includes_facets_scoped_to_the_search(ranked_search):
+    games = [
+        _game("a", title="Trick", minimum=2, maximum=4, play_time=25, year=2020, created_at="1", tier="S"),
+        _game("b", title="Trick Plus", minimum=5, maximum=6, play_time=45, year=2020, created_at="2", tier="A"),
+    ]
+    calls, _hydrated = ranked_search(games)
+
+    result = await directory_query.list_directory_games(q="trick", tier="S")
+
+    assert [game["id"] for game in result["data"]] == ["a"]
+    assert result["facets"]["tier"] == {"A": 1, "S": 1}
+    assert result["facets"]["players"]["2"] == 1
+    assert calls == ["trick"]
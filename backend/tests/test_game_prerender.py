@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from app.services import game_prerender
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    rows = {}
+    rendered = []
+
+    async def fake_list_for_sitemap(after_slug="", *, through_slug=None, limit=1000, columns=()):
+        ordered = [{"slug": slug, "updated_at": rows[slug]} for slug in sorted(rows) if slug > after_slug]
+        return ordered[:limit]
+
+    async def fake_generate_seo_html(slug):
+        rendered.append(slug)
+        return None if slug == "broken" else f"<html>{slug}@{rows[slug]}</html>"
+
+    monkeypatch.setattr(game_prerender, "list_for_sitemap", fake_list_for_sitemap)
+    monkeypatch.setattr(game_prerender, "generate_seo_html", fake_generate_seo_html)
+    monkeypatch.setattr(game_prerender, "_PAGE_SIZE", 2)
+    return rows, rendered
+
+
+@pytest.mark.asyncio
+async def test_full_run_renders_visible_games_and_skips_gone_hidden_and_unsafe_slugs(tmp_path, catalog):
+    rows, rendered = catalog
+    rows.update({"catan": "t1", "game": "t1", "hack-clad": "t1", "../escape": "t1", "skull-king": "t1", "broken": "t1"})
+
+    report = await game_prerender.prerender_games(tmp_path, concurrency=2)
+
+    assert sorted(rendered) == ["broken", "catan", "skull-king"]
+    assert report.rendered == ["catan", "skull-king"]
+    assert report.failed == ["broken"]
+    assert (tmp_path / "games" / "catan" / "index.html").read_text(encoding="utf-8") == "<html>catan@t1</html>"
+    assert not (tmp_path / "games" / "game").exists()
+    manifest = json.loads((tmp_path / "games" / game_prerender.MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest == {"pages": {"catan": "t1", "skull-king": "t1"}}
+
+
+@pytest.mark.asyncio
+async def test_incremental_run_rerenders_only_changed_games_and_removes_deleted_ones(tmp_path, catalog):
+    rows, rendered = catalog
+    rows.update({"azul": "t1", "catan": "t1", "skull-king": "t1"})
+    await game_prerender.prerender_games(tmp_path)
+    rendered.clear()
+
+    rows["catan"] = "t2"
+    del rows["azul"]
+    rows["splendor"] = "t1"
+    report = await game_prerender.prerender_games(tmp_path, incremental=True)
+
+    assert sorted(rendered) == ["catan", "splendor"]
+    assert report.unchanged == 1
+    assert report.removed == ["azul"]
+    assert (tmp_path / "games" / "catan" / "index.html").read_text(encoding="utf-8") == "<html>catan@t2</html>"
+    assert not (tmp_path / "games" / "azul").exists()
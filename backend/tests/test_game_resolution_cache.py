@@ -0,0 +1,104 @@
+import pytest
+
+from app.core import supabase
+from app.core.ttl_cache import TTLCache
+from app.services import game_service
+from app.services.game_service import GameService
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    supabase._game_cache.clear()
+    yield
+    supabase._game_cache.clear()
+
+
+@pytest.fixture
+def local_games(monkeypatch):
+    rows = {"skull-king": {"id": "game-1", "slug": "skull-king", "title": "Skull King"}}
+    calls: list[str] = []
+
+    def _get_by_slug(slug):
+        calls.append(slug)
+        row = rows.get(slug)
+        return dict(row) if row else None
+
+    monkeypatch.setattr(supabase, "is_local", lambda: True)
+    monkeypatch.setattr(supabase.local_db, "get_by_slug", _get_by_slug)
+    monkeypatch.setattr(supabase.local_db, "upsert_game", lambda game: rows.__setitem__(game["slug"], dict(game)))
+    return rows, calls
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.ttl_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(max_entries=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", None)
+    assert cache.lookup("a") == (True, 1)
+    cache.set("c", 3)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1)
+    now[0] = 111.0
+    assert cache.lookup("c") == (False, None)
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 1}
+
+
+@pytest.mark.asyncio
+async def test_repeated_resolution_of_one_slug_reads_backend_once(local_games):
+    _rows, calls = local_games
+
+    first = await supabase.get_by_slug("skull-king")
+    first["title"] = "mutated by caller"
+    second = await supabase.get_by_slug("skull-king")
+
+    assert calls == ["skull-king"]
+    assert second["title"] == "Skull King"
+    assert supabase.game_cache_stats()["hits"] == 1
+    assert supabase.game_cache_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_slug_is_cached_until_a_write_creates_it(local_games):
+    _rows, calls = local_games
+
+    assert await supabase.get_by_slug("new-game") is None
+    assert await supabase.get_by_slug("new-game") is None
+    assert calls == ["new-game"]
+
+    await supabase.create_unverified_game({"id": "game-2", "slug": "new-game", "title": "New Game"})
+
+    assert (await supabase.get_by_slug("new-game"))["id"] == "game-2"
+    assert calls == ["new-game", "new-game"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_invalidates_every_key_resolving_to_the_game(local_games):
+    _rows, calls = local_games
+    await supabase.get_by_slug("skull-king")
+    supabase._game_cache.set("old-skull-king", {"id": "game-1", "slug": "skull-king", "title": "Skull King"})
+
+    await supabase.upsert_game({"id": "game-1", "slug": "skull-king", "title": "Skull King Revised"})
+
+    assert supabase._game_cache.lookup("old-skull-king") == (False, None)
+    assert (await supabase.get_by_slug("skull-king"))["title"] == "Skull King Revised"
+    assert calls == ["skull-king", "skull-king"]
+
+
+@pytest.mark.asyncio
+async def test_manual_update_reads_fresh_row_and_invalidates_after_write(monkeypatch, local_games):
+    rows, calls = local_games
+    await supabase.get_by_slug("skull-king")
+    rows["skull-king"] = {**rows["skull-king"], "summary": "written by another worker"}
+
+    async def _upsert(payload):
+        return [payload]
+
+    monkeypatch.setattr(game_service.supabase, "upsert", _upsert)
+    service = GameService.__new__(GameService)
+    result = await service.update_game_manual("skull-king", {"min_age": 8})
+
+    assert result["summary"] == "written by another worker"
+    assert calls == ["skull-king", "skull-king"]
+    assert supabase._game_cache.lookup("skull-king") == (False, None)
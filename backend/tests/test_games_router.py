@@ -1,6 +1,8 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from app.core import supabase
+from app.core.keyset import decode_cursor, encode_cursor
 from app.main import app as production_app
 from app.routers import games
 
@@ -27,6 +29,11 @@ class PublicReadService:
         return {"id": "game-1", "slug": slug, "title": "Example", "work_id": "work-1"}
 
 
+class ViewRecordingService(PublicReadService):
+    def record_view(self, game_id: str) -> None:
+        supabase.increment_view_count(game_id)
+
+
 def _app_with_service(service):
     app = FastAPI()
     app.include_router(games.router, prefix="/api")
@@ -121,9 +128,22 @@ def test_directory_query_parameters_are_forwarded(monkeypatch):
         "sort": "year",
         "limit": 10,
         "offset": 20,
+        "cursor": None,
     }
 
 
+def test_directory_cursor_from_another_listing_is_rejected_with_422(monkeypatch):
+    async def fake_directory_query(**kwargs):
+        decode_cursor(kwargs["cursor"], "games:recent:other", 2)
+
+    monkeypatch.setattr(games, "list_directory_games", fake_directory_query)
+    client = TestClient(_app_with_service(PublicReadService()))
+
+    foreign = encode_cursor("games:title:other", ["a", "id-1"])
+    assert client.get("/api/games", params={"cursor": foreign}).status_code == 422
+    assert client.get("/api/games", params={"cursor": "not base64!"}).status_code == 422
+
+
 def test_public_game_reads_use_standard_shared_cache_control(monkeypatch):
     async def fake_directory_query(**kwargs):
         return {
@@ -159,3 +179,27 @@ def test_cache_headers_do_not_apply_to_health_or_mutation_requests():
         assert "s-maxage" not in patch.headers.get("cache-control", "")
     finally:
         production_app.dependency_overrides.clear()
+
+
+def test_view_beacon_is_flushed_by_the_lifespan_and_detail_reads_record_nothing(monkeypatch):
+    flushed = []
+
+    async def apply(deltas):
+        flushed.append(dict(deltas))
+
+    monkeypatch.setattr(supabase.view_counter, "_flush", apply)
+    service = ViewRecordingService()
+    production_app.dependency_overrides[games.get_game_service] = lambda: service
+    try:
+        with TestClient(production_app) as client:
+            assert client.get("/api/games/example").is_success
+            beacon = client.post("/api/games/example/views")
+            client.post("/api/games/example/views")
+
+            assert beacon.status_code == status.HTTP_204_NO_CONTENT
+            assert "s-maxage" not in beacon.headers.get("cache-control", "")
+    finally:
+        production_app.dependency_overrides.clear()
+
+    assert flushed == [{"game-1": 2}]
+    assert supabase.view_counter.stats()["pending_views"] == 0
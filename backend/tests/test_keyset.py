@@ -0,0 +1,49 @@
+import sqlite3
+
+import pytest
+
+from app.core.keyset import (
+    CursorError,
+    SeekKey,
+    decode_cursor,
+    encode_cursor,
+    postgrest_seek_filter,
+    sqlite_seek_condition,
+)
+
+_KEYS = (SeekKey("published_year", desc=True), SeekKey("id"))
+
+
+def test_cursor_round_trips_and_is_bound_to_its_scope():
+    token = encode_cursor("games:year:abc", [2020, "id, with (reserved)"])
+
+    assert decode_cursor(token, "games:year:abc", 2) == [2020, "id, with (reserved)"]
+    with pytest.raises(CursorError):
+        decode_cursor(token, "games:title:abc", 2)
+    with pytest.raises(CursorError):
+        decode_cursor(token, "games:year:abc", 3)
+    with pytest.raises(CursorError):
+        decode_cursor("%%%", "games:year:abc", 2)
+
+
+def test_postgrest_seek_filter_treats_nulls_as_last_and_quotes_reserved_values():
+    assert postgrest_seek_filter(_KEYS, [2020, "g1"]) == (
+        "published_year.lt.2020,published_year.is.null,and(published_year.eq.2020,id.gt.g1)"
+    )
+    assert postgrest_seek_filter(_KEYS, [None, "a,b"]) == 'and(published_year.is.null,id.gt."a,b")'
+
+
+@pytest.mark.parametrize("keys", [_KEYS, (SeekKey("published_year"), SeekKey("id"))])
+def test_sqlite_seek_condition_resumes_exactly_after_every_row(keys):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE games (id TEXT PRIMARY KEY, published_year INTEGER)")
+    conn.executemany(
+        "INSERT INTO games VALUES (?, ?)", [("a", 2020), ("b", None), ("c", 2020), ("d", 2021), ("e", None)]
+    )
+    order = ", ".join(f"{key.column}{' DESC' if key.desc else ''}" for key in keys)
+    rows = conn.execute(f"SELECT published_year, id FROM games ORDER BY {order}").fetchall()
+
+    for position, row in enumerate(rows):
+        condition, params = sqlite_seek_condition(keys, list(row))
+        after = conn.execute(f"SELECT published_year, id FROM games WHERE {condition} ORDER BY {order}", params)
+        assert after.fetchall() == rows[position + 1 :]
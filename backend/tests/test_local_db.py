@@ -0,0 +1,88 @@
+import sqlite3
+import threading
+
+import pytest
+
+from app.core import local_db
+
+
+@pytest.fixture
+def local_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_db, "DB_PATH", tmp_path / "data" / "games.db")
+    yield local_db
+    local_db.close_db()
+
+
+def test_connection_is_cached_per_thread_and_tuned_for_concurrent_reads(local_database):
+    first = local_database.get_db()
+    assert local_database.get_db() is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert first.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    other: list = []
+    worker = threading.Thread(target=lambda: other.append(local_database.get_db()))
+    worker.start()
+    worker.join()
+    assert other[0] is not first
+
+
+def test_schema_is_created_once_per_process(local_database, monkeypatch):
+    calls = []
+    original = local_database._create_schema
+    monkeypatch.setattr(local_database, "_create_schema", lambda conn: calls.append(conn) or original(conn))
+
+    local_database.init_db()
+    local_database.init_db()
+    local_database.upsert_game(
+        {"id": "g1", "slug": "catan", "title": "Catan", "structured_data": {"mechanics": ["trade"]}}
+    )
+
+    assert len(calls) == 1
+    assert local_database.get_by_slug("catan")["structured_data"] == {"mechanics": ["trade"]}
+    assert local_database.list_recent()["total"] == 1
+
+
+def test_failed_write_does_not_leave_the_shared_connection_in_a_transaction(local_database):
+    local_database.upsert_game({"id": "g1", "slug": "catan", "title": "Catan"})
+    with pytest.raises(sqlite3.IntegrityError):
+        local_database.upsert_game({"id": "g1", "slug": "other", "title": "Duplicate id"})
+
+    assert not local_database.get_db().in_transaction
+    assert local_database.get_by_slug("other") is None
+
+
+def test_search_ranks_exact_prefix_substring_from_stored_keys_and_tracks_updates(local_database):
+    local_database.upsert_game({"id": "g1", "slug": "6-nimmt", "title": "6 nimmt!", "title_ja": "ニムト"})
+    local_database.upsert_game({"id": "g2", "slug": "nimmt-junior", "title": "Nimmt Junior"})
+    local_database.upsert_game({"id": "g3", "slug": "catan", "title": "Catan", "summary": "Like 6 Nimmt, but trading"})
+
+    assert [game["slug"] for game in local_database.search_games("６ Nimmt")] == ["6-nimmt", "catan"]
+    assert [game["slug"] for game in local_database.search_games("nimmt")] == ["nimmt-junior", "6-nimmt", "catan"]
+    assert [game["slug"] for game in local_database.search_games("ニム")] == ["6-nimmt"]
+    assert "search_rank" not in local_database.search_games("catan")[0]
+
+    local_database.upsert_game({"id": "g2", "slug": "nimmt-junior", "title": "Take 5 Junior"})
+    assert [game["slug"] for game in local_database.search_games("junior")] == ["nimmt-junior"]
+    assert [game["slug"] for game in local_database.search_games("nimmt")] == ["nimmt-junior", "6-nimmt", "catan"]
+    assert [game["slug"] for game in local_database.search_games("take5")] == ["nimmt-junior"]
+
+
+def test_search_index_is_backfilled_for_rows_written_before_it_existed(local_database):
+    local_database.upsert_game({"id": "g1", "slug": "catan", "title": "Catan"})
+    local_database.get_db().execute("DELETE FROM game_search")
+    local_database._schema_ready.clear()
+
+    local_database.init_db()
+
+    assert [game["slug"] for game in local_database.search_games("cat")] == ["catan"]
+
+
+def test_search_candidates_read_the_projection_and_hydrate_by_id(local_database):
+    local_database.upsert_game(
+        {"id": "g1", "slug": "catan", "title": "Catan", "max_players": 4, "structured_data": {"a": 1}}
+    )
+
+    candidates = local_database.search_candidates("catan", ("id", "max_players", "title_en"))
+
+    assert candidates == [{"id": "g1", "max_players": 4, "title_en": None}]
+    assert local_database.get_by_ids(["g1", "missing"])[0]["structured_data"] == {"a": 1}
@@ -1,3 +1,7 @@
+import json
+from collections import defaultdict
+from pathlib import Path
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -14,6 +18,7 @@ from app.models.presentation_projection import (
     RuleProjectionSection,
 )
 from app.routers import presentation
+from app.services import presentation_projection
 from app.services.presentation_projection import (
     PresentationProjectionService,
     accepted_supported_claim,
@@ -281,3 +286,128 @@ def test_projection_api_keeps_missing_game_distinct_from_missing_projection():
     client = TestClient(_app())
     response = client.get("/api/games/missing/presentation", params={"rule_set_id": "ruleset-1"})
     assert response.status_code == 404
+
+
+async def _legacy_load_eligible_rule_claims(client, rule_set_id):
+    # The per-claim bindings loader this module used before bulk loading; kept as the golden reference.
+    claims = (
+        await client.table("claims")
+        .select("claim_id,rule_id,normalized_payload,lifecycle_status")
+        .eq("rule_set_id", rule_set_id)
+        .eq("target_type", "rule_node")
+        .order("claim_id")
+        .execute()
+    ).data
+    eligible = defaultdict(list)
+    for claim in claims:
+        bindings = (
+            await client.table("evidence_bindings")
+            .select("source_id,relation")
+            .eq("claim_id", claim["claim_id"])
+            .execute()
+        ).data
+        evidence = accepted_supported_claim(claim, bindings)
+        if evidence is not None and claim.get("rule_id"):
+            eligible[claim["rule_id"]].append(evidence)
+    return dict(eligible)
+
+
+def _legacy_project_rule_rows(rule_rows, eligible_claims):
+    projected = []
+    for row in rule_rows:
+        if row["node_type"] == "variant":
+            continue
+        evidence = next(
+            (
+                candidate
+                for candidate in eligible_claims.get(row["rule_id"], [])
+                if (candidate.get("normalized_payload") or {}).get("statement") == row["normalized_statement"]
+            ),
+            None,
+        )
+        if evidence is not None:
+            projected.append(
+                ProjectedRule(
+                    rule_id=row["rule_id"],
+                    node_type=row["node_type"],
+                    text=row["normalized_statement"],
+                    sequence=row.get("sequence"),
+                    evidence=ProjectionEvidence(claim_id=evidence["claim_id"], source_ids=evidence["source_ids"]),
+                )
+            )
+    return projected
+
+
+def _projection_tables(rule_set_id: str, nodes: list[dict]) -> dict[str, list[dict]]:
+    tables = {"rule_sets": [{"id": rule_set_id, "game_id": "game-1"}], "rule_nodes": [], "claims": []}
+    bindings = tables["evidence_bindings"] = []
+
+    def claim(claim_id, node, statement, lifecycle="accepted", relations=("supports",)):
+        tables["claims"].append(
+            {
+                "claim_id": claim_id,
+                "rule_set_id": rule_set_id,
+                "target_type": "rule_node",
+                "rule_id": node["rule_id"],
+                "normalized_payload": {"statement": statement},
+                "lifecycle_status": lifecycle,
+            }
+        )
+        for position, relation in enumerate(relations):
+            bindings.append({"claim_id": claim_id, "source_id": f"source.{position % 2}", "relation": relation})
+
+    for position, node in enumerate(nodes):
+        row = {**node, "rule_set_id": rule_set_id, "sequence": node.get("sequence", position)}
+        tables["rule_nodes"].append(row)
+        statement, prefix = row["normalized_statement"], f"claim.{position:04d}"
+        shape = position % 6
+        if shape == 0:
+            claim(f"{prefix}.a", row, statement)
+        elif shape == 1:
+            claim(f"{prefix}.a", row, "Superseded wording.")
+            claim(f"{prefix}.b", row, statement, relations=("supports", "supports"))
+        elif shape == 2:
+            claim(f"{prefix}.a", row, statement, relations=("supports", "contradicts"))
+        elif shape == 3:
+            claim(f"{prefix}.a", row, statement, lifecycle="candidate")
+        elif shape == 4:
+            claim(f"{prefix}.a", row, statement, relations=("supports", "supports", "supports"))
+            claim(f"{prefix}.b", row, statement, relations=("supports",))
+        else:
+            claim(f"{prefix}.a", row, statement, relations=())
+    return tables
+
+
+def _golden_cases():
+    fixture_path = Path(__file__).parents[2] / "evaluation" / "rules" / "rule-graph-v1-fixtures.json"
+    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
+    cases = [(case["name"], case["graph"]["nodes"]) for case in payload["cases"]]
+    # A rule set large enough to need several chunked bindings queries.
+    large = [
+        {"rule_id": f"rule.{index:04d}", "node_type": ["setup", "action", "scoring", "game_end"][index % 4],
+         "normalized_statement": f"Statement {index}."}
+        for index in range(400)
+    ]
+    return [*cases, ("large", large)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("name", "nodes"), _golden_cases())
+async def test_bulk_eligibility_projection_matches_the_per_claim_golden(name, nodes, fake_postgrest, monkeypatch):
+    backend = fake_postgrest(_projection_tables(f"set-{name}", nodes))
+    game = {"id": "game-1", "slug": "example"}
+
+    with monkeypatch.context() as legacy:
+        legacy.setattr(PresentationProjectionService, "_load_eligible_rule_claims", _legacy_load_eligible_rule_claims)
+        legacy.setattr(presentation_projection, "project_rule_rows", _legacy_project_rule_rows)
+        expected = await PresentationProjectionService._load_projection(game, f"set-{name}", "ja")
+    legacy_binding_queries = len(backend.queries_for("evidence_bindings"))
+    backend.queries.clear()
+
+    with presentation_projection.loader_scope():
+        actual = await PresentationProjectionService._load_projection(game, f"set-{name}", "ja")
+
+    assert expected.status == "available"
+    assert actual.model_dump(mode="json") == expected.model_dump(mode="json")
+    assert legacy_binding_queries == len(backend.tables["claims"])
+    assert len(backend.queries_for("evidence_bindings")) == -(-len(backend.tables["claims"]) // 150)
@@ -0,0 +1,269 @@
+import asyncio
+
+import pytest
+
+from app.core import dataloader
+from app.core.dataloader import current_loaders, loader_scope
+from app.models.evidence import ClaimTarget
+from app.services.component_catalog import ComponentCatalogService
+from app.services.concept_taxonomy import ConceptTaxonomyService
+from app.services.evidence import EvidenceService
+
+
+@pytest.mark.asyncio
+async def test_loader_coalesces_one_tick_into_one_in_query_and_caches_keys(fake_postgrest):
+    backend = fake_postgrest(
+        {
+            "concept_labels": [
+                {"id": 1, "concept_id": "c1", "label": "Trick"},
+                {"id": 2, "concept_id": "c2", "label": "Trump"},
+                {"id": 3, "concept_id": "c1", "label": "Stich"},
+            ]
+        }
+    )
+    with loader_scope() as registry:
+        loader = current_loaders().rows("concept_labels", "concept_id", select="label")
+        first, second, repeated = await asyncio.gather(loader.load("c1"), loader.load("c2"), loader.load("c1"))
+        missing = await loader.load("c3")
+        cached = await loader.load("c2")
+
+    assert first == repeated == [{"id": 1, "label": "Trick"}, {"id": 3, "label": "Stich"}]
+    assert second == cached == [{"id": 2, "label": "Trump"}]
+    assert missing == []
+    assert backend.queries == [
+        ("concept_labels", (("in", "concept_id", ["c1", "c2"]),)),
+        ("concept_labels", (("in", "concept_id", ["c3"]),)),
+    ]
+    assert registry.round_trips() == 2
+
+
+@pytest.mark.asyncio
+async def test_loader_pages_a_chunk_past_the_response_row_cap(fake_postgrest, monkeypatch):
+    monkeypatch.setattr(dataloader, "PAGE_SIZE", 2)
+    fake_postgrest(
+        {
+            "evidence_bindings": [
+                {"id": f"b{index}", "claim_id": f"claim.{index % 2}", "created_at": f"2026-01-0{index}"}
+                for index in range(1, 6)
+            ]
+        }
+    )
+    with loader_scope() as registry:
+        loader = current_loaders().rows("evidence_bindings", "claim_id", order="created_at")
+        odd, even = await loader.load_many(["claim.1", "claim.0"])
+
+    assert [row["id"] for row in odd] == ["b1", "b3", "b5"]
+    assert [row["id"] for row in even] == ["b2", "b4"]
+    assert registry.round_trips() == 3
+
+
+@pytest.mark.asyncio
+async def test_loader_failure_reaches_every_waiter_and_is_not_cached(fake_postgrest):
+    backend = fake_postgrest({"games": [{"id": "g1"}]})
+    original = backend.table
+    failures = [RuntimeError("transport down")]
+
+    def _table(name):
+        if failures:
+            raise failures.pop()
+        return original(name)
+
+    backend.table = _table
+    with loader_scope():
+        loader = current_loaders().rows("games", "id")
+        results = await asyncio.gather(loader.load("g1"), loader.load("g2"), return_exceptions=True)
+        retried = await loader.load("g1")
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retried == [{"id": "g1"}]
+
+
+@pytest.mark.asyncio
+async def test_nested_scope_shares_the_request_registry_and_unscoped_calls_do_not_leak():
+    with loader_scope() as outer, loader_scope() as inner:
+        assert inner is outer
+        assert current_loaders() is outer
+    assert current_loaders() is not current_loaders()
+
+
+@pytest.mark.asyncio
+async def test_evidence_binding_sources_and_locators_are_batched_across_claims(fake_postgrest):
+    claims = [
+        {
+            "claim_id": f"claim.{index}",
+            "rule_set_id": "rs-1",
+            "claim_type": "rule_statement",
+            "target_type": "rule_node",
+            "rule_id": "rule.end",
+            "normalized_payload": {},
+            "lifecycle_status": "accepted",
+            "created_at": f"2026-01-0{index}",
+        }
+        for index in range(1, 4)
+    ]
+    bindings = [
+        {
+            "binding_id": f"binding.{index}",
+            "claim_id": f"claim.{index}",
+            "source_id": "source.rules",
+            "locator_id": "page-3",
+            "relation": "supports",
+            "created_at": "2026-01-01",
+        }
+        for index in range(1, 4)
+    ]
+    backend = fake_postgrest(
+        {
+            "rule_sets": [{"id": "rs-1", "game_id": "g1"}],
+            "claims": claims,
+            "evidence_bindings": bindings,
+            "evidence_sources": [
+                {
+                    "source_id": "source.rules",
+                    "url": "https://publisher.example/rules",
+                    "source_type": "publisher_rules",
+                }
+            ],
+            "source_locators": [
+                {"locator_id": "page-3", "source_id": "source.other", "page_number": 9},
+                {"locator_id": "page-3", "source_id": "source.rules", "page_number": 3},
+            ],
+        }
+    )
+    target = ClaimTarget(target_type="rule_node", rule_id="rule.end")
+    base = {"game_id": "g1", "slug": "example", "ruleset_id": "rs-1", "target": target}
+
+    with loader_scope():
+        response = await EvidenceService._load_trace({"id": "g1", "slug": "example"}, "rs-1", target, base)
+
+    assert [trace.claim.claim_id for trace in response.claims] == ["claim.1", "claim.2", "claim.3"]
+    assert {trace.bindings[0].locator.page_number for trace in response.claims} == {3}
+    assert len(backend.queries_for("evidence_bindings")) == 1
+    assert len(backend.queries_for("evidence_sources")) == 1
+    assert len(backend.queries_for("source_locators")) == 1
+
+
+@pytest.mark.asyncio
+async def test_large_trace_keeps_per_claim_binding_order_with_bulk_queries(fake_postgrest):
+    claim_rows = [
+        {
+            "claim_id": f"claim.{index:03d}",
+            "rule_set_id": "rs-1",
+            "claim_type": "rule_statement",
+            "target_type": "rule_node",
+            "rule_id": "rule.end",
+            "lifecycle_status": "accepted",
+        }
+        for index in range(200)
+    ]
+    bindings = [
+        {
+            "binding_id": f"binding.{index:03d}.{suffix}",
+            "claim_id": f"claim.{index:03d}",
+            "source_id": f"source.{index % 7}",
+            "relation": relation,
+            "created_at": created_at,
+        }
+        for index in range(1, 200)
+        for suffix, relation, created_at in (("b", "supports", "2026-02-01"), ("a", "contextualizes", "2026-01-01"))
+    ]
+    backend = fake_postgrest(
+        {
+            "evidence_bindings": bindings,
+            "evidence_sources": [
+                {
+                    "source_id": f"source.{index}",
+                    "url": f"https://publisher.example/{index}",
+                    "source_type": "publisher_rules",
+                }
+                for index in range(7)
+            ],
+        }
+    )
+
+    with loader_scope():
+        traces = await EvidenceService._build_traces(claim_rows)
+
+    assert traces[0].bindings == []
+    assert [detail.binding.binding_id for detail in traces[5].bindings] == ["binding.005.a", "binding.005.b"]
+    assert len(backend.queries_for("evidence_bindings")) == 2  # 200 claim ids, chunked at 150
+    assert len(backend.queries_for("evidence_sources")) == 1
+    assert backend.queries_for("source_locators") == []
+
+
+def test_missing_source_or_locator_still_fails_closed():
+    sources = {"s1": {"source_id": "s1", "url": "https://publisher.example", "source_type": "publisher_rules"}}
+    locators = {("another-source", "loc"): {"locator_id": "loc", "source_id": "another-source", "page_number": 1}}
+    row = {"binding_id": "b1", "claim_id": "c1", "source_id": "s1", "locator_id": "loc", "relation": "supports"}
+
+    with pytest.raises(ValueError, match="missing source locator loc"):
+        EvidenceService._binding_detail(row, sources, locators)
+    with pytest.raises(ValueError, match="missing evidence source s2"):
+        EvidenceService._binding_detail({**row, "source_id": "s2"}, sources, locators)
+
+
+@pytest.mark.asyncio
+async def test_component_abilities_use_two_queries_regardless_of_ability_count(fake_postgrest):
+    abilities = [
+        {"rule_set_id": "rs-1", "component_id": "card", "ability_id": f"ability.{index}", "normalized_label": "draw"}
+        for index in range(5)
+    ]
+    backend = fake_postgrest(
+        {
+            "component_abilities": abilities,
+            "component_ability_concepts": [
+                {"rule_set_id": "rs-1", "ability_id": "ability.1", "concept_id": "concept.trick"},
+                {"rule_set_id": "rs-2", "ability_id": "ability.1", "concept_id": "concept.other-ruleset"},
+            ],
+            "component_ability_rule_nodes": [{"rule_set_id": "rs-1", "ability_id": "ability.4", "rule_id": "rule.x"}],
+        }
+    )
+
+    with loader_scope():
+        loaded = await ComponentCatalogService._load_abilities(backend, "rs-1", "card")
+
+    assert [ability.concept_ids for ability in loaded][:2] == [[], ["concept.trick"]]
+    assert loaded[4].rule_ids == ["rule.x"]
+    assert len(backend.queries_for("component_ability_concepts")) == 1
+    assert len(backend.queries_for("component_ability_rule_nodes")) == 1
+
+
+@pytest.mark.asyncio
+async def test_game_concepts_round_trips_do_not_grow_with_link_count(fake_postgrest):
+    def _tables(count: int) -> dict[str, list[dict]]:
+        ids = [f"concept.{index}" for index in range(count)]
+        return {
+            "game_concepts": [
+                {"game_id": "g1", "concept_id": concept_id, "usage_role": "core", "verification_status": "verified"}
+                for concept_id in ids
+            ],
+            "concepts": [{"concept_id": concept_id, "concept_type": "mechanic"} for concept_id in ids],
+            "concept_labels": [
+                {"concept_id": concept_id, "language_code": "en", "label_type": "pref", "label": concept_id}
+                for concept_id in ids
+            ],
+            "concept_relations": [],
+            "rule_sets": [{"id": "rs-1", "game_id": "g1", "is_active": True}],
+            "rule_node_concepts": [
+                {"rule_set_id": "rs-1", "concept_id": concept_id, "rule_id": "rule.turn", "reference_kind": "mentions"}
+                for concept_id in ids
+            ],
+            "rule_nodes": [
+                {
+                    "rule_set_id": "rs-1",
+                    "rule_id": "rule.turn",
+                    "node_type": "turn",
+                    "normalized_statement": "Take a turn.",
+                }
+            ],
+        }
+
+    round_trips = []
+    for count in (2, 6):
+        backend = fake_postgrest(_tables(count))
+        response = await ConceptTaxonomyService._load_game_concepts({"id": "g1"}, {"game_id": "g1", "slug": "example"})
+        assert len(response.concepts) == count
+        assert response.concepts[0].rule_references[0].rule_id == "rule.turn"
+        round_trips.append(len(backend.queries))
+
+    assert round_trips[0] == round_trips[1]
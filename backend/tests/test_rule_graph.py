@@ -6,13 +6,17 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
+from app.core.sized_cache import SizedLRUCache
 from app.models.rule_graph import (
     RuleEdge,
     RuleGraphReadResponse,
     RuleNode,
     RuleNodeType,
+    RuleRelationType,
 )
 from app.routers import games
+from app.services import rule_graph
+from app.services.rule_graph_engine import RuleGraphEngine, RuleGraphQueryError
 
 
 def _node(rule_id: str, node_type: RuleNodeType, statement: str) -> RuleNode:
@@ -114,6 +118,10 @@ class FakeRuleGraphService:
         )
         return graph.select_types(set(rule_types or []))
 
+    async def get_json_by_slug(self, slug: str, rule_types=None, rule_set_id=None):
+        graph = await self.get_by_slug(slug, rule_types=rule_types, rule_set_id=rule_set_id)
+        return graph.model_dump_json().encode("utf-8") if graph else None
+
 
 def _app(service=None):
     app = FastAPI()
@@ -183,3 +191,208 @@ def test_versioned_rule_graph_fixtures_validate_all_required_structures():
         "exception-overrides-base",
         "variant-delta",
     }.issubset(names)
+
+
+def _graph_tables(source_revision: str = "r1") -> dict[str, list[dict]]:
+    return {
+        "rule_sets": [
+            {"id": "set-1", "game_id": "game-1", "is_active": True, "version": 1, "source_revision": source_revision}
+        ],
+        "rule_nodes": [
+            {"rule_set_id": "set-1", "rule_id": "score.points", "node_type": "scoring",
+             "normalized_statement": "Score points.", "sequence": 1},
+            {"rule_set_id": "set-1", "rule_id": "end.game", "node_type": "game_end",
+             "normalized_statement": "End the game.", "sequence": 2},
+        ],
+        "rule_edges": [
+            {"rule_set_id": "set-1", "from_rule_id": "score.points", "to_rule_id": "end.game",
+             "relation_type": "next", "sequence": 1}
+        ],
+    }
+
+
+@pytest.fixture
+def snapshot_service(monkeypatch):
+    async def fake_get_by_slug(slug):
+        return {"id": "game-1", "slug": slug} if slug == "example" else None
+
+    monkeypatch.setattr(rule_graph.supabase, "get_by_slug", fake_get_by_slug)
+    monkeypatch.setattr(rule_graph.supabase, "is_local", lambda: False)
+    rule_graph._rule_set_cache.clear()
+    rule_graph._snapshots.clear()
+    rule_graph._diffs.clear()
+    yield rule_graph.RuleGraphService()
+    rule_graph._rule_set_cache.clear()
+    rule_graph._snapshots.clear()
+    rule_graph._diffs.clear()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_serves_repeated_reads_without_touching_the_database(snapshot_service, fake_postgrest):
+    backend = fake_postgrest(_graph_tables())
+
+    body = await snapshot_service.get_json_by_slug("example")
+    graph = await snapshot_service.get_by_slug("example")
+    scoring = await snapshot_service.get_json_by_slug("example", rule_types=[RuleNodeType.SCORING])
+    assert await snapshot_service.get_json_by_slug("example") is body
+
+    assert json.loads(body) == graph.model_dump(mode="json")
+    assert [node["rule_id"] for node in json.loads(scoring)["nodes"]] == ["score.points"]
+    assert json.loads(scoring)["edges"] == []
+    assert len(backend.queries_for("rule_sets")) == 1
+    assert len(backend.queries_for("rule_nodes")) == 1
+    assert len(backend.queries_for("rule_edges")) == 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_recompiles_when_the_source_revision_changes(snapshot_service, fake_postgrest):
+    backend = fake_postgrest(_graph_tables("r1"))
+    first = json.loads(await snapshot_service.get_json_by_slug("example"))
+
+    backend.tables.update(_graph_tables("r2"))
+    backend.tables["rule_nodes"][0]["normalized_statement"] = "Score victory points."
+    rule_graph._rule_set_cache.clear()
+    second = json.loads(await snapshot_service.get_json_by_slug("example"))
+
+    assert first["source_revision"] == "r1"
+    assert second["source_revision"] == "r2"
+    assert second["nodes"][0]["normalized_statement"] == "Score victory points."
+    assert len(backend.queries_for("rule_nodes")) == 2
+
+
+def test_snapshot_budget_evicts_least_recently_used_graphs():
+    cache = SizedLRUCache(max_bytes=100)
+    cache.set("a", "A", 40)
+    cache.set("b", "B", 40)
+    cache.lookup("a")
+    cache.resize("a", 70)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, "A")
+    assert cache.stats()["bytes"] == 70
+
+
+def _flow_graph() -> RuleGraphReadResponse:
+    return RuleGraphReadResponse(
+        status="available",
+        game_id="game-1",
+        slug="example",
+        rule_set_id="set-1",
+        nodes=[
+            _node("phase.main", RuleNodeType.PHASE, "Main phase."),
+            RuleNode(
+                rule_id="action.draw", node_type="action", normalized_statement="Draw.", phase_rule_id="phase.main"
+            ),
+            RuleNode(rule_id="condition.duplicate", node_type="condition", normalized_statement="Duplicate.",
+                     phase_rule_id="phase.main"),
+            _node("effect.bust", RuleNodeType.EFFECT, "Bust."),
+            _node("end.round", RuleNodeType.ROUND_END, "End the round."),
+            _node("setup.deal", RuleNodeType.SETUP, "Deal."),
+        ],
+        edges=[
+            RuleEdge(from_rule_id="action.draw", to_rule_id="condition.duplicate", relation_type="next"),
+            RuleEdge(from_rule_id="condition.duplicate", to_rule_id="effect.bust", relation_type="condition_effect"),
+            RuleEdge(from_rule_id="effect.bust", to_rule_id="end.round", relation_type="results_in"),
+            RuleEdge(from_rule_id="action.draw", to_rule_id="setup.deal", relation_type="requires"),
+        ],
+    )
+
+
+def test_engine_orders_requirements_first_and_answers_reachability():
+    engine = RuleGraphEngine(_flow_graph())
+    order = [engine.rule_ids[node] for node in engine.order]
+
+    assert order.index("setup.deal") < order.index("action.draw") < order.index("condition.duplicate")
+    assert [engine.rule_ids[node] for node in engine.phase_members[engine.index["phase.main"]]] == [
+        "action.draw",
+        "condition.duplicate",
+    ]
+    assert engine.can_reach(engine.index["action.draw"], engine.index["end.round"])
+    assert not engine.can_reach(engine.index["end.round"], engine.index["action.draw"])
+    assert engine.path("end.round", "action.draw") is None
+    with pytest.raises(RuleGraphQueryError):
+        engine.path("action.draw", "missing.rule")
+
+
+def test_engine_subgraph_follows_relations_and_phase_containment():
+    engine = RuleGraphEngine(_flow_graph())
+
+    phase = engine.subgraph("phase.main", depth=1)
+    assert [node.rule_id for node in phase.nodes] == ["phase.main", "action.draw", "condition.duplicate"]
+    assert [edge.relation_type for edge in phase.edges] == ["next"]
+
+    causes = engine.subgraph("end.round", depth=2, reverse=True)
+    assert {node.rule_id for node in causes.nodes} == {"end.round", "effect.bust", "condition.duplicate"}
+
+    flow_only = engine.subgraph("action.draw", depth=5, relations=[RuleRelationType.NEXT])
+    assert [node.rule_id for node in flow_only.nodes] == ["action.draw", "condition.duplicate"]
+
+
+def test_rule_graph_path_and_subgraph_endpoints_read_the_cached_engine(snapshot_service, fake_postgrest):
+    backend = fake_postgrest(_graph_tables())
+    app = FastAPI()
+    app.include_router(games.router, prefix="/api")
+    app.dependency_overrides[games.get_rule_graph_service] = lambda: snapshot_service
+    client = TestClient(app)
+
+    path = client.get("/api/games/example/rule-graph/path", params={"from": "score.points", "to": "end.game"})
+    assert path.status_code == 200
+    assert path.json()["found"] is True
+    assert [node["rule_id"] for node in path.json()["nodes"]] == ["score.points", "end.game"]
+
+    backwards = client.get("/api/games/example/rule-graph/path", params={"from": "end.game", "to": "score.points"})
+    assert backwards.json()["found"] is False
+    assert backwards.json()["nodes"] == []
+
+    subgraph = client.get("/api/games/example/rule-graph/subgraph", params={"root": "end.game", "direction": "in"})
+    assert [node["rule_id"] for node in subgraph.json()["nodes"]] == ["score.points", "end.game"]
+
+    unknown = client.get("/api/games/example/rule-graph/subgraph", params={"root": "missing.rule"})
+    assert unknown.status_code == 404
+    assert len(backend.queries_for("rule_nodes")) == 1
+
+
+def _variant_tables() -> dict[str, list[dict]]:
+    tables = _graph_tables()
+    tables["rule_sets"].append(
+        {"id": "set-2", "game_id": "game-1", "is_active": False, "version": 2, "source_revision": "v1",
+         "base_rule_set_id": "set-1", "relation_type": "variant_of", "variant_label": "solo"}
+    )
+    tables["rule_nodes"] += [
+        {"rule_set_id": "set-2", "rule_id": "score.points", "node_type": "scoring",
+         "normalized_statement": "Score double points.", "sequence": 1},
+        {"rule_set_id": "set-2", "rule_id": "variant.solo", "node_type": "variant",
+         "normalized_statement": "Play alone.", "sequence": 2},
+    ]
+    tables["rule_edges"].append(
+        {"rule_set_id": "set-2", "from_rule_id": "variant.solo", "to_rule_id": "score.points",
+         "relation_type": "variant_of", "sequence": 1}
+    )
+    return tables
+
+
+def test_rule_graph_diff_against_the_base_rule_set_is_computed_once(snapshot_service, fake_postgrest):
+    backend = fake_postgrest(_variant_tables())
+    app = FastAPI()
+    app.include_router(games.router, prefix="/api")
+    app.dependency_overrides[games.get_rule_graph_service] = lambda: snapshot_service
+    client = TestClient(app)
+
+    response = client.get("/api/games/example/rule-graph/diff", params={"to": "set-2"})
+    assert response.status_code == 200
+    diff = response.json()
+    assert (diff["status"], diff["from_rule_set_id"], diff["to_rule_set_id"]) == ("available", "set-1", "set-2")
+    assert [node["rule_id"] for node in diff["added_nodes"]] == ["variant.solo"]
+    assert [node["rule_id"] for node in diff["removed_nodes"]] == ["end.game"]
+    assert diff["modified_nodes"][0]["rule_id"] == "score.points"
+    assert diff["modified_nodes"][0]["changed_fields"] == ["normalized_statement", "edges"]
+    assert [edge["relation_type"] for edge in diff["added_edges"]] == ["variant_of"]
+    assert [edge["relation_type"] for edge in diff["removed_edges"]] == ["next"]
+
+    again = client.get("/api/games/example/rule-graph/diff", params={"to": "set-2", "from": "set-1"})
+    assert again.json() == diff
+    assert len(backend.queries_for("rule_nodes")) == 2
+    assert rule_graph._diffs.stats()["hits"] == 1
+
+    no_base = client.get("/api/games/example/rule-graph/diff", params={"to": "set-1"})
+    assert no_base.status_code == 422
@@ -0,0 +1,171 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.rule_search_index import RuleSearchIndex
+from app.models.rule_graph import RuleNodeType, RuleSearchIntent
+from app.routers import games
+from app.services import rule_search
+
+
+def _node(rule_set_id: str, rule_id: str, node_type: str, statement: str, **extra) -> dict:
+    return {
+        "rule_set_id": rule_set_id,
+        "rule_id": rule_id,
+        "node_type": node_type,
+        "normalized_statement": statement,
+        "verification_status": "source_bound",
+        "evidence_ref": f"evidence:{rule_id}",
+        "updated_at": "2026-01-01T00:00:00Z",
+        **extra,
+    }
+
+
+def _index() -> RuleSearchIndex:
+    index = RuleSearchIndex()
+    index.replace_rule_set(
+        {"id": "set-a", "game_id": "game-a"},
+        [
+            _node("set-a", "setup.deal", "setup", "各プレイヤーにカードを5枚配る。"),
+            _node("set-a", "score.tie", "scoring", "同点の場合は残りカードの少ないプレイヤーが勝つ。"),
+            _node("set-a", "end.game", "game_end", "山札が尽きたらゲームを終了する。", verification_status="verified"),
+        ],
+    )
+    index.replace_rule_set(
+        {"id": "set-b", "game_id": "game-b"},
+        [
+            _node("set-b", "action.play", "action", "手番ではカードを1枚出す。"),
+            _node("set-b", "limit.hand", "condition", "手札の上限は7枚まで。"),
+        ],
+    )
+    return index
+
+
+def test_index_finds_japanese_statements_across_games_by_character_ngrams():
+    index = _index()
+
+    assert [document.rule_id for document in index.search("カード")] == [
+        "action.play",
+        "setup.deal",
+        "score.tie",
+    ]
+    assert [document.rule_id for document in index.search("同点 プレイヤー")] == ["score.tie"]
+    assert index.search("カード")[0].evidence_ref == "evidence:action.play"
+    assert index.search("存在しない") == []
+
+
+def test_index_filters_by_type_game_status_and_intent():
+    index = _index()
+
+    assert [d.rule_id for d in index.search("カード", node_types=["setup"])] == ["setup.deal"]
+    assert [d.rule_id for d in index.search("カード", game_ids=["game-b"])] == ["action.play"]
+    assert [d.rule_id for d in index.search(verification_statuses=["verified"])] == ["end.game"]
+    assert [d.rule_id for d in index.search(intent="tie")] == ["score.tie"]
+    assert [d.rule_id for d in index.search(intent="limit")] == ["limit.hand"]
+    assert {d.rule_id for d in index.search(intent="end")} == {"end.game"}
+
+
+def test_replacing_a_rule_set_reindexes_only_its_nodes():
+    index = _index()
+    index.replace_rule_set(
+        {"id": "set-b", "game_id": "game-b"}, [_node("set-b", "action.pass", "action", "パスする。")]
+    )
+
+    assert [d.rule_id for d in index.search("カード")] == ["setup.deal", "score.tie"]
+    assert [d.rule_id for d in index.search("パス")] == ["action.pass"]
+    index.remove_rule_set("set-a")
+    assert index.search("カード") == []
+    assert len(index) == 1
+
+
+@pytest.fixture
+def fresh_rule_search(monkeypatch):
+    monkeypatch.setattr(rule_search.supabase, "is_local", lambda: False)
+    rule_search.reset_index()
+    yield rule_search.RuleSearchService()
+    rule_search.reset_index()
+
+
+@pytest.mark.asyncio
+async def test_refresh_reindexes_changed_rule_sets_and_drops_deactivated_ones(
+    fresh_rule_search, fake_postgrest, monkeypatch
+):
+    backend = fake_postgrest(
+        {
+            "rule_sets": [
+                {"id": "set-a", "game_id": "game-a", "is_active": True, "updated_at": "2026-01-01T00:00:00Z"},
+                {"id": "set-b", "game_id": "game-b", "is_active": True, "updated_at": "2026-01-01T00:00:00Z"},
+            ],
+            "rule_nodes": [
+                _node("set-a", "setup.deal", "setup", "カードを配る。"),
+                _node("set-b", "action.play", "action", "カードを出す。"),
+            ],
+        }
+    )
+
+    first = await fresh_rule_search.search("カード")
+    assert first.status == "available"
+    assert [hit.rule_id for hit in first.results] == ["setup.deal", "action.play"]
+
+    backend.tables["rule_sets"][1].update(is_active=False, updated_at="2026-01-02T00:00:00Z")
+    backend.tables["rule_nodes"][0].update(normalized_statement="カードを7枚配る。", updated_at="2026-01-02T00:00:00Z")
+    monkeypatch.setattr(rule_search._state, "refreshed", 0.0)
+    backend.queries.clear()
+    second = await fresh_rule_search.search("7枚", node_types=[RuleNodeType.SETUP])
+
+    assert [hit.normalized_statement for hit in second.results] == ["カードを7枚配る。"]
+    assert (await fresh_rule_search.search("出す")).results == []
+    # Only the two changed rule sets were re-read, in one node query.
+    node_reads = [filters for filters in backend.queries_for("rule_nodes") if filters and filters[0][0] == "in"]
+    assert node_reads == [(("in", "rule_set_id", ["set-a"]),)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_drops_deleted_nodes_once_the_delete_touches_their_rule_set(
+    fresh_rule_search, fake_postgrest, monkeypatch
+):
+    backend = fake_postgrest(
+        {
+            "rule_sets": [
+                {"id": "set-a", "game_id": "game-a", "is_active": True, "updated_at": "2026-01-01T00:00:00Z"}
+            ],
+            "rule_nodes": [
+                _node("set-a", "setup.deal", "setup", "カードを配る。"),
+                _node("set-a", "action.play", "action", "カードを出す。"),
+            ],
+        }
+    )
+    assert len((await fresh_rule_search.search("カード")).results) == 2
+
+    # Migration 027's delete trigger stamps the rule set; the remaining node keeps its old updated_at.
+    del backend.tables["rule_nodes"][1]
+    backend.tables["rule_sets"][0]["updated_at"] = "2026-01-02T00:00:00Z"
+    monkeypatch.setattr(rule_search._state, "refreshed", 0.0)
+
+    assert [hit.rule_id for hit in (await fresh_rule_search.search("カード")).results] == ["setup.deal"]
+
+
+class FakeRuleSearchService:
+    def __init__(self):
+        self.calls = []
+
+    async def search(self, query, **filters):
+        self.calls.append((query, filters))
+        if filters.get("game_slug") == "missing":
+            return None
+        return {"status": "available", "query": query, "total": 0, "results": []}
+
+
+def test_rule_search_api_requires_a_query_or_filter_and_forwards_filters():
+    service = FakeRuleSearchService()
+    app = FastAPI()
+    app.include_router(games.router, prefix="/api")
+    app.dependency_overrides[games.get_rule_search_service] = lambda: service
+    client = TestClient(app)
+
+    assert client.get("/api/rules/search").status_code == 422
+    response = client.get("/api/rules/search", params={"intent": "tie", "game": "example"})
+    assert response.status_code == 200
+    assert service.calls[-1][1]["intent"] == RuleSearchIntent.TIE
+    assert service.calls[-1][1]["game_slug"] == "example"
+    assert client.get("/api/rules/search", params={"q": "同点", "game": "missing"}).status_code == 404
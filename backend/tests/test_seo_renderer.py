@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -129,3 +130,27 @@ async def test_known_mixed_game_records_are_noindex(
     assert rendered is not None
     assert '<meta name="robots" content="noindex, follow" />' in rendered
     assert 'content="index, follow"' not in rendered
+
+
+def test_template_is_compiled_once_and_recompiled_when_the_file_changes(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    template_dir = tmp_path / "frontend" / "dist"
+    template_dir.mkdir(parents=True)
+    index = template_dir / "index.html"
+    index.write_text('<html><head><title>v1</title></head><body><div id="root"></div></body></html>', encoding="utf-8")
+    monkeypatch.setenv("LAMBDA_TASK_ROOT", str(tmp_path))
+
+    first = seo_renderer.compiled_template()
+    assert seo_renderer.compiled_template() is first
+    rendered = first.render({"ssr_root": "<main></main>"})
+    assert rendered == "<html><head><title>v1</title></head><body><main></main></body></html>"
+
+    index.write_text("<html><head><title>v2</title></head><body></body></html>", encoding="utf-8")
+    os.utime(index, (index.stat().st_atime, index.stat().st_mtime + 5))
+    second = seo_renderer.compiled_template()
+    assert second is not first
+    assert second.render({"robots": '<meta name="robots" content="noindex, follow" />'}) == (
+        '<html><head><title>v2</title>  <meta name="robots" content="noindex, follow" />\n</head><body></body></html>'
+    )
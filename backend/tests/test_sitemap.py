@@ -3,25 +3,50 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 
 import pytest
+from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from app.services import sitemap  # noqa: E402
+from app.core import local_db, supabase
+from app.main import app
+from app.services import sitemap
 
 
-@pytest.mark.asyncio
-async def test_image_entries_are_nested_under_their_game_url(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_list_for_sitemap() -> list[dict[str, str]]:
-        return [
-            {
-                "slug": "catan",
-                "title": "カタン",
-                "updated_at": "2026-08-06T12:34:56Z",
-                "image_url": "/assets/games/catan.webp",
-            }
+@pytest.fixture(autouse=True)
+def _fresh_plan():
+    sitemap._plan_cache.clear()
+    yield
+    sitemap._plan_cache.clear()
+
+
+def _paged(rows: list[dict]):
+    """Serve ``rows`` the way ``list_for_sitemap`` pages them: by slug, after/through bounds, limit."""
+    calls = []
+
+    async def fake_list_for_sitemap(after_slug="", *, through_slug=None, limit=1000, columns=()):
+        calls.append((after_slug, through_slug))
+        ordered = sorted((row for row in rows if row.get("slug") is not None), key=lambda row: row["slug"])
+        page = [
+            row for row in ordered if row["slug"] > after_slug and (through_slug is None or row["slug"] <= through_slug)
         ]
+        return page[:limit]
 
-    monkeypatch.setattr(sitemap, "list_for_sitemap", fake_list_for_sitemap)
+    fake_list_for_sitemap.calls = calls
+    return fake_list_for_sitemap
+
+
+@pytest.mark.asyncio
+async def test_image_entries_are_nested_under_their_game_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        {
+            "slug": "catan",
+            "title": "カタン",
+            "updated_at": "2026-08-06T12:34:56Z",
+            "image_url": "/assets/games/catan.webp",
+        }
+    ]
+
+    monkeypatch.setattr(sitemap, "list_for_sitemap", _paged(rows))
     monkeypatch.setenv("NEXT_PUBLIC_BASE_URL", "https://example.test")
 
     xml_text = await sitemap.get_sitemap_xml()
@@ -47,14 +72,13 @@ async def test_image_entries_are_nested_under_their_game_url(monkeypatch: pytest
 
 @pytest.mark.asyncio
 async def test_invalid_game_slugs_are_not_emitted(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_list_for_sitemap() -> list[dict[str, str | None]]:
-        return [
-            {"slug": "valid-game", "title": "Valid", "updated_at": None, "image_url": None},
-            {"slug": None, "title": "Legacy null", "updated_at": None, "image_url": None},
-            {"slug": "  ", "title": "Legacy blank", "updated_at": None, "image_url": None},
-        ]
+    rows = [
+        {"slug": "valid-game", "title": "Valid", "updated_at": None, "image_url": None},
+        {"slug": None, "title": "Legacy null", "updated_at": None, "image_url": None},
+        {"slug": "  ", "title": "Legacy blank", "updated_at": None, "image_url": None},
+    ]
 
-    monkeypatch.setattr(sitemap, "list_for_sitemap", fake_list_for_sitemap)
+    monkeypatch.setattr(sitemap, "list_for_sitemap", _paged(rows))
     monkeypatch.setenv("NEXT_PUBLIC_BASE_URL", "https://example.test")
 
     xml_text = await sitemap.get_sitemap_xml()
@@ -66,15 +90,14 @@ async def test_invalid_game_slugs_are_not_emitted(monkeypatch: pytest.MonkeyPatc
 
 @pytest.mark.asyncio
 async def test_known_mixed_game_records_are_not_emitted(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def fake_list_for_sitemap() -> list[dict[str, str | None]]:
-        return [
-            {"slug": "game", "title": "Mixed", "updated_at": None, "image_url": None},
-            {"slug": "hack-clad", "title": "Mixed Hack Clad", "updated_at": None, "image_url": None},
-            {"slug": "hackclad", "title": "HacKClaD", "updated_at": None, "image_url": None},
-            {"slug": "raise-your-goblets", "title": "Raise Your Goblets", "updated_at": None, "image_url": None},
-        ]
-
-    monkeypatch.setattr(sitemap, "list_for_sitemap", fake_list_for_sitemap)
+    rows = [
+        {"slug": "game", "title": "Mixed", "updated_at": None, "image_url": None},
+        {"slug": "hack-clad", "title": "Mixed Hack Clad", "updated_at": None, "image_url": None},
+        {"slug": "hackclad", "title": "HacKClaD", "updated_at": None, "image_url": None},
+        {"slug": "raise-your-goblets", "title": "Raise Your Goblets", "updated_at": None, "image_url": None},
+    ]
+
+    monkeypatch.setattr(sitemap, "list_for_sitemap", _paged(rows))
     monkeypatch.setenv("NEXT_PUBLIC_BASE_URL", "https://example.test")
 
     xml_text = await sitemap.get_sitemap_xml()
@@ -83,3 +106,71 @@ async def test_known_mixed_game_records_are_not_emitted(monkeypatch: pytest.Monk
     assert "https://example.test/games/hack-clad" not in xml_text
     assert "https://example.test/games/hackclad" in xml_text
     assert "https://example.test/games/raise-your-goblets" in xml_text
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_split_into_bounded_chunks_read_by_keyset_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [
+        {"slug": f"game-{index:02d}", "updated_at": f"2026-01-{index + 1:02d}T00:00:00Z", "image_url": None}
+        for index in range(9)
+    ]
+    fake = _paged([*rows, {"slug": "game", "updated_at": "2027-01-01T00:00:00Z", "image_url": None}])
+    monkeypatch.setattr(sitemap, "list_for_sitemap", fake)
+    monkeypatch.setattr(sitemap, "SITEMAP_MAX_URLS", 5)
+    monkeypatch.setattr(sitemap, "_PAGE_SIZE", 2)
+    monkeypatch.setenv("NEXT_PUBLIC_BASE_URL", "https://example.test")
+
+    chunks = await sitemap.sitemap_chunks()
+    assert [(chunk.game_urls, chunk.max_updated_at) for chunk in chunks] == [
+        (3, "2026-01-03T00:00:00Z"),
+        (5, "2026-01-08T00:00:00Z"),
+        (1, "2026-01-09T00:00:00Z"),
+    ]
+    assert await sitemap.sitemap_chunks() is chunks
+
+    fake.calls.clear()
+    second = ET.fromstring(await sitemap.get_sitemap_xml(2))
+    locs = [url.findtext(f"{{{sitemap.NS_SITEMAP}}}loc") for url in second]
+    assert locs == [f"https://example.test/games/game-{index:02d}" for index in range(3, 8)]
+    assert all(call == (after, "game-07") for call, after in zip(fake.calls, ["game-02", "game-04", "game-06"]))
+    assert await sitemap.get_sitemap_xml(4) is None
+
+    index = ET.fromstring(sitemap.sitemap_index_xml(chunks, "https://example.test"))
+    assert [entry.findtext(f"{{{sitemap.NS_SITEMAP}}}loc") for entry in index] == [
+        f"https://example.test/sitemaps/games-{number}.xml" for number in (1, 2, 3)
+    ]
+
+
+def test_sitemap_routes_answer_revalidation_without_a_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = [{"slug": "catan", "updated_at": "2026-08-06T12:34:56Z", "image_url": None}]
+    monkeypatch.setattr(sitemap, "list_for_sitemap", _paged(rows))
+    client = TestClient(app)
+
+    index = client.get("/sitemap.xml")
+    chunk = client.get("/sitemaps/games-1.xml")
+    assert index.status_code == chunk.status_code == 200
+    assert "/sitemaps/games-1.xml" in index.text
+    assert "/games/catan" in chunk.text
+    assert chunk.headers["last-modified"] == "Thu, 06 Aug 2026 12:34:56 GMT"
+
+    revalidated = client.get("/sitemaps/games-1.xml", headers={"If-None-Match": chunk.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert client.get("/sitemap.xml", headers={"If-None-Match": index.headers["etag"]}).status_code == 304
+    assert client.get("/sitemaps/games-2.xml").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_local_sitemap_pages_are_bounded_by_slug(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(local_db, "DB_PATH", tmp_path / "games.db")
+    monkeypatch.setattr(supabase, "_client", None)
+    for slug in ["a", "b", "c", "d"]:
+        local_db.upsert_game({"id": slug, "slug": slug, "title": slug, "updated_at": "2026-01-01"})
+    try:
+        page = await supabase.list_for_sitemap("a", through_slug="c", limit=10)
+        capped = await supabase.list_for_sitemap(limit=1)
+    finally:
+        local_db.close_db()
+
+    assert [row["slug"] for row in page] == ["b", "c"]
+    assert capped == [{"slug": "a", "updated_at": "2026-01-01", "image_url": None}]
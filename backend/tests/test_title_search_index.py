@@ -0,0 +1,124 @@
+import pytest
+
+from app.core import supabase
+from app.core.search_index import TitleSearchIndex
+
+
+def _index() -> TitleSearchIndex:
+    index = TitleSearchIndex()
+    index.upsert_game({"id": "g1", "slug": "6-nimmt", "title": "6 nimmt!", "title_ja": "ニムト"})
+    index.upsert_game({"id": "g2", "slug": "nimmt-junior", "title": "Nimmt Junior"})
+    index.upsert_game({"id": "g3", "slug": "catan", "title": "Catan", "summary": "Like 6 nimmt, with trading"})
+    index.upsert_game({"id": "g4", "slug": "hanabi", "title": "Hanabi", "title_ja": "花火"})
+    return index
+
+
+def test_ranks_exact_prefix_substring_then_summary():
+    index = _index()
+
+    assert index.search("６ Nimmt") == ["g1", "g3"]
+    assert index.search("nimmt") == ["g2", "g1", "g3"]
+    assert index.search("ニム") == ["g1"]
+    assert index.search("火") == ["g4"]
+    assert index.search("zz") == []
+    assert index.search("!!!") == []
+
+
+def test_description_matches_rank_with_summary_below_titles():
+    index = _index()
+    index.upsert_game({"id": "g5", "slug": "azul", "title": "Azul", "description": "Tiles inspired by 6 Nimmt"})
+
+    assert index.search("nimmt") == ["g2", "g1", "g5", "g3"]
+    assert index.search("tiles") == ["g5"]
+    assert "description" not in index.projections()[-1]
+
+
+def test_aliases_rank_like_titles_and_survive_game_updates():
+    index = _index()
+    index.add_alias("g1", "Take 5", "take5")
+    index.add_alias("g9", "Orphan alias")
+
+    assert index.search("take 5") == ["g1"]
+    index.upsert_game({"id": "g1", "slug": "6-nimmt", "title": "6 nimmt! (2024)"})
+    assert index.search("take5") == ["g1"]
+    assert index.search("ニムト") == []
+    assert index.search("orphan") == ["g9"]
+
+
+@pytest.fixture
+def cloud_search(fake_postgrest, monkeypatch):
+    monkeypatch.setattr(supabase, "_client", object())
+    supabase.reset_title_index()
+    backend = fake_postgrest(
+        {
+            "games": [
+                {"id": "g1", "slug": "6-nimmt", "title": "6 nimmt!", "updated_at": "2026-01-01"},
+                {"id": "g2", "slug": "catan", "title": "Catan", "updated_at": "2026-01-02"},
+            ],
+            "game_title_aliases": [
+                {
+                    "id": "a1",
+                    "game_id": "g1",
+                    "title": "Take 5",
+                    "normalized_title": "take5",
+                    "created_at": "2026-01-01",
+                }
+            ],
+        }
+    )
+    yield backend
+    supabase.reset_title_index()
+
+
+@pytest.mark.asyncio
+async def test_cloud_search_ranks_from_index_and_hydrates_with_one_query(cloud_search):
+    results = await supabase.search("take 5")
+    again = await supabase.search("cat")
+
+    assert [row["slug"] for row in results] == ["6-nimmt"]
+    assert [row["slug"] for row in again] == ["catan"]
+    assert len(cloud_search.queries_for("game_title_aliases")) == 1
+    assert [filters for filters in cloud_search.queries_for("games") if filters and filters[0][0] == "in"] == [
+        (("in", "id", ["g1"]),),
+        (("in", "id", ["g2"]),),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cloud_index_refreshes_incrementally_by_watermark(cloud_search, monkeypatch):
+    await supabase.search("catan")
+    cloud_search.tables["games"].append(
+        {"id": "g3", "slug": "carcassonne", "title": "Carcassonne", "updated_at": "2026-02-01"}
+    )
+    monkeypatch.setattr(supabase, "_TITLE_INDEX_REFRESH_SECONDS", 0.0)
+
+    results = await supabase.search("carc")
+
+    assert [row["slug"] for row in results] == ["carcassonne"]
+    assert ("gte", "updated_at", "2026-01-02") in cloud_search.queries_for("games")[-2]
+
+
+@pytest.mark.asyncio
+async def test_cloud_search_returns_every_match_hydrating_in_chunks(cloud_search, monkeypatch):
+    monkeypatch.setattr(supabase, "_HYDRATE_CHUNK_SIZE", 2)
+    cloud_search.tables["games"] = [
+        {"id": f"g{index}", "slug": f"deck-{index}", "title": f"Deck {index}", "updated_at": "2026-01-01"}
+        for index in range(5)
+    ] + [
+        {
+            "id": "g9",
+            "slug": "azul",
+            "title": "Azul",
+            "description": "A deck-free tile game",
+            "updated_at": "2026-01-01",
+        }
+    ]
+
+    results = await supabase.search("deck")
+
+    assert [row["slug"] for row in results] == ["deck-0", "deck-1", "deck-2", "deck-3", "deck-4", "azul"]
+    assert [filters for filters in cloud_search.queries_for("games") if filters and filters[0][0] == "in"] == [
+        (("in", "id", ["g0", "g1"]),),
+        (("in", "id", ["g2", "g3"]),),
+        (("in", "id", ["g4", "g9"]),),
+    ]
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from app.core import local_db, supabase
+from app.core.view_counter import ViewCounter
+
+
+class _Sink:
+    def __init__(self, failures: int = 0):
+        self.batches: list[dict[str, int]] = []
+        self.failures = failures
+
+    async def __call__(self, deltas: dict[str, int]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(dict(deltas))
+
+
+@pytest.mark.asyncio
+async def test_views_are_aggregated_per_game_and_written_in_one_batch():
+    sink = _Sink()
+    counter = ViewCounter(sink)
+    for game_id in ["g1", "g2", "g1", "g1"]:
+        counter.record(game_id)
+
+    assert sink.batches == []
+    assert await counter.flush() == 4
+    assert await counter.flush() == 0
+    assert sink.batches == [{"g1": 3, "g2": 1}]
+    assert counter.stats()["flushes"] == 1
+    assert counter.stats()["pending_games"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_deltas_and_merges_views_recorded_meanwhile():
+    sink = _Sink(failures=1)
+    counter = ViewCounter(sink)
+    counter.record("g1")
+
+    assert await counter.flush() == 0
+    counter.record("g1")
+    assert await counter.flush() == 2
+    assert sink.batches == [{"g1": 2}]
+    assert counter.stats()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_bounded_by_distinct_games():
+    counter = ViewCounter(_Sink(), max_pending_games=2)
+    for game_id in ["g1", "g2", "g3", "g1"]:
+        counter.record(game_id)
+
+    stats = counter.stats()
+    assert (stats["pending_games"], stats["pending_views"], stats["dropped"]) == (2, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_periodic_task_flushes_and_stop_writes_the_remainder():
+    sink = _Sink()
+    counter = ViewCounter(sink, interval_seconds=0.01)
+    counter.start()
+    counter.record("g1")
+    await asyncio.sleep(0.05)
+    counter.record("g2")
+    await counter.stop()
+
+    assert sink.batches == [{"g1": 1}, {"g2": 1}]
+
+
+@pytest.mark.asyncio
+async def test_local_mode_applies_batched_deltas_atomically(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_db, "DB_PATH", tmp_path / "games.db")
+    monkeypatch.setattr(supabase, "_client", None)
+    local_db.upsert_game({"id": "g1", "slug": "example", "title": "Example"})
+    try:
+        await supabase.apply_view_counts({"g1": 3, "missing": 2})
+        await supabase.apply_view_counts({"g1": 1})
+
+        assert local_db.get_by_slug("example")["view_count"] == 4
+    finally:
+        local_db.close_db()
@@ -0,0 +1,646 @@
+export const GENERATED_CURATED_RULE_GUIDES = {
+  "flip-7-with-a-vengeance": {
+    "reviewed": true,
+    "ruleVersion": "the-op-ruleset-edition-1",
+    "source": {
+      "label": "The Op Games official Flip 7: With A Vengeance Rules — RULESET EDITION 1",
+      "url": "https://cdn.shopify.com/s/files/1/0611/3958/3198/files/26_FLIP_7_VENGEANCE_RULES_C.pdf?v=1770853610",
+      "ruleVersion": "the-op-ruleset-edition-1"
+    },
+    "facts": {
+      "targetScore": 200,
+      "flip7DifferentNumbers": 7,
+      "flip7Bonus": 15,
+      "playersMinimum": 3,
+      "ageMinimum": 8,
+      "cardCount": 108
+    },
+    "quick": {
+      "win": "ラウンドごとに得点を蓄積し、ラウンド終了時に1人以上が200点以上ならゲーム終了。その時点の最多得点を取る。",
+      "actions": [
+        "Hitで1枚受け取るか、Stayして自分からの追加ドローを止める。",
+        "同じ数字を2枚受け取るとBustし、通常はそのラウンド0点。",
+        "異なるNumber cardを7枚集めるとFlip 7でラウンド即終了し、通常15点ボーナス。"
+      ],
+      "turnSteps": [
+        "Dealerが左隣から時計回りに各プレイヤーへ最初の表向きカードを配る。",
+        "アクティブなプレイヤーはHitかStayを選ぶ。",
+        "Action/Modifierが公開された場合はルールに従って処理する。"
+      ],
+      "turnEndChecks": [
+        "同じ数字のNumber cardを2枚持ったらBust。",
+        "異なるNumber cardが7枚になったらFlip 7でラウンド即終了。",
+        "全員がBustまたはStayしたらラウンド終了。"
+      ],
+      "end": "ラウンド終了時に1人以上が200点以上ならゲーム終了し、その時点の合計得点が最も高いプレイヤーが勝つ。"
+    },
+    "scoring": {
+      "summary": "Number card合計→÷2→その他の減点→Flip 7なら+15点の順。通常ルールでは減点後も0未満にならない。",
+      "rules": [
+        {
+          "label": "Number cards",
+          "detail": "Number cardの値を合計する。"
+        },
+        {
+          "label": "÷2",
+          "detail": "Number card合計を半分にし、端数を切り捨てる。"
+        },
+        {
+          "label": "減点Modifier",
+          "detail": "その他のModifierを引く。通常ルールでは0点未満にならない。"
+        },
+        {
+          "label": "Flip 7",
+          "detail": "達成していれば最後に15点を加える。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "deal",
+        "kind": "step",
+        "label": "Dealerが表向きカードを配る"
+      },
+      {
+        "id": "choose",
+        "kind": "decision",
+        "label": "アクティブプレイヤーがHitかStayを選ぶ",
+        "branches": [
+          {
+            "label": "Hit",
+            "detail": "1枚受け取る"
+          },
+          {
+            "label": "Stay",
+            "detail": "自分からの追加ドローを止める"
+          }
+        ]
+      },
+      {
+        "id": "resolve",
+        "kind": "step",
+        "label": "公開カードとAction/Modifierを処理する"
+      },
+      {
+        "id": "round-end",
+        "kind": "check",
+        "label": "全員Bust/StayまたはFlip 7ならラウンド終了"
+      },
+      {
+        "id": "game-end",
+        "kind": "end",
+        "label": "ラウンド終了時に200点以上がいれば最多得点で勝者を決める"
+      }
+    ]
+  },
+  "ipso": {
+    "reviewed": true,
+    "ruleVersion": "gigamic-ipso-10-2025",
+    "source": {
+      "label": "Gigamic official Ipso rulebook",
+      "url": "https://en.gigamic.com/index.php?controller=attachment&id_attachment=668",
+      "ruleVersion": "gigamic-ipso-10-2025"
+    },
+    "facts": {
+      "numberCards": 90,
+      "starCards": 6,
+      "cardsPerPlayer": 14,
+      "pyramidRows": 4,
+      "centerCards": 2,
+      "keptStarBonus": 3,
+      "mixedColorPointsPerCard": 1,
+      "singleColorPointsPerCard": 2,
+      "starSymbolPoints": 1,
+      "tournamentGames": 4
+    },
+    "quick": {
+      "win": "昇順の列から得点し、合計点を最も高くする。",
+      "actions": [
+        "中央の表向き2枚から1枚を選ぶ。",
+        "自分の裏向きカード1枚と交換する。",
+        "交換で取り除いたカードを中央へ表向きで置く。"
+      ],
+      "turnSteps": [
+        "中央の表向き2枚から1枚を選ぶ。",
+        "自分のピラミッドの裏向きカード1枚と交換する。",
+        "交換したカードを中央へ表向きで置き、次のプレイヤーへ渡す。"
+      ],
+      "turnEndChecks": [
+        "交換対象が裏向きカードであることを確認する。",
+        "追加済みの表向きカードを再交換していないことを確認する。"
+      ],
+      "end": "全員のピラミッドが表向きになったらスターカードを残すか最後の1回の改善に使い、全員の最終手番後に得点する。"
+    },
+    "scoring": {
+      "summary": "昇順の列だけが得点になり、複数色は1点/枚、単色は2点/枚。有効な列のスター印は1点ずつ、頂点のスターカードを残すと3点加算する。",
+      "rules": [
+        {
+          "label": "昇順列",
+          "detail": "昇順になっていない列は得点しない。"
+        },
+        {
+          "label": "複数色",
+          "detail": "昇順の列が複数色ならカード1枚につき1点。"
+        },
+        {
+          "label": "単色",
+          "detail": "昇順の列が同じ色だけならカード1枚につき2点。"
+        },
+        {
+          "label": "スター",
+          "detail": "有効な列のスター印1つにつき1点。頂点のスターカードを残した場合はさらに3点。"
+        },
+        {
+          "label": "同点",
+          "detail": "同点なら数字カード上のスター印が多いプレイヤーが勝つ。それも同じなら再戦する。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "choose-center",
+        "kind": "step",
+        "label": "中央の表向き2枚から1枚を選ぶ"
+      },
+      {
+        "id": "replace-facedown",
+        "kind": "step",
+        "label": "裏向きカード1枚と交換し、取り除いたカードを中央へ置く"
+      },
+      {
+        "id": "repeat",
+        "kind": "check",
+        "label": "全員のピラミッドが表向きになるまで時計回りに続ける"
+      },
+      {
+        "id": "star-choice",
+        "kind": "step",
+        "label": "スターカードを3点として残すか、捨てて最後の1回の改善を行う"
+      },
+      {
+        "id": "score",
+        "kind": "end",
+        "label": "昇順の列とスターから得点し、最高得点を決める"
+      }
+    ]
+  },
+  "minna-de-ponkotsu-paint": {
+    "reviewed": true,
+    "ruleVersion": "hobbyjapan-product-page-2018",
+    "source": {
+      "label": "ホビージャパン公式商品ページ",
+      "url": "https://hobbyjapan.games/ponkotsu_paint/",
+      "ruleVersion": "hobbyjapan-product-page-2018"
+    },
+    "facts": {
+      "playersMin": 2,
+      "playersMax": 12,
+      "playTimeMinutes": 10,
+      "minimumAge": 6,
+      "releaseYear": 2018,
+      "teamVariantMaxPlayers": 7,
+      "duetPlayers": 2
+    },
+    "quick": {
+      "win": "直線と正円だけでお題を表現し、回答者に当ててもらう。",
+      "actions": [
+        "サイコロで決めたお題を確認する。",
+        "直線と正円だけで絵を描く。",
+        "画数が少ない人から順に回答者へ見せる。"
+      ],
+      "turnSteps": [
+        "お題を直線と正円だけで描く。",
+        "全員の描画完了後、画数を比較する。",
+        "少ない画数の人から順に回答者へ見せる。"
+      ],
+      "turnEndChecks": [
+        "直線と正円以外を使っていないか確認する。"
+      ],
+      "end": "回答者がお題を推測し、少ない画数と伝わりやすさの駆け引きを楽しむ。"
+    },
+    "scoring": {
+      "summary": "現行商品ページは、少ない画数ほど先に回答者へ見せられるという順序ルールを説明している。",
+      "rules": [
+        {
+          "label": "表示順",
+          "detail": "描いた絵の画数が少ない人から順に回答者へ見せる。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "prompt",
+        "kind": "step",
+        "label": "サイコロでお題を決める"
+      },
+      {
+        "id": "draw",
+        "kind": "step",
+        "label": "直線と正円だけでお題を描く"
+      },
+      {
+        "id": "order",
+        "kind": "step",
+        "label": "画数が少ない人から順に回答者へ見せる"
+      },
+      {
+        "id": "guess",
+        "kind": "end",
+        "label": "回答者がお題を推測する"
+      }
+    ]
+  },
+  "raise-your-goblets": {
+    "reviewed": true,
+    "ruleVersion": "hobbyjapan-product-page-2016",
+    "source": {
+      "label": "ホビージャパン公式商品ページ",
+      "url": "https://hobbyjapan.games/wine_poison_and_goblets/",
+      "ruleVersion": "hobbyjapan-product-page-2016"
+    },
+    "facts": {
+      "rounds": 3,
+      "playersMin": 2,
+      "playersMax": 12,
+      "playTimeMinutes": 30,
+      "minimumAge": 8,
+      "releaseYear": 2016
+    },
+    "quick": {
+      "win": "3ラウンドの合計勝利点を最も多くする。",
+      "actions": [
+        "ゴブレットへワイン・毒・解毒薬を入れる。",
+        "ゴブレットの内容を確認する。",
+        "他プレイヤーのゴブレットと交換する。"
+      ],
+      "turnSteps": [
+        "キャラクター能力を使いながらゴブレットを操作する。",
+        "乾杯後に自分の前のゴブレットを飲む。",
+        "生存・標的殺害・ワイン量に応じて得点を処理する。"
+      ],
+      "turnEndChecks": [
+        "ラウンドの得点処理を完了したか確認する。"
+      ],
+      "end": "3ラウンド終了後、合計勝利点が最も多いプレイヤーが勝つ。"
+    },
+    "scoring": {
+      "summary": "公式商品説明では、生存、標的の殺害、飲んだゴブレット内のワイン量が最多の場合に勝利点を得る。",
+      "rules": [
+        {
+          "label": "生存",
+          "detail": "自分が生き延びた場合に勝利点を得る。"
+        },
+        {
+          "label": "標的",
+          "detail": "標的の殺害に成功した場合に勝利点を得る。"
+        },
+        {
+          "label": "ワイン量",
+          "detail": "飲んだゴブレット内のワイン量が最も多い場合に勝利点を得る。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "manipulate",
+        "kind": "step",
+        "label": "ゴブレットへワイン・毒・解毒薬を入れ、確認・交換する"
+      },
+      {
+        "id": "toast",
+        "kind": "step",
+        "label": "乾杯して自分の前のゴブレットを飲む"
+      },
+      {
+        "id": "score",
+        "kind": "step",
+        "label": "生存・標的殺害・ワイン量に応じて得点する"
+      },
+      {
+        "id": "finish",
+        "kind": "end",
+        "label": "3ラウンド後に合計勝利点で勝者を決める"
+      }
+    ]
+  },
+  "skull-king": {
+    "reviewed": true,
+    "ruleVersion": "grandpa-becks-current-en-2026-08-22",
+    "source": {
+      "label": "Grandpa Beck's Games 公式ルール",
+      "url": "https://www.grandpabecksgames.com/pages/skull-king",
+      "ruleVersion": "grandpa-becks-current-en-2026-08-22"
+    },
+    "facts": {
+      "rounds": 10,
+      "actionCount": 3,
+      "suits": 4,
+      "trumpSuit": "black"
+    },
+    "quick": {
+      "win": "各ラウンドで取るトリック数をビッドし、予想どおりに取って得点する。10ラウンド終了時の合計得点を最も高くする。",
+      "actions": [
+        "数字カードがリードされたら、数字カードを出す場合は同じスートを持っていればそのスートを出す。特殊カードはいつでも出せる。",
+        "黒は切り札。Pirateは数字カードより強く、Skull KingはPirateより強い。MermaidはSkull Kingに勝つ。",
+        "Pirate・Skull King・Mermaidが同じトリックに出た場合は、順番に関係なくMermaidが勝つ。"
+      ],
+      "turnSteps": [
+        "リード役が手札から1枚出す。",
+        "時計回りに各プレイヤーが1枚ずつ出す。数字カードをフォローする場合はリードされたスートに従い、特殊カードはいつでも出せる。",
+        "全員が1枚出したら最も強いカードがトリックを取り、その勝者が次のトリックをリードする。"
+      ],
+      "turnEndChecks": [
+        "自分が取ったトリック数と、ラウンド開始時のビッドを確認する。",
+        "配られたカードをすべて使ったらラウンド終了。ビッドと獲得トリック数から得点し、ビッド成功時だけボーナスを加える。"
+      ],
+      "end": "10ラウンド終了時に合計得点が最も高いプレイヤーが勝つ。同点なら決着するまで追加ラウンドを行う。"
+    },
+    "scoring": {
+      "summary": "1以上のビッドは的中で1トリック20点、外すと差1トリックごとに-10点。0ビッドは成功で配札枚数×10点、失敗で配札枚数×-10点。ボーナスはビッド成功時だけ加算する。",
+      "rules": [
+        {
+          "label": "1以上をビッド",
+          "detail": "ビッドどおりなら取ったトリック1つにつき+20点。多すぎても少なすぎても、差1トリックにつき-10点。外した場合は取ったトリック自体の得点はない。"
+        },
+        {
+          "label": "0をビッド",
+          "detail": "0トリックなら、そのラウンドの配札枚数×10点。1トリック以上取ると、その配札枚数×-10点。"
+        },
+        {
+          "label": "14のボーナス",
+          "detail": "ビッド成功時、緑・黄・紫の14は各+10点、黒の14は+20点。"
+        },
+        {
+          "label": "キャラクターボーナス",
+          "detail": "ビッド成功時、PirateでMermaidを取ると各+20点、Skull KingでPirateを取ると各+30点、MermaidでSkull Kingを取ると+40点。"
+        }
+      ],
+      "example": {
+        "label": "公式ルールの0ビッド例",
+        "total": 70,
+        "items": [
+          "第7ラウンド",
+          "0をビッド",
+          "0トリック成功",
+          "10点 × 配札7枚 = 70点"
+        ]
+      }
+    },
+    "flow": [
+      {
+        "id": "deal",
+        "kind": "step",
+        "label": "ラウンドに応じた枚数を配る",
+        "note": "通常は1枚から10枚。8人戦の第9・第10ラウンドは8枚ずつ"
+      },
+      {
+        "id": "bid",
+        "kind": "step",
+        "label": "取ると思うトリック数をビッドする"
+      },
+      {
+        "id": "lead",
+        "kind": "step",
+        "label": "リード役がカードを1枚出す"
+      },
+      {
+        "id": "follow",
+        "kind": "condition",
+        "label": "数字カードがリードされた？",
+        "branches": [
+          {
+            "label": "はい",
+            "detail": "数字カードを出すなら、持っている限り同じスートを出す。特殊カードは出せる"
+          },
+          {
+            "label": "いいえ",
+            "detail": "特殊カードのリード規則に従う"
+          }
+        ]
+      },
+      {
+        "id": "winner",
+        "kind": "step",
+        "label": "最も強いカードがトリックを取る"
+      },
+      {
+        "id": "cards-left",
+        "kind": "condition",
+        "label": "手札が残っている？",
+        "branches": [
+          {
+            "label": "はい",
+            "detail": "トリックの勝者が次をリード"
+          },
+          {
+            "label": "いいえ",
+            "detail": "得点計算へ"
+          }
+        ]
+      },
+      {
+        "id": "score-round",
+        "kind": "step",
+        "label": "ビッドと獲得トリック数から得点する"
+      },
+      {
+        "id": "round-ten",
+        "kind": "condition",
+        "label": "10ラウンド終わった？",
+        "branches": [
+          {
+            "label": "いいえ",
+            "detail": "全カードを混ぜて次のラウンドへ"
+          },
+          {
+            "label": "はい",
+            "detail": "合計得点で勝者を決定"
+          }
+        ]
+      },
+      {
+        "id": "score",
+        "kind": "end",
+        "label": "最高得点者が勝利。同点なら追加ラウンド"
+      }
+    ]
+  },
+  "slide": {
+    "reviewed": true,
+    "ruleVersion": "gigamic-slide-01-2024",
+    "source": {
+      "label": "Gigamic official Slide rulebook",
+      "url": "https://en.gigamic.com/index.php?controller=attachment&id_attachment=548",
+      "ruleVersion": "gigamic-slide-01-2024"
+    },
+    "facts": {
+      "cardsPerPlayer": 16,
+      "gridRows": 4,
+      "gridColumns": 4,
+      "rounds": 16,
+      "tournamentEndScore": 100
+    },
+    "quick": {
+      "win": "16ラウンド後に同じ数字の隣接カードを取り除き、残った数字の合計を最も少なくする。",
+      "actions": [
+        "自分の裏向きカードを1枚選び、全員同時に中央へ公開する。",
+        "ファーストプレイヤーから時計回りに中央のカードを1枚選ぶ。",
+        "選んだカードを空きマスと同じ行または列の外側からスライドして4×4を復元する。"
+      ],
+      "turnSteps": [
+        "全員が裏向きカードを1枚選び、中央へ同時公開する。",
+        "ファーストプレイヤーから時計回りに公開カードを1枚ずつ選ぶ。",
+        "選んだカードを行または列の外側からスライドして4×4を復元する。"
+      ],
+      "turnEndChecks": [
+        "空きマスへ直接置いたり、斜めにスライドしたりしていないか確認する。",
+        "全員の配置後、ファーストプレイヤーカウンターを左隣へ渡す。"
+      ],
+      "end": "16枚すべてが表向きになったら終了。上下左右に隣接する同じ数字を取り除き、残った数字の合計を比べる。"
+    },
+    "scoring": {
+      "summary": "上下左右に隣接する同じ数字を取り除いた後、残ったカードの数字を合計する。最少得点が勝利する。",
+      "rules": [
+        {
+          "label": "基本得点",
+          "detail": "上下左右に隣接する同じ数字のカードを取り除き、残ったカードの数字を合計する。"
+        },
+        {
+          "label": "同点",
+          "detail": "同点なら残りカード枚数が少ないプレイヤーが勝つ。それも同じなら勝利を分け合う。"
+        },
+        {
+          "label": "トーナメント",
+          "detail": "累計得点が100点以上になったプレイヤーが出たら終了し、累計得点が最も少ないプレイヤーが勝つ。各ゲームの開始前にファーストプレイヤーを変更する。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "reveal",
+        "kind": "step",
+        "label": "全員が裏向きカードを1枚選び、中央へ同時公開する"
+      },
+      {
+        "id": "choose",
+        "kind": "step",
+        "label": "ファーストプレイヤーから時計回りに中央のカードを1枚ずつ選ぶ"
+      },
+      {
+        "id": "slide",
+        "kind": "step",
+        "label": "選んだカードを行または列の外側からスライドして4×4を復元する"
+      },
+      {
+        "id": "next-round",
+        "kind": "check",
+        "label": "ファーストプレイヤーカウンターを左へ渡し、16枚すべて表向きか確認する"
+      },
+      {
+        "id": "score",
+        "kind": "end",
+        "label": "隣接する同じ数字を取り除き、残った数字の合計を比べる"
+      }
+    ]
+  },
+  "terraforming-mars-the-dice-game": {
+    "reviewed": true,
+    "ruleVersion": "arclight-revised-2nd-printing-2024-05-30",
+    "source": {
+      "label": "アークライト公式 改訂版ルール説明書（第2刷）",
+      "url": "https://arclightgames.jp/wp-content/uploads/2024/04/TM_DICEGAME_RULES-JPN-fix-2023Dec-for-Web-2.pdf",
+      "ruleVersion": "arclight-revised-2nd-printing-2024-05-30"
+    },
+    "facts": {
+      "globalParameters": 3,
+      "endThreshold": 2,
+      "terraformVp": 2,
+      "productionKeepDiceMax": 3,
+      "handRefillTarget": 5,
+      "soloTurnLimit": 50,
+      "soloEndThreshold": 3
+    },
+    "quick": {
+      "win": "2〜4人ではテラフォーミングやカード、タイル、称号、褒賞でVPを集め、最終得点を最も高くする。1人ゲームでは50手番以内に3種類すべてのグローバル・パラメータを達成することを目指し、成功時に最終得点を計算する。",
+      "actions": [
+        "産出ターンでは資源ダイスを最大3個まで維持し、手札を5枚まで補充してから生産ダイスを振る。",
+        "アクションターンは補助アクション1回→メインアクション1回の順。メインアクションの代わりに2回目の補助アクションも選べる。",
+        "青色カードのフリーアクションは、自分の手番中に補助・メインアクションや産出ターンの前後で実行できる。"
+      ],
+      "turnSteps": [
+        "手番開始時に「産出ターン」か「アクションターン」のどちらかを選ぶ。",
+        "産出ターンなら、資源を最大3個維持→任意の手札を捨てる→手札を5枚まで補充→生産ダイスを振る→使用済み青色カードを戻す。",
+        "アクションターンなら、補助アクションを1回行った後、メインアクションを1回行う。"
+      ],
+      "turnEndChecks": [
+        "2〜4人では海洋面積率・気温・酸素濃度のうち、2つ目のグローバル・パラメータが達成されたか確認する。",
+        "2つ目が達成された場合、その手番の後から全員が最後の手番を1回ずつ行う。",
+        "1人ゲームでは時間マーカーを手番単位で進め、50手番以内に3種類すべてのグローバル・パラメータを達成する。"
+      ],
+      "end": "2〜4人では3つのグローバル・パラメータのうち2つが達成されたら、トリガーしたプレイヤーを含む全員が最後1回の手番を行い、その後に最終得点を計算する。1人ゲームでは50手番以内に3種類すべてを達成すれば最終得点計算へ進み、達成できなければ失敗。"
+    },
+    "scoring": {
+      "summary": "2〜4人ではテラフォーミング、褒賞、称号、カードなどのVPを加算し、最多VPが勝利する。1人ゲームでは3種類すべてのグローバル・パラメータを50手番以内に達成した場合のみ最終得点を計算する。",
+      "rules": [
+        {
+          "label": "テラフォーミング",
+          "detail": "酸素濃度または気温を1段階上昇させる、または海洋タイルを1枚配置するたびに2VPを得る。"
+        },
+        {
+          "label": "褒賞",
+          "detail": "火星ボードに設定された3種類の資源アイコンごとに、対応するカードコストのアイコンが最多のプレイヤーは5VP、2番目は3VPを得る。"
+        },
+        {
+          "label": "称号",
+          "detail": "獲得済みの称号タイルは、ゲーム終了時に1枚につき4VPを得る。"
+        },
+        {
+          "label": "カード",
+          "detail": "自分がプレイしたカード右下のVPを最終得点に加える。"
+        },
+        {
+          "label": "同点",
+          "detail": "最終VPが同点なら、生産可能な資源ダイスの合計数が最も多いプレイヤーが勝つ。それも同数なら再戦する。"
+        }
+      ]
+    },
+    "flow": [
+      {
+        "id": "choose-turn",
+        "kind": "decision",
+        "label": "産出ターンかアクションターンを選ぶ",
+        "branches": [
+          {
+            "label": "産出",
+            "detail": "資源整理→手札補充→生産ダイス→青色カードを未使用へ"
+          },
+          {
+            "label": "アクション",
+            "detail": "補助アクション1回→メインアクション1回"
+          }
+        ]
+      },
+      {
+        "id": "resolve-turn",
+        "kind": "step",
+        "label": "選んだターンの処理を完了する"
+      },
+      {
+        "id": "check-parameters",
+        "kind": "check",
+        "label": "2〜4人では3つのグローバル・パラメータのうち2つが達成されたか確認する。1人では50手番以内に3つすべてを達成する"
+      },
+      {
+        "id": "final-turns",
+        "kind": "step",
+        "label": "2〜4人では終了条件成立後、全員が最後の手番を1回ずつ行う",
+        "note": "2つ目を完成させたプレイヤーも最後の手番を行う。1人ゲームではこの最終手番処理を使用しない"
+      },
+      {
+        "id": "final-scoring",
+        "kind": "end",
+        "label": "褒賞・称号・カード等を加算して最終VPを確定する"
+      }
+    ]
+  }
+}